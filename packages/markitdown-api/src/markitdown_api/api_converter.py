@@ -1,44 +1,44 @@
-from typing import Any
+import contextlib
+from typing import Any, AsyncIterator, ContextManager, Iterator
+
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from markitdown._tracing import trace_span
 
 from markitdown_api.api_types import (
     ConvertRequest,
     ConvertResult,
     ConvertResponse,
+    MarkdownStreamingResponse,
     StreamMetadata,
 )
-from markitdown_api.commons import build_markitdown
+from markitdown_api.commons import build_markitdown, get_tracer
 from markitdown_api.storages.storager_registrar import StoragerRegistrar
 
 
-def remove_all_zw_chars(text: str) -> str:
-    zw_chars = ["\u200B", "\u200C", "\u200D", "\uFEFF"]
-    for char in zw_chars:
-        text = text.replace(char, "")
-    return text
-
-
 class ApiConverter:
     def __init__(self, request: ConvertRequest):
         self.metadata: StreamMetadata | None = None
         self.request = request
         self.markitdown = build_markitdown(request.llm)
 
-    def convert(self) -> ConvertResponse:
-        converted_result = self._internal_convert(
-            llm_prompt=self.request.get_llm_prompt(),
-            keep_data_uris=self.request.keep_data_uris,
-        )
+    async def convert(self) -> ConvertResponse:
+        with self._trace_route() as options:
+            converted_result = await self._internal_convert(**options)
 
-        result = ConvertResult(
-            title=converted_result.title,
-            markdown=remove_all_zw_chars(converted_result.markdown),
-        )
-        storage_result = None
-        if self.request.storage:
-            storage_result = StoragerRegistrar().storage(
-                self.request.storage, self.metadata, converted_result
+            result = ConvertResult(
+                title=converted_result.title,
+                markdown=converted_result.markdown,
             )
-            result = None
+            storage_result = None
+            if self.request.storage:
+                storage_result = await run_in_threadpool(
+                    StoragerRegistrar().storage,
+                    self.request.storage,
+                    self.metadata,
+                    converted_result,
+                )
+                result = None
 
         return ConvertResponse(
             metadata=self.metadata,
@@ -46,5 +46,51 @@ class ApiConverter:
             storage=storage_result,
         )
 
-    def _internal_convert(self, **kwargs: Any) -> ConvertResult:
+    async def convert_markdown(self) -> MarkdownStreamingResponse:
+        """Convert to markdown, streaming the markdown as it is converted."""
+        # The span of the route ends once the markdown has been streamed
+        route = contextlib.ExitStack()
+        with route:
+            options = route.enter_context(self._trace_route())
+            fragments = iterate_in_threadpool(self._internal_convert_iter(**options))
+            # Wait for the first fragment before responding, so that conversion
+            # errors are still reported with the appropriate status codes
+            try:
+                first = await fragments.__anext__()
+            except StopAsyncIteration:
+                first = ""
+            route = route.pop_all()
+
+        async def content() -> AsyncIterator[str]:
+            with route:
+                yield first
+                async for fragment in fragments:
+                    yield fragment
+
+        return MarkdownStreamingResponse(content())
+
+    def _convert_options(self) -> dict[str, Any]:
+        return dict(
+            llm_prompt=self.request.get_llm_prompt(),
+            keep_data_uris=self.request.keep_data_uris,
+            # Removed while the output is normalized, rather than in further passes
+            remove_zero_width_chars=True,
+        )
+
+    def _trace_route(self) -> ContextManager[dict[str, Any]]:
+        """
+        Record the conversion of the request as a span (see get_tracer), yielding
+        the conversion options, through which the span is the parent of the spans
+        of the conversion.
+        """
+        return trace_span(
+            dict(self._convert_options(), tracer=get_tracer()),
+            "markitdown_api.convert",
+            {"markitdown_api.converter": type(self).__name__},
+        )
+
+    async def _internal_convert(self, **kwargs: Any) -> ConvertResult:
+        raise NotImplementedError
+
+    def _internal_convert_iter(self, **kwargs: Any) -> Iterator[str]:
         raise NotImplementedError
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 from markitdown._llm_utils import get_llm_prompt
 
 
@@ -33,6 +33,10 @@ class MarkdownResponse(Response):
     media_type = "text/markdown"
 
 
+class MarkdownStreamingResponse(StreamingResponse):
+    media_type = "text/markdown"
+
+
 class StreamMetadata(BaseModel):
     mimetype: str | None = Field(default=None, description="Mime type of the data")
     data_size: int | None = Field(default=None, description="Size of the data in bytes")
@@ -1,8 +1,12 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from httpx import HTTPStatusError
 from requests import HTTPError
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from markitdown import InputTooLargeException
 from markitdown.__about__ import __version__ as markitdown_version
 from markitdown_api import (
     convert_uri,
@@ -11,6 +15,15 @@ from markitdown_api import (
     convert_http,
     __about__,
 )
+from markitdown_api.commons import build_markitdown
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the Magika model (shared by all MarkItDown instances) before serving requests
+    build_markitdown().warmup()
+    yield
+
 
 app = FastAPI(
     title="MarkItDown API",
@@ -22,6 +35,7 @@ app = FastAPI(
     """,
     version=markitdown_version + "-" + __about__.__version__,
     contact={"name": "Ahoo Wang", "url": "https://github.com/Ahoo-Wang/markitdown"},
+    lifespan=lifespan,
 )
 
 app.include_router(convert_uri.router)
@@ -44,6 +58,16 @@ async def http_error_handler(request: Request, exc: HTTPError):
     )
 
 
+async def http_status_error_handler(request: Request, exc: HTTPStatusError):
+    return JSONResponse(
+        status_code=exc.response.status_code, content={"detail": str(exc)}
+    )
+
+
+async def input_too_large_handler(request: Request, exc: InputTooLargeException):
+    return JSONResponse(status_code=413, content={"detail": str(exc)})
+
+
 async def type_error_handler(request: Request, exc: TypeError):
     return JSONResponse(status_code=400, content={"detail": str(exc)})
 
@@ -65,6 +89,8 @@ async def global_exception_handler(request: Request, exc: Exception):
 app.add_exception_handler(FileNotFoundError, file_not_found_handler)
 app.add_exception_handler(ValueError, value_error_handler)
 app.add_exception_handler(HTTPError, http_error_handler)
+app.add_exception_handler(HTTPStatusError, http_status_error_handler)
+app.add_exception_handler(InputTooLargeException, input_too_large_handler)
 app.add_exception_handler(TypeError, type_error_handler)
 app.add_exception_handler(KeyError, key_error_handler)
 app.add_exception_handler(IndexError, index_error_handler)
@@ -1,9 +1,10 @@
+import functools
 import os
 from typing import Optional
 
 from openai import OpenAI
 
-from markitdown import MarkItDown
+from markitdown import MarkItDown, OpenTelemetryTracer, Tracer
 from markitdown_api.api_types import LlmOptions
 
 
@@ -17,6 +18,28 @@ def blank_then_none(s: str) -> str | None:
     return s
 
 
+def get_max_input_size() -> int | None:
+    """The maximum size of the input to convert, in bytes (MAX_INPUT_SIZE), if any."""
+    max_input_size = blank_then_none(os.environ.get("MAX_INPUT_SIZE", ""))
+    return int(max_input_size) if max_input_size else None
+
+
+@functools.cache
+def get_tracer() -> Tracer | None:
+    """
+    The tracer of conversions (TRACING), if any. With TRACING=opentelemetry, the
+    route and the stages of each conversion are recorded as OpenTelemetry spans.
+    """
+    tracing = blank_then_none(os.environ.get("TRACING", ""))
+    if tracing is None:
+        return None
+    if tracing == "opentelemetry":
+        return OpenTelemetryTracer()
+    raise ValueError(
+        f"Unsupported TRACING: {tracing}. Supported tracing is: opentelemetry"
+    )
+
+
 def build_markitdown(llm_options: Optional[LlmOptions] = None) -> MarkItDown:
     base_url = api_key = llm_client = llm_model = None
     if llm_options:
@@ -35,4 +58,6 @@ def build_markitdown(llm_options: Optional[LlmOptions] = None) -> MarkItDown:
         enable_builtins=True,
         llm_client=llm_client,
         llm_model=llm_model,
+        max_input_size=get_max_input_size(),
+        tracer=get_tracer(),
     )
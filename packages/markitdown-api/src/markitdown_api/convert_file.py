@@ -1,18 +1,20 @@
 from io import BufferedReader
-from typing import Annotated, Any
+from typing import Annotated, Any, Iterator
 
 from fastapi import APIRouter, UploadFile, File, Form
 
 from markitdown import StreamInfo
+from markitdown._buffer import check_size, read_chunks, spool
 from markitdown_api.api_converter import ApiConverter
 from markitdown_api.api_types import (
     ConvertResult,
     LlmOptions,
-    MarkdownResponse,
+    MarkdownStreamingResponse,
     ConvertRequest,
     ConvertResponse,
     StreamMetadata,
 )
+from markitdown_api.commons import get_max_input_size
 from markitdown_api.convert_http import _parse_mime_type_from_content_type
 
 TAG = "Convert File"
@@ -31,22 +33,41 @@ class FileApiConverter(ApiConverter):
     def __init__(self, request: ConvertFileRequest):
         super().__init__(request)
 
-    def _internal_convert(self, **kwargs: Any) -> ConvertResult:
-        self.metadata = StreamMetadata(
-            data_size=self.request.file.size,
-            mimetype=_parse_mime_type_from_content_type(self.request.file.content_type),
-        )
-        stream_info = StreamInfo(
-            mimetype=self.metadata.mimetype, filename=self.request.file.filename
-        )
+    async def _internal_convert(self, **kwargs: Any) -> ConvertResult:
+        stream_info = self._stream_info()
+        # The upload is already buffered (to disk, if large), so it is not copied
+        # again, but the size limit still applies
+        check_size(self.request.file.size, get_max_input_size())
         with BufferedReader(self.request.file.file) as buffered_reader:
-            convert_result = self.markitdown.convert_stream(
+            convert_result = await self.markitdown.convert_stream_async(
                 buffered_reader, stream_info=stream_info, **kwargs
             )
             return ConvertResult(
                 title=convert_result.title, markdown=convert_result.markdown
             )
 
+    def _internal_convert_iter(self, **kwargs: Any) -> Iterator[str]:
+        stream_info = self._stream_info()
+        # The uploaded file is closed once the response starts, while the rest of
+        # the markdown is still being streamed, so its content is copied first
+        with spool(
+            read_chunks(self.request.file.file),
+            max_size=get_max_input_size(),
+            expected_size=self.request.file.size,
+        ) as stream:
+            yield from self.markitdown.convert_iter(
+                stream, stream_info=stream_info, **kwargs
+            )
+
+    def _stream_info(self) -> StreamInfo:
+        self.metadata = StreamMetadata(
+            data_size=self.request.file.size,
+            mimetype=_parse_mime_type_from_content_type(self.request.file.content_type),
+        )
+        return StreamInfo(
+            mimetype=self.metadata.mimetype, filename=self.request.file.filename
+        )
+
 
 @router.post(path="", response_model=ConvertResponse)
 async def convert_file(
@@ -57,7 +78,7 @@ async def convert_file(
     llm_prompt: Annotated[str, Form()] = "",
     keep_data_uris: Annotated[bool, Form()] = False,
 ):
-    return FileApiConverter(
+    return await FileApiConverter(
         ConvertFileRequest(
             file=file,
             keep_data_uris=keep_data_uris,
@@ -71,7 +92,7 @@ async def convert_file(
     ).convert()
 
 
-@router.post(path="/markdown", response_class=MarkdownResponse)
+@router.post(path="/markdown", response_class=MarkdownStreamingResponse)
 async def convert_file_markdown(
     file: Annotated[UploadFile, File()],
     openai_base_url: Annotated[str, Form()] = "",
@@ -80,19 +101,15 @@ async def convert_file_markdown(
     llm_prompt: Annotated[str, Form()] = "",
     keep_data_uris: Annotated[bool, Form()] = False,
 ):
-    return (
-        FileApiConverter(
-            ConvertFileRequest(
-                file=file,
-                keep_data_uris=keep_data_uris,
-                llm=LlmOptions(
-                    model=llm_model,
-                    open_ai_api_key=openai_api_key,
-                    open_ai_base_url=openai_base_url,
-                    prompt=llm_prompt,
-                ),
-            )
+    return await FileApiConverter(
+        ConvertFileRequest(
+            file=file,
+            keep_data_uris=keep_data_uris,
+            llm=LlmOptions(
+                model=llm_model,
+                open_ai_api_key=openai_api_key,
+                open_ai_base_url=openai_base_url,
+                prompt=llm_prompt,
+            ),
         )
-        .convert()
-        .result.markdown
-    )
+    ).convert_markdown()
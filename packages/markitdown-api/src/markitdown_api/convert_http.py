@@ -1,17 +1,18 @@
 from email.utils import parsedate_to_datetime
 from enum import Enum
-from typing import Annotated, Any
+from typing import Annotated, Any, Iterator
 
 import requests
 from fastapi import Body, APIRouter
 from pydantic import Field
 from requests.utils import CaseInsensitiveDict
+from starlette.concurrency import run_in_threadpool
 
 from markitdown_api.api_converter import ApiConverter
 from markitdown_api.api_types import (
     ConvertRequest,
     ConvertResult,
-    MarkdownResponse,
+    MarkdownStreamingResponse,
     ConvertResponse,
     StreamMetadata,
 )
@@ -65,9 +66,19 @@ class HttpApiConverter(ApiConverter):
     def __init__(self, request: ConvertHttpRequest):
         super().__init__(request)
 
-    def _internal_convert(self, **kwargs: Any) -> ConvertResult:
+    async def _internal_convert(self, **kwargs: Any) -> ConvertResult:
+        response = await run_in_threadpool(self._request)
+        result = await self.markitdown.convert_async(response, **kwargs)
+        return ConvertResult(markdown=result.markdown, title=result.title)
+
+    def _internal_convert_iter(self, **kwargs: Any) -> Iterator[str]:
+        yield from self.markitdown.convert_iter(self._request(), **kwargs)
+
+    def _request(self) -> requests.Response:
         response = requests.request(
-            self.request.method.value, self.request.url, headers=self.request.headers
+            self.request.method.value,
+            self.request.url,
+            headers=self.request.headers,
         )
         data_size = len(response.content)
         last_modified = _parse_last_modified_timestamp(response.headers)
@@ -77,8 +88,7 @@ class HttpApiConverter(ApiConverter):
         self.metadata = StreamMetadata(
             data_size=data_size, mimetype=mimetype, last_modified=last_modified
         )
-        result = self.markitdown.convert_response(response, **kwargs)
-        return ConvertResult(markdown=result.markdown, title=result.title)
+        return response
 
 
 router = APIRouter(prefix="/convert/http", tags=[TAG])
@@ -90,13 +100,13 @@ async def convert_http(
         ConvertHttpRequest, Body(examples=[{"url": "https://wow.ahoo.me/"}])
     ]
 ):
-    return HttpApiConverter(request).convert()
+    return await HttpApiConverter(request).convert()
 
 
-@router.post(path="/markdown", response_class=MarkdownResponse)
+@router.post(path="/markdown", response_class=MarkdownStreamingResponse)
 async def convert_uri_markdown(
     request: Annotated[
         ConvertHttpRequest, Body(examples=[{"url": "https://wow.ahoo.me/"}])
     ]
 ):
-    return HttpApiConverter(request).convert().result.markdown
+    return await HttpApiConverter(request).convert_markdown()
@@ -27,7 +27,7 @@ class TextApiConverter(ApiConverter):
     def __init__(self, request: ConvertTextRequest):
         super().__init__(request)
 
-    def _internal_convert(self, **kwargs: Any) -> ConvertResult:
+    async def _internal_convert(self, **kwargs: Any) -> ConvertResult:
         text_binary = self.request.text.encode("utf-8")
         self.metadata = StreamMetadata(
             mimetype=self.request.mimetype,
@@ -36,7 +36,7 @@ class TextApiConverter(ApiConverter):
         binary_io = BytesIO(text_binary)
 
         stream_info = StreamInfo(mimetype=self.request.mimetype)
-        result = self.markitdown.convert_stream(
+        result = await self.markitdown.convert_stream_async(
             stream=binary_io, stream_info=stream_info, **kwargs
         )
 
@@ -51,4 +51,4 @@ router = APIRouter(
 
 @router.post(path="", response_model=ConvertResponse)
 async def convert_text(request: ConvertTextRequest):
-    return TextApiConverter(request).convert()
+    return await TextApiConverter(request).convert()
@@ -1,4 +1,4 @@
-from typing import Annotated, Any
+from typing import Annotated, Any, Iterator
 
 from fastapi import Query, Body, APIRouter
 from pydantic import Field
@@ -7,7 +7,7 @@ from markitdown_api.api_converter import ApiConverter
 from markitdown_api.api_types import (
     ConvertRequest,
     ConvertResult,
-    MarkdownResponse,
+    MarkdownStreamingResponse,
     ConvertResponse,
 )
 
@@ -31,10 +31,13 @@ class UriApiConverter(ApiConverter):
     def __init__(self, request: ConvertUriRequest):
         super().__init__(request)
 
-    def _internal_convert(self, **kwargs: Any) -> ConvertResult:
-        result = self.markitdown.convert_uri(self.request.uri, **kwargs)
+    async def _internal_convert(self, **kwargs: Any) -> ConvertResult:
+        result = await self.markitdown.convert_uri_async(self.request.uri, **kwargs)
         return ConvertResult(title=result.title, markdown=result.markdown)
 
+    def _internal_convert_iter(self, **kwargs: Any) -> Iterator[str]:
+        return self.markitdown.convert_iter(self.request.uri, **kwargs)
+
 
 router = APIRouter(prefix="/convert/uri", tags=[TAG])
 
@@ -45,7 +48,7 @@ async def convert_uri(
         ConvertUriRequest, Body(examples=[{"uri": "https://wow.ahoo.me/"}])
     ]
 ):
-    return UriApiConverter(request).convert()
+    return await UriApiConverter(request).convert()
 
 
 @router.get(path="", response_model=ConvertResponse)
@@ -55,9 +58,9 @@ async def convert_uri(uri: Annotated[str, URI_QUERY]):
     Supported schemes include 'http://', 'https://', 'file://', and custom protocols understood by MarkItDown.
     Example: https://example.com/document.docx
     """
-    return UriApiConverter(ConvertUriRequest(uri=uri)).convert()
+    return await UriApiConverter(ConvertUriRequest(uri=uri)).convert()
 
 
-@router.get(path="/markdown", response_class=MarkdownResponse)
+@router.get(path="/markdown", response_class=MarkdownStreamingResponse)
 async def convert_uri_markdown(uri: Annotated[str, URI_QUERY]):
-    return UriApiConverter(ConvertUriRequest(uri=uri)).convert().result.markdown
+    return await UriApiConverter(ConvertUriRequest(uri=uri)).convert_markdown()
@@ -20,7 +20,8 @@ mcp = FastMCP("markitdown")
 @mcp.tool()
 async def convert_to_markdown(uri: str) -> str:
     """Convert a resource described by an http:, https:, file: or data: URI to markdown"""
-    return MarkItDown(enable_plugins=check_plugins_enabled()).convert_uri(uri).markdown
+    markitdown = MarkItDown(enable_plugins=check_plugins_enabled())
+    return (await markitdown.convert_uri_async(uri)).markdown
 
 
 def check_plugins_enabled() -> bool:
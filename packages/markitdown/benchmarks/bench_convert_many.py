@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: throughput of MarkItDown.convert_many() as a function of the number of workers.
+
+Each run converts the tests/test_files corpus (repeated --repeat times, to give the
+workers enough to do), and reports the wall-clock time, the throughput, and the
+speedup relative to a plain loop over MarkItDown.convert() in this process. Files
+that fail to convert (e.g., because an optional dependency is missing) are counted,
+but do not stop the run.
+
+Usage:
+    python benchmarks/bench_convert_many.py [--repeat 10] [--executor process|thread]
+"""
+import argparse
+import os
+import time
+from typing import List
+
+from markitdown import MarkItDown
+
+WORKER_COUNTS = [1, 2, 4, 8]
+
+TEST_FILES_DIR = os.path.join(
+    os.path.dirname(__file__), os.pardir, "tests", "test_files"
+)
+
+
+def _corpus(repeat: int) -> List[str]:
+    paths = sorted(
+        os.path.join(TEST_FILES_DIR, name) for name in os.listdir(TEST_FILES_DIR)
+    )
+    return paths * repeat
+
+
+def _time_loop(markitdown: MarkItDown, paths: List[str]) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        try:
+            markitdown.convert(path)
+        except Exception:
+            pass
+    return time.perf_counter() - start
+
+
+def _time_convert_many(
+    markitdown: MarkItDown, paths: List[str], workers: int, executor: str
+) -> tuple[float, int]:
+    start = time.perf_counter()
+    failures = 0
+    for result in markitdown.convert_many(
+        paths, workers=workers, executor=executor, ordered=False
+    ):
+        if not result.ok:
+            failures += 1
+    return time.perf_counter() - start, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--executor", choices=["process", "thread"], default="process")
+    args = parser.parse_args()
+
+    paths = _corpus(args.repeat)
+    markitdown = MarkItDown()
+    markitdown.warmup()
+
+    baseline = _time_loop(markitdown, paths)
+    print(f"{len(paths)} files, {os.cpu_count()} cpus, executor={args.executor}")
+    print(
+        f"{'workers':>7}  {'seconds':>8}  {'files/s':>8}  {'speedup':>7}  {'failed':>6}"
+    )
+    print(
+        f"{'loop':>7}  {baseline:>8.2f}  {len(paths) / baseline:>8.1f}  {1.0:>7.2f}  {'-':>6}"
+    )
+    for workers in WORKER_COUNTS:
+        seconds, failures = _time_convert_many(
+            markitdown, paths, workers, args.executor
+        )
+        print(
+            f"{workers:>7}  {seconds:>8.2f}  {len(paths) / seconds:>8.1f}  "
+            f"{baseline / seconds:>7.2f}  {failures:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: cost of dispatching a stream to a converter, as a function of the
+number of registered converters.
+
+Each run registers N dummy converters, plus one converter that actually handles the
+stream, and times MarkItDown._convert() on a tiny in-memory stream. Converters that
+declare `accepted_file_extensions` are indexed at registration time, so the dispatch
+cost should stay flat as N grows. Converters without hints are consulted for every
+stream, so they still show the (old) linear cost, for comparison.
+
+Usage:
+    python benchmarks/bench_dispatch.py [--iterations 2000]
+"""
+import argparse
+import io
+import timeit
+from typing import Any, BinaryIO
+
+from markitdown import (
+    MarkItDown,
+    DocumentConverter,
+    DocumentConverterResult,
+    StreamInfo,
+)
+
+CONVERTER_COUNTS = [1, 10, 50, 100, 500]
+
+
+class _IndexedConverter(DocumentConverter):
+    def __init__(self, extension: str):
+        self.accepted_file_extensions = [extension]
+        self._extension = extension
+
+    def accepts(
+        self, file_stream: BinaryIO, stream_info: StreamInfo, **kwargs: Any
+    ) -> bool:
+        return (stream_info.extension or "").lower() == self._extension
+
+    def convert(
+        self, file_stream: BinaryIO, stream_info: StreamInfo, **kwargs: Any
+    ) -> DocumentConverterResult:
+        return DocumentConverterResult(markdown=self._extension)
+
+
+class _UnindexedConverter(_IndexedConverter):
+    def __init__(self, extension: str):
+        super().__init__(extension)
+        self.accepted_file_extensions = None
+
+
+def _build(converter_class: type, count: int) -> MarkItDown:
+    markitdown = MarkItDown(enable_builtins=False)
+    # Register the target first, so that it is tried last among equal priorities
+    markitdown.register_converter(converter_class(".target"))
+    for i in range(count):
+        markitdown.register_converter(converter_class(f".x{i}"))
+    return markitdown
+
+
+def _time_dispatch(markitdown: MarkItDown, iterations: int) -> float:
+    stream = io.BytesIO(b"hello")
+    guesses = [StreamInfo(extension=".target")]
+
+    def dispatch():
+        markitdown._convert(file_stream=stream, stream_info_guesses=guesses)
+
+    # Warm the per-(mimetype, extension) memo
+    dispatch()
+    return min(timeit.repeat(dispatch, number=iterations, repeat=5)) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'converters':>10}  {'indexed (us)':>12}  {'unindexed (us)':>14}")
+    for count in CONVERTER_COUNTS:
+        indexed = _time_dispatch(_build(_IndexedConverter, count), args.iterations)
+        unindexed = _time_dispatch(_build(_UnindexedConverter, count), args.iterations)
+        print(f"{count:>10}  {indexed * 1e6:>12.2f}  {unindexed * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of normalizing a large markdown output (50 MB by default).
+
+Compares the previous normalization (splitting on newlines, stripping each line,
+rejoining, collapsing blank lines with a regex, and, in the API, removing each kind
+of zero-width character with str.replace) with MarkdownNormalizer, which does all of
+it in a single pass, either over the whole text or over streamed chunks. Reports the
+time taken and the peak memory allocated (as measured by tracemalloc) by each.
+
+Usage:
+    python benchmarks/bench_normalize.py [--size-mb 50] [--chunk-kb 64]
+"""
+import argparse
+import random
+import re
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from markitdown._normalize import MarkdownNormalizer, normalize_markdown
+
+ZW_CHARS = ["\u200b", "\u200c", "\u200d", "\ufeff"]
+
+
+def _markdown(size: int) -> str:
+    """Markdown-like text, with trailing whitespace, runs of blank lines, and zero-width characters."""
+    rng = random.Random(0)
+    words = [
+        "lorem",
+        "ipsum",
+        "dolor",
+        "sit",
+        "amet",
+        "| cell |",
+        "**bold**",
+        "zero\u200bwidth",
+    ]
+    lines: List[str] = []
+    total = 0
+    while total < size:
+        line = " ".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+        line += " " * rng.randint(0, 3)
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)
+
+
+def _old(text: str) -> str:
+    text = "\n".join([line.rstrip() for line in re.split(r"\r?\n", text)])
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    for char in ZW_CHARS:
+        text = text.replace(char, "")
+    return text
+
+
+def _new(text: str) -> str:
+    return normalize_markdown(text, remove_zero_width_chars=True)
+
+
+def _new_streamed(text: str, chunk_size: int) -> str:
+    normalizer = MarkdownNormalizer(remove_zero_width_chars=True)
+    out = []
+    for i in range(0, len(text), chunk_size):
+        out.append(normalizer.feed(text[i : i + chunk_size]))
+    out.append(normalizer.close())
+    return "".join(out)
+
+
+def _measure(fn: Callable[[], str]) -> Tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    text = _markdown(args.size_mb * 1024 * 1024)
+    chunk_size = args.chunk_kb * 1024
+    print(f"{len(text) / 1024 / 1024:.1f} MB of markdown")
+
+    # Time without tracemalloc, which slows down allocations, then measure the peak
+    print(f"{'normalizer':>24}  {'seconds':>8}  {'MB/s':>8}  {'peak MB':>8}")
+    for name, fn in [
+        ("split/rstrip/regex", lambda: _old(text)),
+        ("single pass", lambda: _new(text)),
+        (
+            f"streamed ({args.chunk_kb} KB chunks)",
+            lambda: _new_streamed(text, chunk_size),
+        ),
+    ]:
+        start = time.perf_counter()
+        fn()
+        seconds = time.perf_counter() - start
+        _, peak = _measure(fn)
+        print(
+            f"{name:>24}  {seconds:>8.2f}  {len(text) / 1024 / 1024 / seconds:>8.1f}  "
+            f"{peak / 1024 / 1024:>8.1f}"
+        )
+
+    assert _old(text) == _new(text) == _new_streamed(text, chunk_size)
+
+
+if __name__ == "__main__":
+    main()
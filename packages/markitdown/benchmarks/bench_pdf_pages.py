@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: page-parallel PDF extraction as a function of the number of workers.
+
+Each run converts a synthetic PDF (see suite/synthetic.py; 10 pages per unit of
+--scale) with the pdf_workers option set to 2, 4, 8, ... up to the number of CPUs
+(or --max-workers, and at least 2), and reports the wall-clock time, the pages per
+second, and the speedup relative to serial extraction (pdf_workers unset). Every
+run must produce the same markdown as the serial one. Speedup is bounded by the
+number of CPUs: on a single CPU, the parallel runs only measure the overhead of the
+worker processes.
+
+Usage (from packages/markitdown):
+    python benchmarks/bench_pdf_pages.py [--scale 50] [--chunk 16] [--max-workers 8]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+from markitdown import MarkItDown
+
+sys.path.insert(0, os.path.dirname(__file__))
+from suite import synthetic  # noqa: E402
+
+
+def _worker_counts(max_workers: int) -> List[int]:
+    # (pdf_workers=1 is serial extraction)
+    max_workers = max(max_workers, 2)
+    counts = []
+    workers = 2
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    return counts + [max_workers]
+
+
+def _time_convert(
+    markitdown: MarkItDown, path: str, workers: Optional[int], chunk: int
+) -> tuple[float, str]:
+    start = time.perf_counter()
+    result = markitdown.convert(path, pdf_workers=workers, pdf_pages_per_chunk=chunk)
+    return time.perf_counter() - start, result.markdown
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=50)
+    parser.add_argument("--chunk", type=int, default=16)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    pages = 10 * args.scale
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.pdf")
+        with open(path, "wb") as fh:
+            fh.write(synthetic.pdf(args.scale))
+
+        markitdown = MarkItDown()
+        markitdown.warmup()
+
+        baseline, expected = _time_convert(markitdown, path, None, args.chunk)
+        print(f"{pages} pages, {os.cpu_count()} cpus, {args.chunk} pages per chunk")
+        print(f"{'workers':>7}  {'seconds':>8}  {'pages/s':>8}  {'speedup':>7}")
+        print(f"{'serial':>7}  {baseline:>8.2f}  {pages / baseline:>8.1f}  {1.0:>7.2f}")
+        for workers in _worker_counts(args.max_workers):
+            seconds, markdown = _time_convert(markitdown, path, workers, args.chunk)
+            assert markdown == expected, "Page-parallel output differs from serial"
+            print(
+                f"{workers:>7}  {seconds:>8.2f}  {pages / seconds:>8.1f}  "
+                f"{baseline / seconds:>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
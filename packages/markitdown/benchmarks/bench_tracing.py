@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: overhead of tracing on conversions.
+
+Times convert_stream() on a small plain text stream (described in full, so that
+Magika is not involved, and the fixed costs of a conversion dominate), and on
+tests/test_files/test.docx, with tracing disabled (the default), with the
+NoOpTracer (which MarkItDown treats as disabled), and with a tracer that records
+spans in memory. Also times a disabled trace_span() on its own, and multiplies it
+by the number of spans per conversion, to estimate the share of a conversion that
+disabled tracing accounts for.
+
+Usage:
+    python benchmarks/bench_tracing.py [--iterations 2000]
+"""
+import argparse
+import io
+import os
+import timeit
+from typing import Any, Dict, List, Optional, Tuple
+
+from markitdown import MarkItDown, NoOpTracer, StreamInfo, Tracer
+from markitdown._tracing import trace_span
+
+TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), "..", "tests", "test_files")
+
+
+def _inputs() -> List[Tuple[str, bytes, StreamInfo, int]]:
+    """The inputs, and how much slower than the first each is, roughly."""
+    with open(os.path.join(TEST_FILES_DIR, "test.docx"), "rb") as fh:
+        docx = fh.read()
+    return [
+        (
+            "tiny text",
+            b"hello\n" * 10,
+            StreamInfo(mimetype="text/plain", extension=".txt", charset="utf-8"),
+            1,
+        ),
+        ("test.docx", docx, StreamInfo(extension=".docx"), 1000),
+    ]
+
+
+class _RecordingTracer(Tracer):
+    def __init__(self) -> None:
+        self.spans: List[str] = []
+
+    def start_span(
+        self,
+        name: str,
+        parent: Any = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        self.spans.append(name)
+        return name
+
+    def end_span(
+        self,
+        span: Any,
+        *,
+        error: Optional[BaseException] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        pass
+
+
+def _time_conversion(
+    markitdown: MarkItDown, content: bytes, stream_info: StreamInfo, iterations: int
+) -> float:
+    stream = io.BytesIO(content)
+
+    def convert():
+        stream.seek(0)
+        markitdown.convert_stream(stream, stream_info=stream_info)
+
+    convert()
+    return min(timeit.repeat(convert, number=iterations, repeat=5)) / iterations
+
+
+def _time_disabled_span(iterations: int) -> float:
+    kwargs: Dict[str, Any] = {"cancel_event": None}
+
+    def span():
+        with trace_span(kwargs, "markitdown.convert"):
+            pass
+
+    return min(timeit.repeat(span, number=iterations, repeat=5)) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    span_cost = _time_disabled_span(args.iterations * 10)
+    print(f"A disabled span costs {span_cost * 1e9:.0f} ns\n")
+
+    print(
+        f"{'input':>10}  {'disabled (us)':>13}  {'no-op (us)':>10}  "
+        f"{'recording (us)':>14}  {'spans':>5}  {'disabled share':>14}"
+    )
+    for name, content, stream_info, slowness in _inputs():
+        iterations = max(1, args.iterations // slowness)
+        recording = _RecordingTracer()
+        times = [
+            _time_conversion(
+                MarkItDown(tracer=tracer), content, stream_info, iterations
+            )
+            for tracer in [None, NoOpTracer(), recording]
+        ]
+
+        # Spans per conversion
+        recording.spans.clear()
+        MarkItDown(tracer=recording).convert_stream(
+            io.BytesIO(content), stream_info=stream_info
+        )
+        spans = len(recording.spans)
+
+        print(
+            f"{name:>10}  {times[0] * 1e6:>13.1f}  {times[1] * 1e6:>10.1f}  "
+            f"{times[2] * 1e6:>14.1f}  {spans:>5}  {spans * span_cost / times[0]:>14.2%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
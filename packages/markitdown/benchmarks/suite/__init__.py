@@ -0,0 +1,11 @@
+"""
+Benchmark suite: the speed and memory use of every converter, over the
+tests/test_files corpus and over scaled-up inputs, with regression gates.
+
+Each case (an input, and how to describe it to MarkItDown) is measured in a fresh
+process, so that its peak RSS is its own, after a warm-up conversion. Results are
+written as JSON, and can be compared to a baseline (the JSON of an earlier run)
+with configurable thresholds. Scaling tests (scaling.py) fit how time and memory
+grow with the size of synthetic inputs (synthetic.py), to catch superlinear
+behaviour. See __main__.py for usage.
+"""
@@ -0,0 +1,300 @@
+"""
+Run the benchmark suite, or compare results to a baseline.
+
+Run from packages/markitdown:
+
+    # Measure every case, and write the results
+    python -m benchmarks.suite run --output results.json
+
+    # Measure, and fail (exit status 1) on regressions with respect to a baseline
+    python -m benchmarks.suite run --baseline baseline.json --output results.json
+
+    # Compare results that were written earlier
+    python -m benchmarks.suite compare baseline.json results.json
+
+    # Measure how time and memory grow with the input size, and fail (exit
+    # status 1) on superlinear growth; optionally plot it (needs matplotlib)
+    python -m benchmarks.suite scaling --plot scaling.png
+
+See scaling.py for the scaling tests. A baseline is simply the results of an earlier run, on the same machine (e.g.,
+of the main branch). Latencies are compared at p50 and p95, and memory at the
+peak RSS, each with a relative threshold, above an absolute noise floor.
+"""
+import argparse
+import fnmatch
+import importlib.util
+import json
+import sys
+from typing import Any, Dict, List
+
+from .compare import Thresholds, compare
+from .corpus import SCALED_GENERATORS, Case, scaled_cases, test_files_cases
+from .measure import environment, measure, percentile
+from .scaling import measure_scaling, plot, superlinear
+
+DEFAULT_SCALES = [10, 100]
+DEFAULT_SCALING_SCALES = [4, 8, 16, 32, 64]
+
+
+def _scales(value: str) -> List[int]:
+    return [int(scale) for scale in value.split(",") if scale]
+
+
+def _add_threshold_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = Thresholds()
+    parser.add_argument(
+        "--max-latency-regression",
+        type=float,
+        default=defaults.latency,
+        help="relative increase of p50 or p95 latency that fails (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-memory-regression",
+        type=float,
+        default=defaults.memory,
+        help="relative increase of peak RSS that fails (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--min-latency-ms",
+        type=float,
+        default=defaults.min_latency * 1000,
+        help="latency increases below this are noise (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--min-memory-mb",
+        type=float,
+        default=defaults.min_memory / 1024 / 1024,
+        help="peak RSS increases below this are noise (default: %(default)s)",
+    )
+
+
+def _thresholds(args: argparse.Namespace) -> Thresholds:
+    return Thresholds(
+        latency=args.max_latency_regression,
+        memory=args.max_memory_regression,
+        min_latency=args.min_latency_ms / 1000,
+        min_memory=int(args.min_memory_mb * 1024 * 1024),
+    )
+
+
+def _cases(args: argparse.Namespace) -> List[Case]:
+    cases = test_files_cases()
+    if args.scales:
+        cases += scaled_cases(args.scales)
+    if args.cases:
+        cases = [
+            case
+            for case in cases
+            if any(fnmatch.fnmatch(case.name, pattern) for pattern in args.cases)
+        ]
+    return cases
+
+
+def _summarize_formats(results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Per format: throughput over all its cases, pooled latencies, and peak RSS."""
+    formats: Dict[str, Dict[str, Any]] = {}
+    for result in results.values():
+        if "error" in result:
+            continue
+        summary = formats.setdefault(
+            result["format"],
+            {"cases": 0, "size": 0, "time": 0.0, "latencies": [], "peak_rss": None},
+        )
+        summary["cases"] += 1
+        summary["size"] += result["size"]
+        summary["time"] += result["mean"]
+        summary["latencies"] += result["latencies"]
+        if result["peak_rss"] is not None:
+            summary["peak_rss"] = max(summary["peak_rss"] or 0, result["peak_rss"])
+
+    return {
+        format: {
+            "cases": summary["cases"],
+            "throughput": summary["size"] / summary["time"],
+            "p50": percentile(summary["latencies"], 50),
+            "p95": percentile(summary["latencies"], 95),
+            "peak_rss": summary["peak_rss"],
+        }
+        for format, summary in sorted(formats.items())
+    }
+
+
+def _print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    print(
+        f"{'case':<36}  {'KB':>9}  {'p50 ms':>9}  {'p95 ms':>9}  {'MB/s':>8}  {'RSS MB':>7}"
+    )
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:<36}  {result['size'] / 1024:>9.1f}  {result['error']}")
+            continue
+        rss = result["peak_rss"]
+        print(
+            f"{name:<36}  {result['size'] / 1024:>9.1f}  {result['p50'] * 1000:>9.2f}  "
+            f"{result['p95'] * 1000:>9.2f}  {result['throughput'] / 1024 / 1024:>8.2f}  "
+            f"{rss / 1024 / 1024 if rss is not None else float('nan'):>7.1f}"
+        )
+
+
+def _check(baseline_path: str, current: Dict[str, Any], args) -> int:
+    with open(baseline_path, "r", encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    regressions = compare(baseline, current, _thresholds(args))
+    if baseline.get("environment") != current.get("environment"):
+        print(
+            "\nNote: the baseline was measured in a different environment:",
+            json.dumps(baseline.get("environment")),
+        )
+    if not regressions:
+        print("\nNo regressions.")
+        return 0
+    print(f"\n{len(regressions)} regression(s):")
+    for regression in regressions:
+        print(f"  {regression}")
+    return 1
+
+
+def run(args: argparse.Namespace) -> int:
+    cases = _cases(args)
+    results: Dict[str, Dict[str, Any]] = {}
+    for i, case in enumerate(cases):
+        print(f"[{i + 1}/{len(cases)}] {case.name}", file=sys.stderr)
+        results[case.name] = measure(case, args.iterations, args.warmup)
+
+    current = {
+        "environment": environment(),
+        "settings": {
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "scales": args.scales,
+        },
+        "results": results,
+        "formats": _summarize_formats(results),
+    }
+    _print_results(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(current, fh, indent=2, sort_keys=True)
+
+    if args.baseline:
+        return _check(args.baseline, current, args)
+    return 0
+
+
+def scaling(args: argparse.Namespace) -> int:
+    if args.plot and importlib.util.find_spec("matplotlib") is None:
+        print("Plotting needs matplotlib (pip install matplotlib)", file=sys.stderr)
+        return 2
+    formats = args.formats or list(SCALED_GENERATORS)
+    results: Dict[str, Dict[str, Any]] = {}
+    for i, format in enumerate(formats):
+        print(f"[{i + 1}/{len(formats)}] {format}", file=sys.stderr)
+        results[format] = measure_scaling(format, args.scales, args.iterations)
+
+    print(f"{'format':<8}  {'KB':>20}  {'time exp.':>9}  {'memory exp.':>11}")
+    for format, result in results.items():
+        sizes = [point["size"] for point in result["points"]]
+        exponents = [
+            f"{value:.2f}" if value is not None else "-"
+            for value in result["exponents"].values()
+        ]
+        print(
+            f"{format:<8}  {min(sizes) / 1024:>9.1f}-{max(sizes) / 1024:<10.1f}  "
+            f"{exponents[0]:>9}  {exponents[1]:>11}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(
+                {
+                    "environment": environment(),
+                    "settings": {"iterations": args.iterations, "scales": args.scales},
+                    "results": results,
+                },
+                fh,
+                indent=2,
+                sort_keys=True,
+            )
+    if args.plot:
+        plot(results, args.plot)
+
+    problems = superlinear(results, args.max_exponent)
+    if not problems:
+        print(f"\nNo growth faster than scale ** {args.max_exponent}.")
+        return 0
+    print(f"\n{len(problems)} superlinear measure(s):")
+    for problem in problems:
+        print(f"  {problem}")
+    return 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description=__doc__.strip().splitlines()[0],
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="measure the cases")
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+    run_parser.add_argument("--baseline", help="compare the results to this JSON file")
+    run_parser.add_argument("--iterations", type=int, default=10)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument(
+        "--scales",
+        type=_scales,
+        default=DEFAULT_SCALES,
+        help="scales of the scaled-up inputs, comma-separated (empty for none)",
+    )
+    run_parser.add_argument(
+        "--cases",
+        nargs="*",
+        help="only measure the cases matching these patterns (e.g., 'scaled/*')",
+    )
+    _add_threshold_arguments(run_parser)
+
+    compare_parser = subparsers.add_parser("compare", help="compare results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    _add_threshold_arguments(compare_parser)
+
+    scaling_parser = subparsers.add_parser(
+        "scaling", help="measure how time and memory grow with the input size"
+    )
+    scaling_parser.add_argument(
+        "--formats",
+        type=lambda s: [format for format in s.split(",") if format],
+        help="only these formats, comma-separated (default: all with a generator)",
+    )
+    scaling_parser.add_argument(
+        "--scales",
+        type=_scales,
+        default=DEFAULT_SCALING_SCALES,
+        help="scales of the inputs, comma-separated (default: %(default)s)",
+    )
+    scaling_parser.add_argument("--iterations", type=int, default=3)
+    scaling_parser.add_argument(
+        "--max-exponent",
+        type=float,
+        default=1.3,
+        help="growth faster than scale ** this fails (default: %(default)s)",
+    )
+    scaling_parser.add_argument("--output", help="write the results to this JSON file")
+    scaling_parser.add_argument(
+        "--plot", help="plot the results to this image file (needs matplotlib)"
+    )
+
+    args = parser.parse_args()
+    if args.command == "run":
+        sys.exit(run(args))
+    if args.command == "scaling":
+        sys.exit(scaling(args))
+
+    with open(args.current, "r", encoding="utf-8") as fh:
+        current = json.load(fh)
+    _print_results(current["results"])
+    sys.exit(_check(args.baseline, current, args))
+
+
+if __name__ == "__main__":
+    main()
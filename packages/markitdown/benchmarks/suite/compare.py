@@ -0,0 +1,90 @@
+"""Comparing the results of the benchmark suite to a baseline."""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(kw_only=True, frozen=True)
+class Thresholds:
+    """How much worse than the baseline a case may get before it is a regression."""
+
+    latency: float = 0.25  # Relative increase of p50 and p95 latency
+    memory: float = 0.25  # Relative increase of peak RSS
+    # Absolute increases below these are considered noise
+    min_latency: float = 0.002  # Seconds
+    min_memory: int = 16 * 1024 * 1024  # Bytes
+
+
+@dataclass(kw_only=True, frozen=True)
+class Regression:
+    case: str
+    metric: str  # "p50", "p95", "peak_rss", or "error"
+    baseline: Any
+    current: Any
+
+    def __str__(self) -> str:
+        if self.metric == "error":
+            return f"{self.case}: now fails ({self.current})"
+        change = self.current / self.baseline - 1
+        return (
+            f"{self.case}: {self.metric} {_format(self.metric, self.baseline)} -> "
+            f"{_format(self.metric, self.current)} ({change:+.0%})"
+        )
+
+
+def _format(metric: str, value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if metric == "peak_rss":
+        return f"{value / 1024 / 1024:.1f} MB"
+    return f"{value * 1000:.2f} ms"
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], thresholds: Thresholds
+) -> List[Regression]:
+    """
+    The regressions of the current results with respect to the baseline (both as
+    written by the suite). Cases that are not in both are ignored, as are cases
+    that failed in the baseline.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None or "error" in base:
+            continue
+        if "error" in result:
+            regressions.append(
+                Regression(
+                    case=name, metric="error", baseline=None, current=result["error"]
+                )
+            )
+            continue
+
+        for metric in ["p50", "p95"]:
+            if (
+                result[metric] > base[metric] * (1 + thresholds.latency)
+                and result[metric] - base[metric] > thresholds.min_latency
+            ):
+                regressions.append(
+                    Regression(
+                        case=name,
+                        metric=metric,
+                        baseline=base[metric],
+                        current=result[metric],
+                    )
+                )
+
+        if result.get("peak_rss") is not None and base.get("peak_rss") is not None:
+            if (
+                result["peak_rss"] > base["peak_rss"] * (1 + thresholds.memory)
+                and result["peak_rss"] - base["peak_rss"] > thresholds.min_memory
+            ):
+                regressions.append(
+                    Regression(
+                        case=name,
+                        metric="peak_rss",
+                        baseline=base["peak_rss"],
+                        current=result["peak_rss"],
+                    )
+                )
+    return regressions
@@ -0,0 +1,140 @@
+"""The inputs of the benchmark suite."""
+import io
+import os
+import random
+import zipfile
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from . import synthetic
+
+TEST_FILES_DIR = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir, "tests", "test_files"
+)
+
+# Seed of the random content of scaled-up inputs, so that runs are comparable
+SEED = synthetic.SEED
+
+
+@dataclass(kw_only=True, frozen=True)
+class Case:
+    """An input of the suite."""
+
+    name: str  # Unique, e.g., "test_files/test.docx" or "scaled/csv-x100"
+    format: str  # The extension, without the dot (e.g., "docx")
+    content: bytes
+    extension: str  # Passed as the StreamInfo, as for a local file
+    mimetype: Optional[str] = None
+
+
+def test_files_cases() -> List[Case]:
+    """A case for each file of tests/test_files."""
+    cases = []
+    for name in sorted(os.listdir(TEST_FILES_DIR)):
+        path = os.path.join(TEST_FILES_DIR, name)
+        if not os.path.isfile(path):
+            continue
+        extension = os.path.splitext(name)[1]
+        with open(path, "rb") as fh:
+            content = fh.read()
+        cases.append(
+            Case(
+                name=f"test_files/{name}",
+                format=extension.lstrip(".") or "bin",
+                content=content,
+                extension=extension,
+            )
+        )
+    return cases
+
+
+def _read_test_file(name: str) -> bytes:
+    with open(os.path.join(TEST_FILES_DIR, name), "rb") as fh:
+        return fh.read()
+
+
+def _scaled_csv(scale: int) -> bytes:
+    """A CSV of 100 * scale rows."""
+    rng = random.Random(SEED)
+    lines = ["id,name,quantity,price"]
+    for i in range(100 * scale):
+        name = "".join(rng.choice("abcdefghij") for _ in range(8))
+        lines.append(f"{i},{name},{rng.randint(0, 1000)},{rng.random() * 100:.2f}")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _scaled_html(scale: int) -> bytes:
+    """The body of test_blog.html, repeated scale times."""
+    html = _read_test_file("test_blog.html").decode("utf-8")
+    start = html.index("<body")
+    start = html.index(">", start) + 1
+    end = html.rindex("</body>")
+    return (html[:start] + html[start:end] * scale + html[end:]).encode("utf-8")
+
+
+def _scaled_text(scale: int) -> bytes:
+    """About 10 KB of text per unit of scale."""
+    rng = random.Random(SEED)
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing"]
+    lines = []
+    for _ in range(150 * scale):
+        lines.append(" ".join(rng.choice(words) for _ in range(rng.randint(0, 15))))
+    return "\n".join(lines).encode("utf-8")
+
+
+def _scaled_zip(scale: int) -> bytes:
+    """A zip of scale copies of test.docx and test.pptx."""
+    docx = _read_test_file("test.docx")
+    pptx = _read_test_file("test.pptx")
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as z:
+        for i in range(scale):
+            z.writestr(f"member_{i}.docx", docx)
+            z.writestr(f"member_{i}.pptx", pptx)
+    return buffer.getvalue()
+
+
+# Generators of scaled-up inputs: format -> (extension, mimetype, generator)
+SCALED_GENERATORS: Dict[str, tuple[str, Optional[str], Callable[[int], bytes]]] = {
+    "csv": (".csv", "text/csv", _scaled_csv),
+    "html": (".html", "text/html", _scaled_html),
+    "txt": (".txt", "text/plain", _scaled_text),
+    "zip": (".zip", "application/zip", _scaled_zip),
+    # Synthetic documents, for the converters of container formats
+    "docx": (
+        ".docx",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        synthetic.docx,
+    ),
+    "pptx": (
+        ".pptx",
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        synthetic.pptx,
+    ),
+    "xlsx": (
+        ".xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        synthetic.xlsx,
+    ),
+    "epub": (".epub", "application/epub+zip", synthetic.epub),
+    "ipynb": (".ipynb", "application/x-ipynb+json", synthetic.ipynb),
+    "msg": (".msg", "application/vnd.ms-outlook", synthetic.msg),
+    "rss": (".rss", "application/rss+xml", synthetic.rss),
+}
+
+
+def scaled_cases(scales: List[int]) -> List[Case]:
+    """A case for each format with a generator, at each scale."""
+    cases = []
+    for format, (extension, mimetype, generate) in SCALED_GENERATORS.items():
+        for scale in scales:
+            cases.append(
+                Case(
+                    name=f"scaled/{format}-x{scale}",
+                    format=format,
+                    content=generate(scale),
+                    extension=extension,
+                    mimetype=mimetype,
+                )
+            )
+    return cases
@@ -0,0 +1,121 @@
+"""Measuring the cases of the benchmark suite, each in a fresh process."""
+import io
+import math
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .corpus import Case
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+def percentile(values: List[float], p: float) -> float:
+    """The p-th percentile of the values (nearest-rank)."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _peak_rss() -> Optional[int]:
+    """The peak resident set size of this process, in bytes, if known."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux, and in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _measure(case: Case, iterations: int, warmup: int) -> Dict[str, Any]:
+    """Measure a case in this process (a fresh one; see measure())."""
+    from markitdown import MarkItDown, StreamInfo
+
+    markitdown = MarkItDown()
+    markitdown.warmup()
+    stream_info = StreamInfo(extension=case.extension, mimetype=case.mimetype)
+
+    def convert() -> int:
+        result = markitdown.convert_stream(
+            io.BytesIO(case.content), stream_info=stream_info
+        )
+        return len(result.markdown)
+
+    result: Dict[str, Any] = {"format": case.format, "size": len(case.content)}
+    try:
+        for _ in range(warmup):
+            convert()
+        rss_before = _peak_rss()
+
+        latencies = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            output_size = convert()
+            latencies.append(time.perf_counter() - start)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    mean = sum(latencies) / len(latencies)
+    peak_rss = _peak_rss()
+    result.update(
+        iterations=iterations,
+        output_size=output_size,
+        mean=mean,
+        p50=percentile(latencies, 50),
+        p95=percentile(latencies, 95),
+        latencies=latencies,
+        throughput=len(case.content) / mean if mean > 0 else None,
+        peak_rss=peak_rss,
+        # What the measured conversions added to the peak, over the warmed-up process
+        peak_rss_increase=(
+            peak_rss - rss_before
+            if peak_rss is not None and rss_before is not None
+            else None
+        ),
+    )
+    return result
+
+
+def measure(case: Case, iterations: int, warmup: int = 1) -> Dict[str, Any]:
+    """
+    Measure a case in a fresh (spawned) process, so that the peak RSS is that of
+    the case alone. Latencies are in seconds, throughput in bytes per second (of
+    input), and memory in bytes.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(_measure, case, iterations, warmup).result()
+
+
+def environment() -> Dict[str, Any]:
+    """What the results depend on, besides the code being measured."""
+    import markitdown
+
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "markitdown": markitdown.__version__,
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
@@ -0,0 +1,144 @@
+"""
+Scaling tests: how the conversion time and memory of each format grow with the
+size of the input, to catch superlinear behaviour (e.g., quadratic string
+concatenation, or a linear lookup per item of a container) that benchmarks of
+inputs of a fixed size miss.
+
+For each format with a generator, inputs are generated at increasing scales, and
+the growth of each measure is fitted as a power law, measure ~ scale ** exponent:
+an exponent of 1 is linear, and of 2 quadratic. The scale (the amount of content)
+is used rather than the size in bytes, which compression makes sublinear for the
+zip-based formats. The fit is over the larger half of the scales, where the fixed
+costs of a conversion no longer dominate.
+"""
+import io
+import math
+import multiprocessing
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .corpus import SCALED_GENERATORS
+
+MEASURES = ["time", "memory"]
+
+
+def _measure(format: str, scales: List[int], iterations: int) -> List[Dict[str, Any]]:
+    """Measure a format at each scale, in this process (a fresh one)."""
+    from markitdown import MarkItDown, StreamInfo
+
+    extension, mimetype, generate = SCALED_GENERATORS[format]
+    markitdown = MarkItDown()
+    markitdown.warmup()
+    stream_info = StreamInfo(extension=extension, mimetype=mimetype)
+
+    points = []
+    for scale in scales:
+        content = generate(scale)
+
+        def convert() -> None:
+            markitdown.convert_stream(io.BytesIO(content), stream_info=stream_info)
+
+        convert()  # Warm-up
+        times = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            convert()
+            times.append(time.perf_counter() - start)
+
+        # Memory is traced in a separate conversion, as tracing slows it down. The
+        # peak of the traced (Python) allocations is what the conversion needed,
+        # unlike the RSS, which the allocator does not give back.
+        tracemalloc.start()
+        try:
+            convert()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        points.append(
+            {
+                "scale": scale,
+                "size": len(content),
+                "time": min(times),  # The least noisy, for a fit
+                "memory": peak,
+            }
+        )
+    return points
+
+
+def exponent(points: List[Dict[str, Any]], measure: str) -> Optional[float]:
+    """
+    The exponent of the power law that best fits (by least squares, in log-log
+    space) the measure against the scale, over the larger half of the scales.
+    """
+    points = sorted(
+        (point for point in points if point[measure] > 0 and point["scale"] > 0),
+        key=lambda point: point["scale"],
+    )
+    points = points[-max(2, math.ceil(len(points) / 2)) :]
+    if len(points) < 2:
+        return None
+    xs = [math.log(point["scale"]) for point in points]
+    ys = [math.log(point[measure]) for point in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def measure_scaling(
+    format: str, scales: List[int], iterations: int = 3
+) -> Dict[str, Any]:
+    """
+    The measures of a format at each scale (in a fresh, spawned process), and their
+    fitted exponents. Times are in seconds, and memory in bytes.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        points = executor.submit(_measure, format, scales, iterations).result()
+    return {
+        "points": points,
+        "exponents": {measure: exponent(points, measure) for measure in MEASURES},
+    }
+
+
+def superlinear(results: Dict[str, Dict[str, Any]], max_exponent: float) -> List[str]:
+    """Descriptions of the measures that grow faster than scale ** max_exponent."""
+    return [
+        f"{format}: {measure} grows as scale ** {value:.2f}"
+        for format, result in results.items()
+        for measure, value in result["exponents"].items()
+        if value is not None and value > max_exponent
+    ]
+
+
+def plot(results: Dict[str, Dict[str, Any]], path: str) -> None:
+    """Plot time and memory against scale (log-log), a line per format."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figure, axes = plt.subplots(1, len(MEASURES), figsize=(12, 5))
+    for ax, measure in zip(axes, MEASURES):
+        for format, result in sorted(results.items()):
+            points = sorted(result["points"], key=lambda point: point["scale"])
+            value = result["exponents"][measure]
+            ax.loglog(
+                [point["scale"] for point in points],
+                [point[measure] for point in points],
+                marker="o",
+                label=f"{format} (^{value:.2f})" if value is not None else format,
+            )
+        ax.set_xlabel("scale")
+        ax.set_ylabel("seconds" if measure == "time" else "peak traced bytes")
+        ax.set_title(f"Conversion {measure}")
+        ax.grid(True, which="both", alpha=0.3)
+        ax.legend(fontsize="small")
+    figure.tight_layout()
+    figure.savefig(path)
+    plt.close(figure)
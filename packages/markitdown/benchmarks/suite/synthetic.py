@@ -0,0 +1,580 @@
+"""
+Synthetic documents of any size, one generator per built-in converter that reads
+a container format: docx (with equations, for pre_process_docx), pptx (with
+charts, tables and images), xlsx, epub, ipynb, msg, rss, and pdf. Each generator
+takes a scale, and the size of what it generates is proportional to it. The
+content is pseudo-random, from a fixed seed, so that it is the same on every run.
+"""
+import io
+import json
+import random
+import struct
+import zipfile
+from typing import Dict, List, Union
+
+SEED = 0
+
+_WORDS = [
+    "lorem",
+    "ipsum",
+    "dolor",
+    "sit",
+    "amet",
+    "consectetur",
+    "adipiscing",
+    "elit",
+    "sed",
+    "eiusmod",
+    "tempor",
+    "incididunt",
+]
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 4) -> str:
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def _zip(members: Dict[str, Union[str, bytes]]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, content in members.items():
+            z.writestr(name, content)
+    return buffer.getvalue()
+
+
+# DOCX ###########################################################################
+
+_DOCX_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>
+</Types>"""
+
+_DOCX_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+_DOCX_DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+
+_DOCX_STYLES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/></w:style>
+</w:styles>"""
+
+_DOCX_DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math">
+<w:body>{0}</w:body>
+</w:document>"""
+
+
+def _docx_run(text: str) -> str:
+    return f'<w:r><w:t xml:space="preserve">{text}</w:t></w:r>'
+
+
+def _omml_run(text: str) -> str:
+    return f"<m:r><m:t>{text}</m:t></m:r>"
+
+
+def _omml_fraction(rng: random.Random) -> str:
+    """An equation such as x^2 + (a_1 / b) = 3."""
+    return (
+        "<m:oMath>"
+        f"<m:sSup><m:e>{_omml_run('x')}</m:e><m:sup>{_omml_run(str(rng.randint(2, 9)))}</m:sup></m:sSup>"
+        f"{_omml_run('+')}"
+        "<m:f><m:fPr><m:ctrlPr/></m:fPr>"
+        f"<m:num><m:sSub><m:e>{_omml_run('a')}</m:e><m:sub>{_omml_run('1')}</m:sub></m:sSub></m:num>"
+        f"<m:den>{_omml_run('b')}</m:den>"
+        "</m:f>"
+        f"{_omml_run('=' + str(rng.randint(0, 99)))}"
+        "</m:oMath>"
+    )
+
+
+def _docx_table(rng: random.Random, rows: int, cols: int) -> str:
+    def cell(text: str) -> str:
+        return f"<w:tc><w:p>{_docx_run(text)}</w:p></w:tc>"
+
+    header = "".join(cell(f"Column {c}") for c in range(cols))
+    body = "".join(
+        "<w:tr>"
+        + "".join(cell(str(rng.randint(0, 10000))) for _ in range(cols))
+        + "</w:tr>"
+        for _ in range(rows)
+    )
+    return f"<w:tbl><w:tr>{header}</w:tr>{body}</w:tbl>"
+
+
+def docx(scale: int) -> bytes:
+    """A section per unit of scale: a heading, text, equations, and a table."""
+    rng = random.Random(SEED)
+    body: List[str] = []
+    for i in range(scale):
+        body.append(
+            '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr>'
+            f"{_docx_run(f'Section {i}')}</w:p>"
+        )
+        for _ in range(4):
+            body.append(f"<w:p>{_docx_run(_paragraph(rng))}</w:p>")
+        # An inline equation, and a block one
+        body.append(
+            f"<w:p>{_docx_run('Where ')}{_omml_fraction(rng)}{_docx_run(' holds.')}</w:p>"
+        )
+        body.append(f"<w:p><m:oMathPara>{_omml_fraction(rng)}</m:oMathPara></w:p>")
+        body.append(_docx_table(rng, rows=5, cols=4))
+    return _zip(
+        {
+            "[Content_Types].xml": _DOCX_CONTENT_TYPES,
+            "_rels/.rels": _DOCX_RELS,
+            "word/_rels/document.xml.rels": _DOCX_DOCUMENT_RELS,
+            "word/styles.xml": _DOCX_STYLES,
+            "word/document.xml": _DOCX_DOCUMENT.format("".join(body)),
+        }
+    )
+
+
+# PPTX ###########################################################################
+
+
+def _png(rng: random.Random, size: int = 32) -> bytes:
+    from PIL import Image
+
+    image = Image.frombytes("RGB", (size, size), rng.randbytes(size * size * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def pptx(scale: int) -> bytes:
+    """A slide per unit of scale, each with text, a table, a chart, and an image."""
+    from pptx import Presentation
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Inches
+
+    rng = random.Random(SEED)
+    presentation = Presentation()
+    layout = presentation.slide_layouts[5]  # Title only
+    for i in range(scale):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = f"Slide {i}"
+
+        text = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(4), Inches(1))
+        text.text_frame.text = _paragraph(rng, sentences=2)
+
+        table = slide.shapes.add_table(
+            5, 3, Inches(0.5), Inches(3), Inches(4), Inches(2)
+        ).table
+        for row in range(5):
+            for col in range(3):
+                table.cell(row, col).text = (
+                    f"Column {col}" if row == 0 else str(rng.randint(0, 10000))
+                )
+
+        chart_data = CategoryChartData()
+        chart_data.categories = ["Q1", "Q2", "Q3", "Q4"]
+        chart_data.add_series("Revenue", [rng.randint(0, 100) for _ in range(4)])
+        chart_data.add_series("Costs", [rng.randint(0, 100) for _ in range(4)])
+        chart = slide.shapes.add_chart(
+            XL_CHART_TYPE.COLUMN_CLUSTERED,
+            Inches(5),
+            Inches(1.5),
+            Inches(4.5),
+            Inches(3),
+            chart_data,
+        ).chart
+        chart.has_title = True
+        chart.chart_title.text_frame.text = f"Chart {i}"
+
+        picture = slide.shapes.add_picture(
+            io.BytesIO(_png(rng)), Inches(5), Inches(5), Inches(1), Inches(1)
+        )
+        picture.name = f"Picture {i}"
+
+    buffer = io.BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+
+# XLSX ###########################################################################
+
+
+def xlsx(scale: int) -> bytes:
+    """Two sheets of 50 rows per unit of scale."""
+    from openpyxl import Workbook
+
+    rng = random.Random(SEED)
+    workbook = Workbook(write_only=True)
+    for name in ["Orders", "Customers"]:
+        sheet = workbook.create_sheet(name)
+        sheet.append(["id", "name", "quantity", "price", "date", "note"])
+        for i in range(50 * scale):
+            sheet.append(
+                [
+                    i,
+                    " ".join(rng.choice(_WORDS) for _ in range(2)),
+                    rng.randint(0, 1000),
+                    round(rng.random() * 100, 2),
+                    f"2024-{rng.randint(1, 12):02}-{rng.randint(1, 28):02}",
+                    _sentence(rng, words=6),
+                ]
+            )
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+# EPUB ###########################################################################
+
+_EPUB_CONTAINER = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+<rootfiles><rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/></rootfiles>
+</container>"""
+
+_EPUB_OPF = """<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="id">
+<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+<dc:identifier id="id">urn:uuid:00000000-0000-0000-0000-000000000000</dc:identifier>
+<dc:title>Synthetic Book</dc:title>
+<dc:creator>MarkItDown Benchmarks</dc:creator>
+<dc:language>en</dc:language>
+</metadata>
+<manifest>{0}</manifest>
+<spine>{1}</spine>
+</package>"""
+
+_EPUB_CHAPTER = """<?xml version="1.0" encoding="UTF-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>Chapter {0}</title></head>
+<body><h1>Chapter {0}</h1>{1}</body>
+</html>"""
+
+
+def epub(scale: int) -> bytes:
+    """A book of 10 chapters per unit of scale."""
+    rng = random.Random(SEED)
+    chapters = 10 * scale
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as z:
+        # The mimetype comes first, and is stored uncompressed
+        z.writestr("mimetype", "application/epub+zip", zipfile.ZIP_STORED)
+        z.writestr("META-INF/container.xml", _EPUB_CONTAINER)
+        z.writestr(
+            "OEBPS/content.opf",
+            _EPUB_OPF.format(
+                "".join(
+                    f'<item id="c{i}" href="chapter_{i}.xhtml" media-type="application/xhtml+xml"/>'
+                    for i in range(chapters)
+                ),
+                "".join(f'<itemref idref="c{i}"/>' for i in range(chapters)),
+            ),
+        )
+        for i in range(chapters):
+            paragraphs = "".join(f"<p>{_paragraph(rng)}</p>" for _ in range(3))
+            z.writestr(f"OEBPS/chapter_{i}.xhtml", _EPUB_CHAPTER.format(i, paragraphs))
+    return buffer.getvalue()
+
+
+# IPYNB ##########################################################################
+
+
+def ipynb(scale: int) -> bytes:
+    """A notebook of 10 markdown and code cells (with outputs) per unit of scale."""
+    rng = random.Random(SEED)
+    cells: List[Dict] = [
+        {"cell_type": "markdown", "metadata": {}, "source": ["# Synthetic Notebook"]}
+    ]
+    for i in range(5 * scale):
+        cells.append(
+            {
+                "cell_type": "markdown",
+                "metadata": {},
+                "source": [f"## Step {i}\n", "\n", _paragraph(rng)],
+            }
+        )
+        cells.append(
+            {
+                "cell_type": "code",
+                "execution_count": i + 1,
+                "metadata": {},
+                "source": [
+                    f"values = [{', '.join(str(rng.randint(0, 99)) for _ in range(8))}]\n",
+                    "print(sum(values))",
+                ],
+                "outputs": [
+                    {
+                        "name": "stdout",
+                        "output_type": "stream",
+                        "text": [f"{rng.randint(0, 800)}\n"],
+                    }
+                ],
+            }
+        )
+    notebook = {
+        "cells": cells,
+        "metadata": {"kernelspec": {"name": "python3", "display_name": "Python 3"}},
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+    return json.dumps(notebook, indent=1).encode("utf-8")
+
+
+# MSG ############################################################################
+
+# Compound File Binary format (MS-CFB), version 3
+_SECTOR_SIZE = 512
+_MINI_SECTOR_SIZE = 64
+_MINI_STREAM_CUTOFF = 4096
+_FREESECT = 0xFFFFFFFF
+_ENDOFCHAIN = 0xFFFFFFFE
+_FATSECT = 0xFFFFFFFD
+_NOSTREAM = 0xFFFFFFFF
+
+
+def _pad(data: bytes, size: int, fill: bytes = b"\0") -> bytes:
+    remainder = len(data) % size
+    return data + fill * ((size - remainder) // len(fill)) if remainder else data
+
+
+def _pack_table(table: List[int]) -> bytes:
+    return _pad(
+        struct.pack(f"<{len(table)}I", *table),
+        _SECTOR_SIZE,
+        struct.pack("<I", _FREESECT),
+    )
+
+
+def _compound_file(streams: Dict[str, bytes]) -> bytes:
+    """
+    A compound file (the container of .msg files) with the given streams, by path
+    (with "/" between storages). There is no writer of these in the dependencies,
+    and olefile only reads them.
+    """
+    tree: Dict = {}
+    for path, data in streams.items():
+        *storages, name = path.split("/")
+        node = tree
+        for storage in storages:
+            node = node.setdefault(storage, {})
+        node[name] = data
+
+    # Directory entries, breadth first: [name, type, content, child, right sibling]
+    entries: List[list] = [["Root Entry", 5, tree, _NOSTREAM, _NOSTREAM]]
+    i = 0
+    while i < len(entries):
+        content = entries[i][2]
+        if isinstance(content, dict):
+            # Siblings are chained through their right siblings, in the order of
+            # the specification (shorter names first, then case-insensitively)
+            names = sorted(content, key=lambda name: (len(name), name.upper()))
+            for j, name in enumerate(names):
+                if j == 0:
+                    entries[i][3] = len(entries)
+                else:
+                    entries[-1][4] = len(entries)
+                child = content[name]
+                entries.append(
+                    [name, 1 if isinstance(child, dict) else 2, child, *[_NOSTREAM] * 2]
+                )
+        i += 1
+
+    sectors = bytearray()
+    fat: List[int] = []
+
+    def allocate(data: bytes) -> int:
+        if not data:
+            return _ENDOFCHAIN
+        data = _pad(data, _SECTOR_SIZE)
+        first = len(fat)
+        count = len(data) // _SECTOR_SIZE
+        fat.extend(range(first + 1, first + count))
+        fat.append(_ENDOFCHAIN)
+        sectors.extend(data)
+        return first
+
+    # Small streams go to the mini stream (of the root entry), the others to sectors
+    mini_stream = bytearray()
+    mini_fat: List[int] = []
+    starts: Dict[int, int] = {}
+    for id, entry in enumerate(entries):
+        data = entry[2]
+        if entry[1] != 2 or not data:
+            continue
+        if len(data) < _MINI_STREAM_CUTOFF:
+            starts[id] = len(mini_fat)
+            count = -(-len(data) // _MINI_SECTOR_SIZE)
+            mini_fat.extend(range(len(mini_fat) + 1, len(mini_fat) + count))
+            mini_fat.append(_ENDOFCHAIN)
+            mini_stream.extend(_pad(data, _MINI_SECTOR_SIZE))
+        else:
+            starts[id] = allocate(data)
+    starts[0] = allocate(bytes(mini_stream))
+    first_mini_fat = allocate(_pack_table(mini_fat)) if mini_fat else _ENDOFCHAIN
+    mini_fat_sectors = -(-len(mini_fat) * 4 // _SECTOR_SIZE)
+
+    directory = bytearray()
+    for id, (name, type, data, child, right) in enumerate(entries):
+        encoded = (name + "\0").encode("utf-16-le")
+        size = len(mini_stream) if id == 0 else (len(data) if type == 2 else 0)
+        directory += struct.pack(
+            "<64sHBBIII16sIQQIQ",
+            encoded,
+            len(encoded),
+            type,
+            1,  # Black
+            _NOSTREAM,
+            right,
+            child,
+            b"",
+            0,
+            0,
+            0,
+            starts.get(id, _ENDOFCHAIN if type != 1 else 0),
+            size,
+        )
+    unused = struct.pack(
+        "<64sHBBIII16sIQQIQ", b"", 0, 0, 0, *[_NOSTREAM] * 3, b"", 0, 0, 0, 0, 0
+    )
+    first_directory = allocate(_pad(bytes(directory), _SECTOR_SIZE, unused))
+
+    # The FAT, which also maps its own sectors
+    fat_sectors = 1
+    while (len(fat) + fat_sectors) * 4 > fat_sectors * _SECTOR_SIZE:
+        fat_sectors += 1
+    if fat_sectors > 109:
+        raise ValueError("Too large for a compound file without DIFAT sectors")
+    fat_start = len(fat)
+    fat.extend([_FATSECT] * fat_sectors)
+    sectors.extend(_pack_table(fat))
+
+    difat = list(range(fat_start, fat_start + fat_sectors))
+    difat += [_FREESECT] * (109 - len(difat))
+    header = struct.pack(
+        "<8s16sHHHHH6sIIIIIIIII109I",
+        b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",
+        b"",
+        0x003E,  # Minor version
+        0x0003,  # Major version
+        0xFFFE,  # Byte order
+        9,  # Sector shift (512 bytes)
+        6,  # Mini sector shift (64 bytes)
+        b"",
+        0,  # Directory sectors (always 0 in version 3)
+        fat_sectors,
+        first_directory,
+        0,  # Transaction signature
+        _MINI_STREAM_CUTOFF,
+        first_mini_fat,
+        mini_fat_sectors,
+        _ENDOFCHAIN,  # First DIFAT sector
+        0,  # DIFAT sectors
+        *difat,
+    )
+    return header + bytes(sectors)
+
+
+def msg(scale: int) -> bytes:
+    """An Outlook message, with a body of about 5 KB per unit of scale."""
+    rng = random.Random(SEED)
+
+    def unicode(text: str) -> bytes:
+        return text.encode("utf-16-le")
+
+    body = "\r\n\r\n".join(_paragraph(rng, sentences=3) for _ in range(20 * scale))
+    return _compound_file(
+        {
+            "__properties_version1.0": b"\0" * 32,
+            "__substg1.0_0C1F001F": unicode("sender@example.com"),
+            "__substg1.0_0E04001F": unicode("recipient@example.com"),
+            "__substg1.0_0037001F": unicode(f"Synthetic message, x{scale}"),
+            "__substg1.0_1000001F": unicode(body),
+            "__recip_version1.0_#00000000/__properties_version1.0": b"\0" * 8,
+            "__recip_version1.0_#00000000/__substg1.0_3001001F": unicode("Recipient"),
+        }
+    )
+
+
+# RSS ############################################################################
+
+
+def rss(scale: int) -> bytes:
+    """A feed of 20 items per unit of scale, with HTML descriptions."""
+    rng = random.Random(SEED)
+    items = "".join(
+        "<item>"
+        f"<title>Item {i}</title>"
+        f"<link>https://example.com/items/{i}</link>"
+        f"<pubDate>Mon, {rng.randint(1, 28):02} Jan 2024 12:00:00 GMT</pubDate>"
+        f"<description><![CDATA[<p>{_paragraph(rng, sentences=2)}</p>]]></description>"
+        "</item>"
+        for i in range(20 * scale)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>'
+        "<title>Synthetic Feed</title><link>https://example.com</link>"
+        f"<description>A synthetic feed</description>{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+# PDF ############################################################################
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def pdf(scale: int) -> bytes:
+    """A document of 10 pages per unit of scale, each of 40 lines of text."""
+    rng = random.Random(SEED)
+    pages = 10 * scale
+    # Objects: 1 catalog, 2 page tree, 3 font, then a page and its content per page
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        (
+            "<< /Type /Pages /Kids ["
+            + " ".join(f"{4 + 2 * i} 0 R" for i in range(pages))
+            + f"] /Count {pages} >>"
+        ).encode("ascii"),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i in range(pages):
+        lines = [f"Page {i + 1}"] + [_sentence(rng, words=8) for _ in range(40)]
+        content = (
+            "BT /F1 10 Tf 14 TL 50 780 Td "
+            + " ".join(f"({_pdf_escape(line)}) '" for line in lines)
+            + " ET"
+        ).encode("ascii")
+        objects.append(
+            (
+                "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>"
+            ).encode("ascii")
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content)
+        )
+
+    buffer = io.BytesIO()
+    buffer.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(buffer.tell())
+        buffer.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = buffer.tell()
+    buffer.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        buffer.write(b"%010d 00000 n \n" % offset)
+    buffer.write(
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, xref)
+    )
+    return buffer.getvalue()
@@ -2,33 +2,117 @@
 #
 # SPDX-License-Identifier: MIT
 
+import importlib
+from typing import Any, TYPE_CHECKING
+
 from .__about__ import __version__
-from ._markitdown import (
-    MarkItDown,
-    PRIORITY_SPECIFIC_FILE_FORMAT,
-    PRIORITY_GENERIC_FILE_FORMAT,
-)
-from ._base_converter import DocumentConverterResult, DocumentConverter
-from ._stream_info import StreamInfo
-from ._exceptions import (
-    MarkItDownException,
-    MissingDependencyException,
-    FailedConversionAttempt,
-    FileConversionException,
-    UnsupportedFormatException,
-)
+
+# The public API is imported on first use, so that importing the package (e.g., by
+# the command-line client of a daemon) does not import every converter.
+_EXPORTS = {
+    "MarkItDown": "._markitdown",
+    "PRIORITY_SPECIFIC_FILE_FORMAT": "._markitdown",
+    "PRIORITY_GENERIC_FILE_FORMAT": "._markitdown",
+    "DocumentConverterResult": "._base_converter",
+    "DocumentConverter": "._base_converter",
+    "BatchConversionResult": "._batch",
+    "DirectoryConversionSummary": "._directory",
+    "ConversionCache": "._cache",
+    "MemoryCache": "._cache",
+    "DiskCache": "._cache",
+    "CacheStats": "._cache",
+    "ConversionStats": "._stats",
+    "ConverterAttempt": "._stats",
+    "StageStats": "._stats",
+    "Tracer": "._tracing",
+    "NoOpTracer": "._tracing",
+    "OpenTelemetryTracer": "._tracing",
+    "StreamInfo": "._stream_info",
+    "SniffContext": "._sniff",
+    "OutputBudget": "._budget",
+    "ProbeResult": "._probe",
+    "MarkItDownException": "._exceptions",
+    "MissingDependencyException": "._exceptions",
+    "FailedConversionAttempt": "._exceptions",
+    "FileConversionException": "._exceptions",
+    "UnsupportedFormatException": "._exceptions",
+    "ConversionCancelledException": "._exceptions",
+    "InputTooLargeException": "._exceptions",
+    "ConversionTimeoutException": "._exceptions",
+    "ResourceLimitException": "._exceptions",
+}
+
+if TYPE_CHECKING:
+    from ._markitdown import (
+        MarkItDown,
+        PRIORITY_SPECIFIC_FILE_FORMAT,
+        PRIORITY_GENERIC_FILE_FORMAT,
+    )
+    from ._base_converter import DocumentConverterResult, DocumentConverter
+    from ._batch import BatchConversionResult
+    from ._directory import DirectoryConversionSummary
+    from ._cache import ConversionCache, MemoryCache, DiskCache, CacheStats
+    from ._stats import ConversionStats, ConverterAttempt, StageStats
+    from ._tracing import Tracer, NoOpTracer, OpenTelemetryTracer
+    from ._stream_info import StreamInfo
+    from ._sniff import SniffContext
+    from ._budget import OutputBudget
+    from ._probe import ProbeResult
+    from ._exceptions import (
+        MarkItDownException,
+        MissingDependencyException,
+        FailedConversionAttempt,
+        FileConversionException,
+        UnsupportedFormatException,
+        ConversionCancelledException,
+        InputTooLargeException,
+        ConversionTimeoutException,
+        ResourceLimitException,
+    )
 
 __all__ = [
     "__version__",
     "MarkItDown",
     "DocumentConverter",
     "DocumentConverterResult",
+    "BatchConversionResult",
+    "DirectoryConversionSummary",
+    "ConversionCache",
+    "MemoryCache",
+    "DiskCache",
+    "CacheStats",
+    "ConversionStats",
+    "ConverterAttempt",
+    "StageStats",
+    "Tracer",
+    "NoOpTracer",
+    "OpenTelemetryTracer",
     "MarkItDownException",
     "MissingDependencyException",
     "FailedConversionAttempt",
     "FileConversionException",
     "UnsupportedFormatException",
+    "ConversionCancelledException",
+    "InputTooLargeException",
+    "ConversionTimeoutException",
+    "ResourceLimitException",
     "StreamInfo",
+    "SniffContext",
+    "OutputBudget",
+    "ProbeResult",
     "PRIORITY_SPECIFIC_FILE_FORMAT",
     "PRIORITY_GENERIC_FILE_FORMAT",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups no longer go through __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
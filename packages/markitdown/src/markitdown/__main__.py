@@ -6,8 +6,20 @@ import sys
 import codecs
 from textwrap import dedent
 from importlib.metadata import entry_points
+from typing import Any, Dict, Iterable
 from .__about__ import __version__
-from ._markitdown import MarkItDown, StreamInfo, DocumentConverterResult
+from ._daemon import (
+    DaemonUnavailable,
+    convert_with_daemon,
+    daemon_supported,
+    default_socket_path,
+    serve,
+)
+from ._buffer import read_chunks, spool
+from ._stream_info import StreamInfo
+
+# The rest of MarkItDown is only imported to convert locally, so that forwarding a
+# conversion to a daemon (see --daemon) starts quickly
 
 
 def main():
@@ -41,6 +53,16 @@ def main():
                 OR
 
                 markitdown example.pdf > example.md
+
+                OR to keep converters warm across invocations, start a daemon,
+                which later invocations forward their conversions to
+
+                markitdown --daemon &
+                markitdown example.pdf
+
+                OR to convert a whole directory, and later only what changed in it
+
+                markitdown -r documents/ --output-dir markdown/
             """
         ).strip(),
     )
@@ -110,6 +132,47 @@ def main():
         help="Keep data URIs (like base64-encoded images) in the output. By default, data URIs are truncated.",
     )
 
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run a daemon that converts the files of later invocations, which forward their conversions to it while it runs. Plugins and Document Intelligence options apply to the daemon; invocations with other options convert by themselves.",
+    )
+
+    parser.add_argument(
+        "--socket",
+        help="Unix socket of the daemon. Defaults to $MARKITDOWN_SOCKET, or else markitdown.sock in $XDG_RUNTIME_DIR or in the temporary directory.",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes of the daemon, or of a --recursive conversion. Defaults to the number of CPUs.",
+    )
+
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Convert in this process, even if a daemon is running.",
+    )
+
+    parser.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="Convert every file of the directory FILENAME, in parallel, to the same relative paths in --output-dir, with .md appended. Files that are unchanged since an earlier run are skipped.",
+    )
+
+    parser.add_argument(
+        "--output-dir",
+        help="Output directory of a --recursive conversion.",
+    )
+
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="In a --recursive conversion, also convert the files that failed to convert in an earlier run, even if unchanged.",
+    )
+
     parser.add_argument("filename", nargs="?")
     args = parser.parse_args()
 
@@ -172,46 +235,126 @@ def main():
             )
         sys.exit(0)
 
+    if args.use_docintel and args.endpoint is None:
+        _exit_with_error(
+            "Document Intelligence Endpoint is required when using Document Intelligence."
+        )
+
+    # The arguments of the MarkItDown instance, which a daemon must also have
+    init_kwargs: Dict[str, Any] = {"enable_plugins": args.use_plugins}
     if args.use_docintel:
-        if args.endpoint is None:
+        init_kwargs["docintel_endpoint"] = args.endpoint
+
+    socket_path = args.socket or default_socket_path()
+
+    if args.daemon:
+        if not daemon_supported():
+            _exit_with_error("The daemon needs Unix sockets, which are unavailable.")
+        if socket_path is None:
+            _exit_with_error("No socket given (with --socket) for the daemon.")
+        serve(socket_path, workers=args.workers, init_kwargs=init_kwargs)
+        sys.exit(0)
+
+    if args.recursive:
+        if args.filename is None or args.output_dir is None:
             _exit_with_error(
-                "Document Intelligence Endpoint is required when using Document Intelligence."
+                "A directory and an output directory (--output-dir) are required when converting recursively."
+            )
+        _convert_directory(args, init_kwargs)
+
+    if args.use_docintel and args.filename is None:
+        _exit_with_error("Filename is required when using Document Intelligence.")
+
+    source: Any = args.filename
+    if not args.no_daemon and socket_path is not None and daemon_supported():
+        content = None
+        if args.filename is None:
+            # Standard input is spooled once (in memory, or to a temporary file if
+            # large), for the daemon or, failing that, locally
+            content = spool(read_chunks(sys.stdin.buffer))
+            source = content
+        # URIs are passed on as they are; anything else is a local path
+        path = uri = None
+        if args.filename is not None:
+            if args.filename.startswith(("http:", "https:", "file:", "data:")):
+                uri = args.filename
+            else:
+                path = args.filename
+        try:
+            markdown, _ = convert_with_daemon(
+                socket_path,
+                path=path,
+                uri=uri,
+                content=content,
+                stream_info={
+                    "extension": extension_hint,
+                    "mimetype": mime_type_hint,
+                    "charset": charset_hint,
+                },
+                init_kwargs=init_kwargs,
+                keep_data_uris=args.keep_data_uris,
             )
-        elif args.filename is None:
-            _exit_with_error("Filename is required when using Document Intelligence.")
+            _handle_output(args, [markdown])
+            return
+        except DaemonUnavailable:
+            if content is not None:
+                content.seek(0)
+
+    from ._markitdown import MarkItDown
+
+    markitdown = MarkItDown(**init_kwargs)
+
+    # Stream the output, so that it starts as soon as the first part is converted
+    fragments = markitdown.convert_iter(
+        sys.stdin.buffer if source is None else source,
+        stream_info=stream_info,
+        keep_data_uris=args.keep_data_uris,
+    )
+
+    _handle_output(args, fragments)
 
-        markitdown = MarkItDown(
-            enable_plugins=args.use_plugins, docintel_endpoint=args.endpoint
-        )
-    else:
-        markitdown = MarkItDown(enable_plugins=args.use_plugins)
 
-    if args.filename is None:
-        result = markitdown.convert_stream(
-            sys.stdin.buffer,
-            stream_info=stream_info,
+def _convert_directory(args, init_kwargs: Dict[str, Any]):
+    """Convert a directory recursively, report the outcome, and exit"""
+    from ._markitdown import MarkItDown
+
+    try:
+        summary = MarkItDown(**init_kwargs).convert_directory(
+            args.filename,
+            args.output_dir,
+            workers=args.workers,
+            retry_failed=args.retry_failed,
             keep_data_uris=args.keep_data_uris,
         )
-    else:
-        result = markitdown.convert(
-            args.filename, stream_info=stream_info, keep_data_uris=args.keep_data_uris
-        )
-
-    _handle_output(args, result)
+    except (NotADirectoryError, ValueError) as e:
+        _exit_with_error(str(e))
+    for path, error in sorted(summary.failed.items()):
+        print(f"Failed: {path}: {error}", file=sys.stderr)
+    print(
+        f"Converted {summary.converted} file(s), skipped {summary.unchanged} unchanged, "
+        f"removed {summary.removed} output(s) of deleted files; "
+        f"{len(summary.failed)} file(s) failed.",
+        file=sys.stderr,
+    )
+    sys.exit(0 if summary.ok else 1)
 
 
-def _handle_output(args, result: DocumentConverterResult):
+def _handle_output(args, fragments: Iterable[str]):
     """Handle output to stdout or file"""
     if args.output:
         with open(args.output, "w", encoding="utf-8") as f:
-            f.write(result.markdown)
+            for fragment in fragments:
+                f.write(fragment)
     else:
-        # Handle stdout encoding errors more gracefully
-        print(
-            result.markdown.encode(sys.stdout.encoding, errors="replace").decode(
-                sys.stdout.encoding
+        for fragment in fragments:
+            # Handle stdout encoding errors more gracefully
+            sys.stdout.write(
+                fragment.encode(sys.stdout.encoding, errors="replace").decode(
+                    sys.stdout.encoding
+                )
             )
-        )
+            sys.stdout.flush()
+        sys.stdout.write("\n")
 
 
 def _exit_with_error(message: str):
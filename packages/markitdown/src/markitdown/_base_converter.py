@@ -1,5 +1,25 @@
-from typing import Any, BinaryIO, Optional
+from typing import Any, BinaryIO, Dict, Generator, List, Optional, Tuple, Type
 from ._stream_info import StreamInfo
+from ._stats import ConversionStats
+from ._exceptions import (
+    ConversionCancelledException,
+    ConversionTimeoutException,
+    MissingDependencyException,
+)
+
+# The exceptions that are never caused by the content itself, whatever the
+# content_failure_types of a converter: a missing dependency, the conversion being
+# cancelled or running out of time, and I/O errors (which may be transient)
+NON_CONTENT_FAILURE_TYPES: Tuple[Type[BaseException], ...] = (
+    MissingDependencyException,
+    ConversionCancelledException,
+    ConversionTimeoutException,
+    OSError,
+)
+
+# The content_failure_types of converters whose convert() does not depend on the
+# StreamInfo guess, so that any other failure is the content's
+GUESS_INDEPENDENT_FAILURE_TYPES: Tuple[Type[BaseException], ...] = (Exception,)
 
 
 class DocumentConverterResult:
@@ -24,6 +44,13 @@ class DocumentConverterResult:
         self.markdown = markdown
         self.title = title
 
+        # Set by MarkItDown when stats are collected (see ConversionStats)
+        self.stats: Optional[ConversionStats] = None
+
+        # Set by MarkItDown: what was left out to keep within the max_* options of
+        # the conversion, by unit (e.g., {"pages": 40}; see OutputBudget)
+        self.skipped: Dict[str, int] = {}
+
     @property
     def text_content(self) -> str:
         """Soft-deprecated alias for `markdown`. New code should migrate to using `markdown` or __str__."""
@@ -38,9 +65,59 @@ class DocumentConverterResult:
         """Return the converted Markdown text."""
         return self.markdown
 
+    @classmethod
+    def from_fragments(
+        cls, fragments: Generator[str, None, Optional[str]]
+    ) -> "DocumentConverterResult":
+        """
+        Build a result by exhausting a convert_iter() generator: the markdown is the
+        concatenation of the fragments it yields, and the title is the value it returns.
+        """
+        parts: List[str] = []
+        while True:
+            try:
+                parts.append(next(fragments))
+            except StopIteration as stop:
+                return cls("".join(parts), title=stop.value)
+
 
 class DocumentConverter:
-    """Abstract superclass of all DocumentConverters."""
+    """
+    Abstract superclass of all DocumentConverters.
+
+    Thread safety: a converter is registered once, and its accepts(), convert() and
+    convert_iter() methods are then called by every conversion of the MarkItDown
+    instance, including conversions that run at the same time in other threads
+    (e.g., with convert_async(), or when an instance is shared by a thread pool).
+    They must therefore be reentrant: state that belongs to a single call (such as
+    its options, or a parsed document) is passed along in arguments, or kept in the
+    `sniff` context of the conversion (see accepts()), never kept on `self`. State
+    that converters do keep on `self` (e.g., a client, or a cache) must be safe to
+    use from several threads at once.
+    """
+
+    # Optional hints used by MarkItDown to index converters at registration time. When
+    # either is set, accepts() is only consulted for streams whose extension is listed
+    # in `accepted_file_extensions`, or whose mimetype starts with one of the
+    # `accepted_mime_type_prefixes`. The hints must therefore describe a superset of
+    # the streams for which accepts() can return True. Converters that leave both as
+    # None (the default) are consulted for every stream, which is appropriate when
+    # accepts() depends on other properties (e.g., the charset, or the content).
+    accepted_file_extensions: Optional[List[str]] = None
+    accepted_mime_type_prefixes: Optional[List[str]] = None
+
+    # The exceptions that convert() raises because of the content itself (e.g., a
+    # corrupt file), whatever the StreamInfo guess it was called with. When convert()
+    # raises one of them, the converter is not tried again under the other guesses of
+    # the same conversion. (It is never tried twice under the same guess.) The
+    # NON_CONTENT_FAILURE_TYPES are excluded (see is_content_failure()).
+    content_failure_types: Tuple[Type[BaseException], ...] = ()
+
+    def is_content_failure(self, error: BaseException) -> bool:
+        """Whether an exception raised by convert() is one of its content_failure_types."""
+        return isinstance(error, self.content_failure_types) and not isinstance(
+            error, NON_CONTENT_FAILURE_TYPES
+        )
 
     def accepts(
         self,
@@ -59,10 +136,23 @@ class DocumentConverter:
         NOTE: The method signature is designed to match that of the convert() method. This provides some
         assurance that, if accepts() returns True, the convert() method will also be able to handle the document.
 
-        IMPORTANT: In rare cases, (e.g., OutlookMsgConverter) we need to read more from the stream to make a final
-        determination. Read operations inevitably advances the position in file_stream. In these case, the position
-        MUST be reset it MUST be reset before returning. This is because the convert() method may be called immediately
-        after accepts(), and will expect the file_stream to be at the original position.
+        IMPORTANT: In rare cases, (e.g., OutlookMsgConverter) we need to look at the content to make a final
+        determination. MarkItDown passes a `sniff` option (a SniffContext) holding the first SNIFF_PREFIX_SIZE
+        bytes of the stream, and its last SNIFF_SUFFIX_SIZE bytes, which were read once, and are shared by all the
+        converters (and by the identification of the stream). Content checks should be made on these, e.g.,
+
+        sniff = kwargs.get("sniff")
+        if sniff is not None:
+            return sniff.prefix.startswith(b"%PDF")
+
+        What accepts() works out from these (e.g., the type of a feed) can be kept in `sniff.state`, for convert()
+        to reuse, rather than work it out again.
+
+        The contract is that accepts() never reads the stream beyond the first SNIFF_PREFIX_SIZE bytes from its
+        initial position, so that the cost of rejecting a document does not grow with its size. A converter that
+        reads from the stream anyway (e.g., when called without a `sniff` option) MUST reset the position before
+        returning. This is because the convert() method may be called immediately after accepts(), and will expect
+        the file_stream to be at the original position.
 
         E.g.,
         cur_pos = file_stream.tell() # Save the current position
@@ -103,3 +193,55 @@ class DocumentConverter:
         - MissingDependencyException: If the converter requires a dependency that is not installed.
         """
         raise NotImplementedError("Subclasses must implement this method")
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Generator[str, None, Optional[str]]:
+        """
+        Convert a document to Markdown text, yielding fragments of the text as they are
+        produced (e.g., per page, slide, sheet, archive member, or feed item), and
+        returning the title, if any.
+
+        The concatenated fragments must be the same as the markdown returned by convert().
+        This default implementation adapts convert(), yielding the whole text as a single
+        fragment. Converters that can produce their output incrementally should override
+        it, and typically implement convert() as:
+
+            return DocumentConverterResult.from_fragments(
+                self.convert_iter(file_stream, stream_info, **kwargs)
+            )
+
+        When a conversion has a max_output_chars option, MarkItDown calls convert_iter()
+        rather than convert(), and measures the fragments as they are yielded. Converters
+        that loop over pages, slides, etc. should check the `budget` option (see
+        OutputBudget and budget_of()) before each, to stop once the output is long enough.
+
+        Parameters, and exceptions raised, are as for convert().
+        """
+        result = self.convert(file_stream, stream_info, **kwargs)
+        yield result.markdown
+        return result.title
+
+    def probe(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Dict[str, Any]:
+        """
+        Return cheap structural counts of a document that the converter accepted, without
+        converting it (see MarkItDown.probe()), e.g., {"pages": 12} for a PDF. Only
+        headers or indexes should be read (e.g., the central directory of a zip file),
+        so that a probe takes milliseconds, whatever the size of the document.
+
+        The counts used to estimate the cost of the conversion are listed in
+        COST_THRESHOLDS (see estimate_cost()). Converters that call a remote service
+        should return {"remote": True}. The stream may be read from anywhere (MarkItDown
+        restores its position). This default implementation knows nothing of the structure.
+
+        Parameters are as for convert().
+        """
+        return {}
@@ -0,0 +1,198 @@
+import collections
+import concurrent.futures
+import io
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+from ._base_converter import DocumentConverterResult
+from ._exceptions import MarkItDownException, FileConversionException
+
+# Break otherwise circular import for type hinting
+if TYPE_CHECKING:
+    from ._markitdown import MarkItDown
+
+BatchSource = Union[str, Path, bytes, bytearray, memoryview, BinaryIO]
+
+# How many conversions may be queued per worker. Bounding the number of pending
+# conversions keeps memory flat when iterating over very large batches.
+PENDING_CONVERSIONS_PER_WORKER = 4
+
+
+@dataclass(kw_only=True, frozen=True)
+class BatchConversionResult:
+    """The outcome of converting one of the sources passed to MarkItDown.convert_many()."""
+
+    index: int  # Position of the source in the input
+    source: Any  # The source, as passed to convert_many()
+    result: Optional[DocumentConverterResult] = None  # None if the conversion failed
+    exception: Optional[BaseException] = None  # None if the conversion succeeded
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+
+# The MarkItDown instance used by the current worker process.
+_worker_markitdown: Union[None, "MarkItDown"] = None
+
+
+def _init_worker(init_kwargs: Dict[str, Any]) -> None:
+    """Build and warm up the MarkItDown instance of a worker process, once."""
+    global _worker_markitdown
+    from ._markitdown import MarkItDown
+
+    _worker_markitdown = MarkItDown(**init_kwargs)
+    _worker_markitdown.warmup()
+
+
+def _picklable_exception(exc: BaseException) -> BaseException:
+    """
+    Exceptions raised in worker processes are pickled back to the parent, which fails
+    for some (e.g., FileConversionException holds the tracebacks of each attempt).
+    Such exceptions are replaced by ones carrying the same message.
+    """
+    try:
+        pickle.dumps(exc)
+        return exc
+    except Exception:
+        if isinstance(exc, FileConversionException):
+            return FileConversionException(str(exc))
+        return MarkItDownException(f"{type(exc).__name__}: {exc}")
+
+
+def _convert_one(
+    markitdown: "MarkItDown", source: Any, kwargs: Dict[str, Any]
+) -> Tuple[Optional[DocumentConverterResult], Optional[BaseException]]:
+    try:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            # BytesIO shares the buffer of a bytes object, rather than copying it
+            return markitdown.convert_stream(io.BytesIO(source), **kwargs), None
+        return markitdown.convert(source, **kwargs), None
+    except Exception as e:
+        return None, e
+
+
+def _convert_in_worker(
+    source: Any, kwargs: Dict[str, Any]
+) -> Tuple[Optional[DocumentConverterResult], Optional[BaseException]]:
+    assert _worker_markitdown is not None
+    result, exc = _convert_one(_worker_markitdown, source, kwargs)
+    if exc is not None:
+        exc = _picklable_exception(exc)
+    return result, exc
+
+
+def convert_many(
+    markitdown: "MarkItDown",
+    sources: Iterable[BatchSource],
+    *,
+    workers: Optional[int] = None,
+    executor: str = "process",
+    ordered: bool = True,
+    init_kwargs: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> Iterator[BatchConversionResult]:
+    """See MarkItDown.convert_many()"""
+    if executor not in ("process", "thread"):
+        raise ValueError(
+            f"Unsupported executor: {executor}. Supported executors are: process, thread"
+        )
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    pool: concurrent.futures.Executor
+    if executor == "process":
+        # Each worker process builds, and warms up, its own MarkItDown instance once
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(init_kwargs or {},),
+        )
+    else:
+        # Threads share this instance, so it only needs to be warmed up once
+        markitdown.warmup()
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+    def submit(source: Any) -> concurrent.futures.Future:
+        if executor == "process":
+            if isinstance(source, Path):
+                source = str(source)
+            elif isinstance(source, memoryview):
+                # (Memoryviews cannot be pickled, so this copies the data, before
+                # pickling copies it again)
+                source = source.tobytes()
+            elif not isinstance(source, (str, bytes, bytearray)):
+                # Open streams cannot be shared with another process
+                source = source.read()
+            return pool.submit(_convert_in_worker, source, kwargs)
+        return pool.submit(_convert_one, markitdown, source, kwargs)
+
+    def outcome(
+        index: int, source: Any, future: concurrent.futures.Future
+    ) -> BatchConversionResult:
+        try:
+            result, exc = future.result()
+        except Exception as e:
+            # E.g., the worker process died
+            result, exc = None, e
+        return BatchConversionResult(
+            index=index, source=source, result=result, exception=exc
+        )
+
+    max_pending = workers * PENDING_CONVERSIONS_PER_WORKER
+    source_iter = enumerate(sources)
+
+    try:
+        if ordered:
+            queue: Deque[
+                Tuple[int, Any, concurrent.futures.Future]
+            ] = collections.deque()
+            for index, source in source_iter:
+                queue.append((index, source, submit(source)))
+                if len(queue) >= max_pending:
+                    yield outcome(*queue.popleft())
+            while queue:
+                yield outcome(*queue.popleft())
+        else:
+            pending: Dict[concurrent.futures.Future, Tuple[int, Any]] = {}
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    try:
+                        index, source = next(source_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[submit(source)] = (index, source)
+
+                if not pending:
+                    break
+
+                done: Set[concurrent.futures.Future]
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    index, source = pending.pop(future)
+                    yield outcome(index, source, future)
+    finally:
+        # Also reached if the caller stops iterating early
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,143 @@
+from typing import Any, Dict, Generator, Mapping, Optional, TypeVar
+
+# The options that limit the output of a conversion, by the unit they limit
+UNIT_OPTIONS = {
+    "pages": "max_pages",
+    "slides": "max_slides",
+    "sheets": "max_sheets",
+}
+BUDGET_OPTIONS = (*UNIT_OPTIONS.values(), "max_rows_per_table", "max_output_chars")
+
+_T = TypeVar("_T")
+
+
+class OutputBudget:
+    """
+    The limits of the output of a conversion, set by its options:
+
+    - max_pages, max_slides, max_sheets: the number of pages (of a PDF), slides (of
+      a presentation) or sheets (of a workbook) to convert.
+    - max_rows_per_table: the number of data rows to convert of each table (the
+      sheets of workbooks, and CSV files).
+    - max_output_chars: the length of the markdown.
+
+    Converters stop converting once a limit is reached, rather than converting
+    everything and truncating the output, and record what they left out in
+    `skipped`, by unit (e.g., {"pages": 40}). MarkItDown reports it as the `skipped`
+    attribute of the result.
+
+    A conversion has a single budget, passed to the converters as the `budget`
+    option (see budget_of()), and shared by the conversions that they start (e.g.,
+    of the members of an archive), so that max_output_chars bounds the whole
+    output. The output is measured by MarkItDown (see limit()), as the converters
+    produce it: converters check `exhausted` (or allows()) before each unit.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_pages: Optional[int] = None,
+        max_slides: Optional[int] = None,
+        max_sheets: Optional[int] = None,
+        max_rows_per_table: Optional[int] = None,
+        max_output_chars: Optional[int] = None,
+    ):
+        options = {
+            "max_pages": max_pages,
+            "max_slides": max_slides,
+            "max_sheets": max_sheets,
+            "max_rows_per_table": max_rows_per_table,
+            "max_output_chars": max_output_chars,
+        }
+        for name, value in options.items():
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative, got {value}")
+
+        self._unit_limits = {
+            unit: options[option] for unit, option in UNIT_OPTIONS.items()
+        }
+        self.max_rows_per_table = max_rows_per_table
+        self.max_output_chars = max_output_chars
+
+        self.output_chars = 0  # The length of the output so far
+        self.skipped: Dict[str, int] = {}
+
+    @classmethod
+    def from_options(cls, kwargs: Mapping[str, Any]) -> "OutputBudget":
+        return cls(**{name: kwargs.get(name) for name in BUDGET_OPTIONS})
+
+    @property
+    def limited(self) -> bool:
+        """Whether any limit is set."""
+        return any(
+            limit is not None
+            for limit in (
+                *self._unit_limits.values(),
+                self.max_rows_per_table,
+                self.max_output_chars,
+            )
+        )
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the output reached max_output_chars."""
+        return (
+            self.max_output_chars is not None
+            and self.output_chars >= self.max_output_chars
+        )
+
+    def allows(self, unit: str, index: int) -> bool:
+        """
+        Whether the unit at index (from 0, in its document) is to be converted: it
+        is within the max_<unit> option, if any (e.g., max_pages, for "pages"), and
+        the output has not reached max_output_chars.
+        """
+        limit = self._unit_limits.get(unit)
+        return (limit is None or index < limit) and not self.exhausted
+
+    def skip(self, unit: str, count: int = 1) -> None:
+        """Record that count units (e.g., pages) were left out."""
+        if count > 0:
+            self.skipped[unit] = self.skipped.get(unit, 0) + count
+
+    def reset(self) -> None:
+        """Forget the output, and what was skipped (e.g., of a failed attempt)."""
+        self.output_chars = 0
+        self.skipped = {}
+
+    def limit(
+        self, fragments: Generator[str, None, _T]
+    ) -> Generator[str, None, Optional[_T]]:
+        """
+        Pass the fragments of a conversion through, measuring them, up to
+        max_output_chars: the fragment that reaches it is cut, and later fragments
+        (of converters that do not stop by themselves) are dropped, and counted as
+        skipped "characters". Returns the value returned by fragments.
+        """
+        try:
+            while True:
+                try:
+                    fragment = next(fragments)
+                except StopIteration as stop:
+                    return stop.value
+                if self.max_output_chars is not None:
+                    left = self.max_output_chars - self.output_chars
+                    if len(fragment) > left:
+                        self.skip("characters", len(fragment) - max(left, 0))
+                        fragment = fragment[: max(left, 0)]
+                self.output_chars += len(fragment)
+                if fragment:
+                    yield fragment
+        finally:
+            fragments.close()
+
+
+def budget_of(kwargs: Mapping[str, Any]) -> OutputBudget:
+    """
+    The budget of a conversion, passed as the `budget` option, or else (e.g., when a
+    converter is used directly) a new one, from the max_* options.
+    """
+    budget = kwargs.get("budget")
+    if isinstance(budget, OutputBudget):
+        return budget
+    return OutputBudget.from_options(kwargs)
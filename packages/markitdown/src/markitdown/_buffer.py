@@ -0,0 +1,298 @@
+import io
+import mmap
+import os
+import stat
+import tempfile
+from typing import (
+    AsyncIterable,
+    BinaryIO,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from ._exceptions import InputTooLargeException
+
+# Input that must be buffered (because it is not seekable) is kept in memory up to
+# this size, and spilled to a temporary file beyond it.
+DEFAULT_SPOOL_MAX_MEMORY = 32 * 1024 * 1024
+
+# The size of the reads from non-seekable streams, and of HTTP response chunks
+READ_SIZE = 1024 * 1024
+
+
+def read_chunks(stream: BinaryIO, chunk_size: int = READ_SIZE) -> Iterator[bytes]:
+    """Read a binary stream to the end, in chunks."""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def content_length(headers: Mapping[str, str]) -> Optional[int]:
+    """The Content-Length of an HTTP response (headers are case-insensitive), if any."""
+    try:
+        return int(headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def check_size(size: Optional[int], max_size: Optional[int]) -> None:
+    """Raise InputTooLargeException if both sizes are known, and size exceeds max_size."""
+    if size is not None and max_size is not None and size > max_size:
+        raise InputTooLargeException(
+            f"The input is larger than the maximum input size ({max_size} bytes)."
+        )
+
+
+class _Spooler:
+    """
+    Accumulates input in a BytesIO, until it grows beyond max_memory bytes, when it
+    is moved to a temporary file. (Unlike tempfile.SpooledTemporaryFile, both are
+    io.BufferedIOBase streams, which some libraries, like Magika, insist on.)
+    """
+
+    def __init__(
+        self, max_memory: int, max_size: Optional[int], expected_size: Optional[int]
+    ):
+        check_size(expected_size, max_size)
+        self._max_memory = max_memory
+        self._max_size = max_size
+        self._size = 0
+        self.buffer: BinaryIO = io.BytesIO()
+
+    def write(self, chunk: bytes) -> None:
+        self._size += len(chunk)
+        check_size(self._size, self._max_size)
+        if self._size > self._max_memory and isinstance(self.buffer, io.BytesIO):
+            spilled = tempfile.TemporaryFile()
+            with self.buffer.getbuffer() as view:
+                spilled.write(view)
+            self.buffer.close()
+            self.buffer = spilled  # type: ignore[assignment]
+        self.buffer.write(chunk)
+
+
+def spool(
+    chunks: Iterable[bytes],
+    *,
+    max_memory: int = DEFAULT_SPOOL_MAX_MEMORY,
+    max_size: Optional[int] = None,
+    expected_size: Optional[int] = None,
+) -> BinaryIO:
+    """
+    Copy chunks of input into a seekable buffer, positioned at the start. The buffer
+    is kept in memory up to max_memory bytes, and spilled to a temporary file beyond
+    that. The caller closes it (which deletes the temporary file, if any).
+
+    If the input is larger than max_size bytes, InputTooLargeException is raised: up
+    front if the expected size (e.g., a Content-Length) already exceeds it, and
+    otherwise as soon as the limit is crossed.
+    """
+    spooler = _Spooler(max_memory, max_size, expected_size)
+    try:
+        for chunk in chunks:
+            spooler.write(chunk)
+        spooler.buffer.seek(0)
+    except BaseException:
+        spooler.buffer.close()
+        raise
+    return spooler.buffer
+
+
+async def spool_async(
+    chunks: AsyncIterable[bytes],
+    *,
+    max_memory: int = DEFAULT_SPOOL_MAX_MEMORY,
+    max_size: Optional[int] = None,
+    expected_size: Optional[int] = None,
+) -> BinaryIO:
+    """Asynchronous version of spool(), for asynchronous iterables of chunks."""
+    spooler = _Spooler(max_memory, max_size, expected_size)
+    try:
+        async for chunk in chunks:
+            spooler.write(chunk)
+        spooler.buffer.seek(0)
+    except BaseException:
+        spooler.buffer.close()
+        raise
+    return spooler.buffer
+
+
+class MmapStream(io.BufferedIOBase):
+    """
+    A read-only, seekable binary stream over a memory-mapped local file. Reads
+    behave as for a regular file, but getbuffer() exposes the whole content as a
+    memoryview, without copying it: pages are read in by the OS as they are
+    accessed, rather than duplicated on the Python heap.
+
+    Use open_local() to open files, which falls back to a regular file where
+    memory mapping is not possible.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.name = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def getbuffer(self) -> memoryview:
+        """The whole content of the file, as a (read-only) memoryview."""
+        self._check_closed()
+        return memoryview(self._mmap)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        self._check_closed()
+        return self._mmap.read(-1 if size is None else size)
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def readinto(self, b) -> int:  # type: ignore[override]
+        self._check_closed()
+        pos = self._mmap.tell()
+        with memoryview(b) as view, view.cast("B") as target:
+            data = self._mmap[pos : pos + len(target)]
+            target[: len(data)] = data
+        self._mmap.seek(pos + len(data))
+        return len(data)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        self._check_closed()
+        if size is None or size < 0:
+            return self._mmap.readline()
+        pos = self._mmap.tell()
+        end = self._mmap.find(b"\n", pos, pos + size)
+        return self.read(size if end < 0 else end + 1 - pos)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._check_closed()
+        self._mmap.seek(offset, whence)
+        return self._mmap.tell()
+
+    def tell(self) -> int:
+        self._check_closed()
+        return self._mmap.tell()
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Views of the buffer are still referenced (e.g., by a traceback).
+                # The mapping is released once they are garbage collected.
+                pass
+            self._file.close()
+        super().close()
+
+    def _check_closed(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+
+class CountingStream(io.BufferedIOBase):
+    """
+    A binary stream that delegates to another, counting the bytes read through it
+    (including bytes read more than once, e.g., by converters that are tried in
+    turn). Used to collect conversion stats (see ConversionStats.bytes_read).
+    """
+
+    def __init__(self, stream: BinaryIO):
+        super().__init__()
+        self.stream = stream
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self.stream.seekable()
+
+    def fileno(self) -> int:
+        return self.stream.fileno()
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        data = self.stream.read(-1 if size is None else size)
+        self.bytes_read += len(data)
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        read1 = getattr(self.stream, "read1", self.stream.read)
+        data = read1(size)
+        self.bytes_read += len(data)
+        return data
+
+    def readinto(self, b) -> int:  # type: ignore[override]
+        readinto = getattr(self.stream, "readinto", None)
+        if readinto is None:
+            return super().readinto(b)
+        n = readinto(b) or 0
+        self.bytes_read += n
+        return n
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        data = self.stream.readline(-1 if size is None else size)
+        self.bytes_read += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self.stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.stream.tell()
+
+    def close(self) -> None:
+        # The underlying stream belongs to the caller
+        super().close()
+
+
+def open_local(path: str) -> BinaryIO:
+    """
+    Open a local file for reading, memory-mapped if possible (see MmapStream). Empty
+    files, and files that are not regular files (e.g., pipes, or files in /proc,
+    which report a size of 0), are opened as regular files.
+    """
+    try:
+        st = os.stat(path)
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            return MmapStream(path)  # type: ignore[return-value]
+    except (OSError, ValueError):
+        # E.g., the platform does not support mapping this file. Opening it as a
+        # regular file reports any error that is not specific to memory mapping.
+        pass
+    return open(path, "rb")
+
+
+def read_buffer(file_stream: BinaryIO) -> Union[bytes, memoryview]:
+    """
+    Read a stream from its current position to the end, as file_stream.read() does.
+    For memory-mapped streams, the result is a memoryview of the mapping, rather
+    than a copy. It is accepted wherever a bytes-like object is (e.g., by
+    bytes.decode(), str(buffer, encoding), base64, and subprocess input).
+    """
+    if isinstance(file_stream, CountingStream):
+        data = read_buffer(file_stream.stream)
+        file_stream.bytes_read += len(data)
+        return data
+    if isinstance(file_stream, MmapStream):
+        pos = file_stream.tell()
+        view = file_stream.getbuffer()[pos:]
+        file_stream.seek(0, os.SEEK_END)
+        return view
+    return file_stream.read()
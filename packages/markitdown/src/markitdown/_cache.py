@@ -0,0 +1,347 @@
+import collections
+import functools
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from importlib.metadata import packages_distributions, version, PackageNotFoundError
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from .__about__ import __version__
+from ._base_converter import DocumentConverterResult
+from ._stream_info import StreamInfo
+
+# Break otherwise circular import for type hinting
+if TYPE_CHECKING:
+    from ._markitdown import ConverterRegistration
+
+# Options that do not affect the output, and are therefore left out of cache keys.
+# (The deadline may cut the output short, but such results are not cached.)
+UNKEYED_OPTIONS = {
+    "cancel_event",
+    "budget",
+    "collect_stats",
+    "deadline",
+    "pdf_workers",
+    "pdf_pages_per_chunk",
+    "tracer",
+    "trace_parent",
+    "sniff",
+}
+
+# A cached result: its markdown, title, and what was skipped to keep within the
+# max_* options of the conversion (see DocumentConverterResult.skipped)
+_Entry = Tuple[str, Optional[str], Dict[str, int]]
+
+
+@dataclass(kw_only=True, frozen=True)
+class CacheStats:
+    """A snapshot of the counters of a ConversionCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # Entries removed to make room, or because they expired
+    entries: int = 0
+    size: int = 0  # Total size of the entries, in bytes
+
+
+class ConversionCache:
+    """
+    Abstract superclass of conversion result caches.
+
+    A cache is passed to MarkItDown as the `cache` option, e.g.:
+
+        markitdown = MarkItDown(cache=MemoryCache(max_size=256 * 1024 * 1024))
+
+    Results are keyed by a hash of the input bytes, the stream info guesses, the
+    conversion options, and the registered converters (including the versions of the
+    packages providing them). A repeated conversion is then answered from the cache,
+    without running any converter (e.g., without parsing PDFs or calling LLMs).
+
+    Subclasses implement _get(), _put() and _stats(). Counting hits and misses,
+    and thread-safety, are handled here.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[DocumentConverterResult]:
+        """Return the cached result for the key, or None."""
+        with self._lock:
+            entry = self._get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        markdown, title, skipped = entry
+        result = DocumentConverterResult(markdown=markdown, title=title)
+        result.skipped = dict(skipped)
+        return result
+
+    def put(self, key: str, result: DocumentConverterResult) -> None:
+        """Store the result under the key."""
+        with self._lock:
+            self._put(key, (result.markdown, result.title, dict(result.skipped)))
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            entries, size = self._stats()
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=entries,
+                size=size,
+            )
+
+    def _get(self, key: str) -> Optional[_Entry]:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def _put(self, key: str, entry: _Entry) -> None:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def _stats(self) -> Tuple[int, int]:
+        """Return the number of entries, and their total size in bytes."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+
+class MemoryCache(ConversionCache):
+    """
+    An in-memory, least-recently-used cache, bounded by the total size of its entries.
+    """
+
+    def __init__(self, max_size: int = 128 * 1024 * 1024):
+        """
+        Parameters:
+        - max_size: The maximum total size of the entries, in bytes.
+        """
+        super().__init__()
+        self._max_size = max_size
+        self._size = 0
+        self._entries: collections.OrderedDict[
+            str, Tuple[_Entry, int]
+        ] = collections.OrderedDict()
+
+    def _get(self, key: str) -> Optional[_Entry]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        self._entries.move_to_end(key)
+        return item[0]
+
+    def _put(self, key: str, entry: _Entry) -> None:
+        size = sum(sys.getsizeof(part) for part in entry)
+        if size > self._max_size:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= old[1]
+
+        self._entries[key] = (entry, size)
+        self._size += size
+
+        while self._size > self._max_size:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+            self._evictions += 1
+
+    def _stats(self) -> Tuple[int, int]:
+        return len(self._entries), self._size
+
+
+class DiskCache(ConversionCache):
+    """
+    An on-disk cache of zlib-compressed entries, with optional expiry, bounded by the
+    total (compressed) size of its entries. When full, the least recently used entries
+    are evicted.
+
+    The directory may be shared by several processes. Each process tracks the
+    entries it finds when it starts, and those it writes itself, so the size bound is
+    enforced per process.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_size: int = 1024 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Parameters:
+        - directory: The directory in which to store entries. Created if needed.
+        - max_size: The maximum total size of the entries on disk, in bytes.
+        - ttl: If set, entries expire this many seconds after they were written.
+        """
+        super().__init__()
+        self._directory = directory
+        self._max_size = max_size
+        self._ttl = ttl
+        self._size = 0
+
+        # Entries by key, in least-recently-used order, with their sizes on disk
+        self._entries: collections.OrderedDict[str, int] = collections.OrderedDict()
+
+        os.makedirs(directory, exist_ok=True)
+        found: List[Tuple[float, str, int]] = []
+        for name in os.listdir(directory):
+            if name.endswith(".md.z"):
+                st = os.stat(os.path.join(directory, name))
+                found.append((st.st_atime, name[: -len(".md.z")], st.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._size += size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + ".md.z")
+
+    def _remove(self, key: str) -> None:
+        self._size -= self._entries.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _get(self, key: str) -> Optional[_Entry]:
+        path = self._path(key)
+        try:
+            st = os.stat(path)
+            if self._ttl is not None and time.time() - st.st_mtime > self._ttl:
+                self._remove(key)
+                self._evictions += 1
+                return None
+            with open(path, "rb") as fh:
+                data = json.loads(zlib.decompress(fh.read()))
+            # Record the access, for least-recently-used eviction
+            os.utime(path, (time.time(), st.st_mtime))
+        except OSError:
+            # Missing (perhaps evicted by another process)
+            self._size -= self._entries.pop(key, 0)
+            return None
+        except (ValueError, zlib.error):
+            # Unreadable: it would never be read
+            self._remove(key)
+            return None
+
+        if key not in self._entries:
+            self._entries[key] = st.st_size
+            self._size += st.st_size
+        self._entries.move_to_end(key)
+        # (Entries written by earlier versions have no "skipped")
+        return data["markdown"], data["title"], data.get("skipped", {})
+
+    def _put(self, key: str, entry: _Entry) -> None:
+        data = zlib.compress(
+            json.dumps(
+                {"markdown": entry[0], "title": entry[1], "skipped": entry[2]}
+            ).encode("utf-8")
+        )
+        if len(data) > self._max_size:
+            return
+
+        # Write atomically, so that concurrent readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        self._size -= self._entries.pop(key, 0)
+        self._entries[key] = len(data)
+        self._size += len(data)
+
+        while self._size > self._max_size:
+            evicted_key = next(iter(self._entries))
+            self._remove(evicted_key)
+            self._evictions += 1
+
+    def _stats(self) -> Tuple[int, int]:
+        return len(self._entries), self._size
+
+
+@functools.lru_cache(maxsize=None)
+def _package_version(module_name: str) -> str:
+    """The version of the installed distribution that provides a top-level module."""
+    for distribution in packages_distributions().get(module_name.split(".")[0], []):
+        try:
+            return version(distribution)
+        except PackageNotFoundError:
+            pass
+    return ""
+
+
+def converters_fingerprint(registrations: Sequence["ConverterRegistration"]) -> str:
+    """
+    Describe the registered converters, their priorities, and the versions of the
+    packages that provide them (e.g., plugins), for inclusion in cache keys.
+    """
+    parts = [f"markitdown@{__version__}"]
+    for registration in registrations:
+        converter_type = type(registration.converter)
+        module = converter_type.__module__
+        parts.append(
+            f"{module}.{converter_type.__qualname__}@{_package_version(module)}"
+            f":{registration.priority}"
+        )
+    return "\n".join(parts)
+
+
+def _option_value(value: Any) -> Any:
+    """A JSON-serializable description of an option value."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_option_value(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _option_value(v) for k, v in value.items()}
+    # E.g., an LLM client. Only its type is known to affect the output.
+    return f"<{type(value).__module__}.{type(value).__qualname__}>"
+
+
+def cache_key(
+    file_stream: BinaryIO,
+    stream_info_guesses: List[StreamInfo],
+    options: Dict[str, Any],
+    fingerprint: str,
+) -> str:
+    """
+    Compute the cache key of a conversion. The stream is read from its current
+    position to the end, and then returned to that position.
+    """
+    digest = hashlib.sha256()
+    cur_pos = file_stream.tell()
+    try:
+        while True:
+            chunk = file_stream.read(1024 * 1024)
+            if not chunk:
+                break
+            digest.update(chunk)
+    finally:
+        file_stream.seek(cur_pos)
+
+    description = {
+        "stream_info_guesses": [asdict(guess) for guess in stream_info_guesses],
+        "options": {
+            k: _option_value(v)
+            for k, v in options.items()
+            if k not in UNKEYED_OPTIONS and not k.startswith("_")
+        },
+        "converters": fingerprint,
+    }
+    digest.update(b"\0")
+    digest.update(json.dumps(description, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
@@ -0,0 +1,60 @@
+import time
+from typing import Any, Dict, Optional
+
+from ._exceptions import ConversionCancelledException, ConversionTimeoutException
+
+# Appended to the output of a conversion that was cut short by its deadline
+TRUNCATION_MARKER = "\n\n<!-- Truncated: the conversion ran out of time -->"
+
+
+def raise_if_cancelled(kwargs: Dict[str, Any]) -> None:
+    """
+    Cancellation checkpoint. Conversions may be passed a `cancel_event` option
+    (a threading.Event, or anything with an is_set() method). Once it is set, the
+    conversion is abandoned at the next checkpoint, by raising a
+    ConversionCancelledException. Likewise, once the `deadline` option (see
+    remaining_time()) has passed, a ConversionTimeoutException is raised.
+
+    MarkItDown checks before consulting each converter. Converters that loop over
+    large inputs (slides, sheets, archive members, etc.) should also check once
+    per iteration, e.g.:
+
+        for slide in presentation.slides:
+            raise_if_cancelled(kwargs)
+            ...
+
+    or, to return what was converted so far when the deadline passes:
+
+        for slide in presentation.slides:
+            if deadline_passed(kwargs):
+                yield TRUNCATION_MARKER
+                break
+            raise_if_cancelled(kwargs)
+            ...
+    """
+    cancel_event = kwargs.get("cancel_event")
+    if cancel_event is not None and cancel_event.is_set():
+        raise ConversionCancelledException("The conversion was cancelled.")
+    if deadline_passed(kwargs):
+        raise ConversionTimeoutException("The deadline of the conversion passed.")
+
+
+def remaining_time(kwargs: Dict[str, Any]) -> Optional[float]:
+    """
+    The time left (in seconds, and never negative) before the `deadline` option of a
+    conversion, or None if it has no deadline. The deadline is a time.monotonic()
+    timestamp, e.g., deadline=time.monotonic() + 10, so that the conversions started
+    by a converter (e.g., of the members of an archive) share it. Converters pass the
+    remaining time as the timeout of network calls, and stop waiting or retrying once
+    it is spent.
+    """
+    deadline = kwargs.get("deadline")
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def deadline_passed(kwargs: Dict[str, Any]) -> bool:
+    """Whether the `deadline` option of a conversion has passed (see remaining_time())."""
+    deadline = kwargs.get("deadline")
+    return deadline is not None and time.monotonic() >= deadline
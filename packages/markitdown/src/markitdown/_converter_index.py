@@ -0,0 +1,97 @@
+from typing import Dict, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
+
+from ._stream_info import StreamInfo
+
+# Break otherwise circular import for type hinting
+if TYPE_CHECKING:
+    from ._markitdown import ConverterRegistration
+
+# Upper bound on the number of (mimetype, extension) pairs for which candidate lists are
+# memoized. Mimetypes can originate from untrusted Content-Type headers, so the memo
+# is cleared, rather than allowed to grow without bound, when this limit is reached.
+MAX_MEMOIZED_KEYS = 1024
+
+
+class ConverterIndex:
+    """
+    An index over converter registrations, built at registration time.
+
+    Registrations are kept sorted by priority (stable, so the most recently registered
+    converter wins ties), and are bucketed by the `accepted_file_extensions` and
+    `accepted_mime_type_prefixes` hints declared on their converters. Converters that
+    declare no hints land in a wildcard bucket, and are candidates for every stream.
+
+    Given a StreamInfo, candidates() returns only those registrations whose accepts()
+    could possibly return True, in the order in which they should be tried. The result
+    is memoized per (mimetype, extension) pair, so dispatching a familiar kind of
+    stream is a dictionary lookup, and accepts() is only called on the handful of
+    converters that could handle it.
+    """
+
+    def __init__(self, registrations: Sequence["ConverterRegistration"] = ()):
+        # Sort once, here, rather than on every conversion.
+        self._sorted: Tuple["ConverterRegistration", ...] = tuple(
+            sorted(registrations, key=lambda x: x.priority)
+        )
+
+        # Buckets hold positions in self._sorted, so that candidates can be
+        # reassembled in priority order by sorting small lists of integers.
+        self._wildcard: List[int] = []
+        self._by_extension: Dict[str, List[int]] = {}
+        self._by_mime_type_prefix: List[Tuple[str, int]] = []
+
+        for position, registration in enumerate(self._sorted):
+            converter = registration.converter
+            extensions = getattr(converter, "accepted_file_extensions", None)
+            prefixes = getattr(converter, "accepted_mime_type_prefixes", None)
+
+            if extensions is None and prefixes is None:
+                self._wildcard.append(position)
+                continue
+
+            for extension in extensions or []:
+                self._by_extension.setdefault(extension.lower(), []).append(position)
+
+            for prefix in prefixes or []:
+                self._by_mime_type_prefix.append((prefix.lower(), position))
+
+        # Shared by concurrent conversions: at worst, two threads compute the same
+        # candidates, and one of them is kept
+        self._memo: Dict[
+            Tuple[Optional[str], Optional[str]], Tuple["ConverterRegistration", ...]
+        ] = {}
+
+    @property
+    def registrations(self) -> Tuple["ConverterRegistration", ...]:
+        """All registrations, sorted in the order in which they should be tried."""
+        return self._sorted
+
+    def candidates(
+        self, stream_info: StreamInfo
+    ) -> Tuple["ConverterRegistration", ...]:
+        """
+        Return the registrations whose converters may accept the given stream,
+        sorted in the order in which they should be tried.
+        """
+        mimetype = (stream_info.mimetype or "").lower()
+        extension = (stream_info.extension or "").lower()
+        key = (mimetype, extension)
+
+        candidates = self._memo.get(key)
+        if candidates is not None:
+            return candidates
+
+        positions: Set[int] = set(self._wildcard)
+        if extension:
+            positions.update(self._by_extension.get(extension, []))
+        if mimetype:
+            for prefix, position in self._by_mime_type_prefix:
+                if mimetype.startswith(prefix):
+                    positions.add(position)
+
+        candidates = tuple(self._sorted[p] for p in sorted(positions))
+
+        if len(self._memo) >= MAX_MEMOIZED_KEYS:
+            self._memo.clear()
+        self._memo[key] = candidates
+        return candidates
@@ -0,0 +1,353 @@
+import builtins
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import threading
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
+
+from .__about__ import __version__
+from . import _exceptions
+
+# This module is imported by the command-line client on every invocation, so the
+# (heavy) conversion machinery is only imported by the daemon itself, in serve().
+
+# Set to the path of the socket of the daemon to use, or to "" to never use one
+SOCKET_ENV_VAR = "MARKITDOWN_SOCKET"
+
+# How long the client waits to connect to a daemon, before converting by itself
+CONNECT_TIMEOUT = 1.0
+
+# Messages are a JSON header, then a body of raw bytes (the input of a request,
+# or the markdown of a response), both preceded by their lengths
+_LENGTHS = struct.Struct(">II")
+
+# The size of the reads from streams sent as the body of a message
+_SEND_CHUNK_SIZE = 1024 * 1024
+
+
+def daemon_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def default_socket_path() -> Optional[str]:
+    """
+    The socket of the daemon: $MARKITDOWN_SOCKET if set (None if set but empty),
+    or else markitdown.sock in $XDG_RUNTIME_DIR, or in the temporary directory.
+    (Clients only connect to sockets of their own user; see _check_owner().)
+    """
+    path = os.environ.get(SOCKET_ENV_VAR)
+    if path is not None:
+        return path or None
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "markitdown.sock")
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"markitdown-{uid}.sock")
+
+
+def _send(
+    sock: socket.socket, header: Dict[str, Any], body: Union[bytes, BinaryIO] = b""
+) -> None:
+    """Send a message. A body that is a (seekable) stream is sent from its position."""
+    encoded = json.dumps(header).encode("utf-8")
+    if isinstance(body, bytes):
+        sock.sendall(_LENGTHS.pack(len(encoded), len(body)) + encoded)
+        if body:
+            sock.sendall(body)
+        return
+    start = body.tell()
+    size = body.seek(0, os.SEEK_END) - start
+    body.seek(start)
+    sock.sendall(_LENGTHS.pack(len(encoded), size) + encoded)
+    while size > 0:
+        chunk = body.read(min(size, _SEND_CHUNK_SIZE))
+        if not chunk:
+            raise ConnectionError("The body ended before its size")
+        sock.sendall(chunk)
+        size -= len(chunk)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:])
+        if n == 0:
+            raise ConnectionError("Connection closed before the end of a message")
+        received += n
+    return bytes(buffer)
+
+
+def _recv(sock: socket.socket) -> Tuple[Dict[str, Any], bytes]:
+    header_size, body_size = _LENGTHS.unpack(_recv_exactly(sock, _LENGTHS.size))
+    header = json.loads(_recv_exactly(sock, header_size))
+    return header, _recv_exactly(sock, body_size)
+
+
+# Client #######################################################################
+
+
+class DaemonUnavailable(Exception):
+    """No daemon could take the request, which should be converted locally instead."""
+
+
+def _check_owner(socket_path: str) -> None:
+    """
+    Make sure that socket_path is a socket of the current user. The default socket
+    may be in a shared directory (the temporary directory), where another user could
+    have created it, to receive the input of conversions, and forge their output.
+    """
+    try:
+        st = os.lstat(socket_path)
+    except OSError as e:
+        raise DaemonUnavailable(str(e)) from e
+    if not stat.S_ISSOCK(st.st_mode):
+        raise DaemonUnavailable(f"{socket_path} is not a socket")
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        raise DaemonUnavailable(f"{socket_path} belongs to another user")
+
+
+def convert_with_daemon(
+    socket_path: str,
+    *,
+    path: Optional[str] = None,
+    uri: Optional[str] = None,
+    content: Union[bytes, BinaryIO, None] = None,
+    stream_info: Optional[Dict[str, Any]] = None,
+    init_kwargs: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> Tuple[str, Optional[str]]:
+    """
+    Convert a local file (by path), a URI (http:, https:, file: or data:, passed to
+    MarkItDown.convert() as is) or some content (bytes, or a seekable stream, sent
+    from its position) with the daemon listening on socket_path, returning the
+    markdown and title.
+
+    stream_info holds the hints of a StreamInfo (None for none), init_kwargs the arguments the
+    MarkItDown instance should have been constructed with, and kwargs are passed
+    to the conversion (they must be JSON-serializable). Raises DaemonUnavailable
+    if no daemon is listening, or if it was started with other init_kwargs (or
+    from another version); and raises the exception of a failed conversion.
+    """
+    _check_owner(socket_path)
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except (AttributeError, OSError) as e:
+        raise DaemonUnavailable(str(e)) from e
+
+    with sock:
+        try:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(socket_path)
+        except OSError as e:
+            raise DaemonUnavailable(str(e)) from e
+        # Conversions take as long as they take
+        sock.settimeout(None)
+
+        _send(
+            sock,
+            {
+                "version": __version__,
+                "init_kwargs": init_kwargs or {},
+                # The daemon does not share the working directory of the client
+                "path": os.path.abspath(path) if path is not None else None,
+                "uri": uri,
+                "stream_info": stream_info or {},
+                "kwargs": kwargs,
+            },
+            content or b"",
+        )
+        header, body = _recv(sock)
+
+    if header.get("unavailable"):
+        raise DaemonUnavailable(header["error"])
+    if "error" in header:
+        # Raise the same exception as a local conversion would, if possible
+        exc_type = _exception_type(header.get("type", ""))
+        if exc_type is not None:
+            raise exc_type(header["error"])
+        raise _exceptions.MarkItDownException(f"{header['type']}: {header['error']}")
+    return body.decode("utf-8"), header.get("title")
+
+
+def _exception_type(name: str) -> Optional[type]:
+    """
+    The exception class of a failed conversion, by the name that the daemon
+    reported: one of MarkItDown (see _exceptions), or a built-in one (e.g.,
+    FileNotFoundError), or None if there is none of that name.
+    """
+    for module in (_exceptions, builtins):
+        exc_type = getattr(module, name, None)
+        if isinstance(exc_type, type) and issubclass(exc_type, Exception):
+            return exc_type
+    return None
+
+
+# Daemon #######################################################################
+
+
+def _ready() -> None:
+    """Run in each worker process at startup, once its instance is warmed up."""
+
+
+def serve(
+    socket_path: str,
+    *,
+    workers: Optional[int] = None,
+    init_kwargs: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Convert the requests of clients on a Unix socket, until interrupted, in a pool
+    of worker processes. Each worker builds its MarkItDown instance (from
+    init_kwargs) and warms it up once, at startup, so that requests pay for
+    neither. Requests are handled concurrently, up to one per worker.
+
+    The socket is only accessible to the user running the daemon, which reads
+    local files on behalf of its clients.
+    """
+    import concurrent.futures
+    import socketserver
+    from concurrent.futures.process import BrokenProcessPool
+
+    from ._batch import _convert_in_worker, _init_worker
+    from ._stream_info import StreamInfo
+
+    init_kwargs = dict(init_kwargs or {})
+    workers = workers or os.cpu_count() or 1
+
+    def start_pool() -> concurrent.futures.ProcessPoolExecutor:
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(init_kwargs,)
+        )
+        # Start (and warm up) every worker now, rather than on the first requests
+        for future in [pool.submit(_ready) for _ in range(workers)]:
+            future.result()
+        return pool
+
+    pool = start_pool()
+    pool_lock = threading.Lock()
+
+    def convert(source: Any, kwargs: Dict[str, Any]) -> Tuple[Any, Any]:
+        nonlocal pool
+        current = pool
+        try:
+            return current.submit(_convert_in_worker, source, kwargs).result()
+        except BrokenProcessPool:
+            # A worker died (e.g., killed for its memory use): replace the pool
+            with pool_lock:
+                if pool is current:
+                    current.shutdown(wait=False, cancel_futures=True)
+                    pool = start_pool()
+            raise
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self) -> None:
+            sock = self.request
+            try:
+                request, content = _recv(sock)
+            except (ConnectionError, ValueError, struct.error):
+                return
+
+            # Requests of another version, or for another configuration, are
+            # declined, and converted by the client
+            if request.get("version") != __version__:
+                _send(
+                    sock,
+                    {
+                        "unavailable": True,
+                        "error": f"The daemon runs version {__version__}",
+                    },
+                )
+                return
+            if request.get("init_kwargs") != init_kwargs:
+                _send(
+                    sock,
+                    {
+                        "unavailable": True,
+                        "error": "The daemon was started with other options",
+                    },
+                )
+                return
+
+            kwargs = dict(request.get("kwargs") or {})
+            hints = {
+                key: value
+                for key, value in (request.get("stream_info") or {}).items()
+                if value is not None
+            }
+            if hints:
+                kwargs["stream_info"] = StreamInfo(**hints)
+            if request.get("path") is not None:
+                source = request["path"]
+            elif request.get("uri") is not None:
+                source = request["uri"]
+            else:
+                source = content
+
+            try:
+                result, exc = convert(source, kwargs)
+            except Exception as e:
+                result, exc = None, e
+            try:
+                if exc is not None:
+                    _send(sock, {"error": str(exc), "type": type(exc).__name__})
+                else:
+                    _send(
+                        sock,
+                        {"title": result.title},
+                        result.markdown.encode("utf-8"),
+                    )
+            except OSError:
+                pass  # The client went away
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    _remove_stale_socket(socket_path)
+    # Only the owner may connect
+    umask = os.umask(0o177)
+    try:
+        server = Server(socket_path, Handler)
+    finally:
+        os.umask(umask)
+
+    def terminate(signum: int, frame: Any) -> None:
+        raise SystemExit(0)
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, terminate)
+
+    print(
+        f"MarkItDown daemon listening on {socket_path}, with {workers} worker(s)",
+        file=sys.stderr,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """Remove the socket of a daemon that is gone, but fail if one is listening."""
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            os.unlink(socket_path)
+            return
+    raise _exceptions.MarkItDownException(
+        f"A daemon is already listening on {socket_path}"
+    )
@@ -0,0 +1,251 @@
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional, Tuple, TYPE_CHECKING
+
+from .__about__ import __version__
+from ._cache import UNKEYED_OPTIONS, _option_value
+
+# Break otherwise circular import for type hinting
+if TYPE_CHECKING:
+    from ._markitdown import MarkItDown
+
+# The manifest of a directory conversion, in its output directory
+MANIFEST_NAME = ".markitdown-manifest.json"
+MANIFEST_FORMAT = 1
+
+# How often the manifest is saved during a conversion, so that an interrupted run
+# does not lose its progress
+MANIFEST_SAVE_INTERVAL = 30.0  # Seconds
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(kw_only=True)
+class DirectoryConversionSummary:
+    """The outcome of MarkItDown.convert_directory()."""
+
+    converted: int = 0  # New or changed files, converted by this run
+    unchanged: int = 0  # Files skipped, as they were converted by an earlier run
+    removed: int = 0  # Outputs removed, as their files no longer exist
+    # Files that failed to convert (in this run, or unchanged since a failed one),
+    # by path relative to the source directory, with their errors
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+def output_path(relative_path: str) -> str:
+    """
+    Where the markdown of a file goes, relative to the output directory: the path
+    of the file with ".md" appended (so that, e.g., a.pdf and a.docx do not clash).
+    """
+    return relative_path + ".md"
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _walk(source_dir: str) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """The files under source_dir (path relative to it, path, stat)."""
+    # (directory, its path relative to source_dir, with a trailing "/" unless empty)
+    stack = [(source_dir, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, prefix + entry.name + "/"))
+                elif entry.is_file():
+                    yield prefix + entry.name, entry.path, entry.stat()
+            except OSError:
+                continue
+
+
+def _settings(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    A description of options that is the same from one run to the next: objects
+    (e.g., an LLM client) are described by their type, as in cache keys.
+    """
+    return {
+        key: _option_value(value)
+        for key, value in options.items()
+        if key not in UNKEYED_OPTIONS
+    }
+
+
+def _load_manifest(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            manifest = json.load(fh)
+        if isinstance(manifest, dict) and manifest.get("format") == MANIFEST_FORMAT:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _save_manifest(path: str, manifest: Dict[str, Any]) -> None:
+    # Written aside, then moved in place, so that it is never left half-written
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        # (dumps() encodes in C, unlike dump(), which is several times slower)
+        fh.write(json.dumps(manifest, separators=(",", ":")))
+    os.replace(tmp_path, path)
+
+
+def convert_directory(
+    markitdown: "MarkItDown",
+    source_dir: str,
+    output_dir: str,
+    *,
+    workers: Optional[int] = None,
+    retry_failed: bool = False,
+    init_kwargs: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> DirectoryConversionSummary:
+    """See MarkItDown.convert_directory()"""
+    source_dir = os.path.abspath(source_dir)
+    output_dir = os.path.abspath(output_dir)
+    if not os.path.isdir(source_dir):
+        raise NotADirectoryError(f"Not a directory: {source_dir}")
+    # (Otherwise, outputs would be converted as files of the source directory, or
+    # the source files taken for outputs)
+    real_source_dir = os.path.realpath(source_dir)
+    real_output_dir = os.path.realpath(output_dir)
+    if os.path.commonpath([real_source_dir, real_output_dir]) in (
+        real_source_dir,
+        real_output_dir,
+    ):
+        raise ValueError(
+            f"The output directory ({output_dir}) and the source directory "
+            f"({source_dir}) must not be the same, or inside one another"
+        )
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Outputs are only reused if converted by the same version, with the same options
+    settings = {
+        "markitdown": __version__,
+        "init_kwargs": _settings(init_kwargs or {}),
+        "kwargs": _settings(kwargs),
+    }
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    previous = _load_manifest(manifest_path)
+    previous_files: Dict[str, Dict[str, Any]] = previous.get("files", {})
+    reusable = previous_files if previous.get("settings") == settings else {}
+    files: Dict[str, Dict[str, Any]] = {}
+    manifest = {"format": MANIFEST_FORMAT, "settings": settings, "files": files}
+    summary = DirectoryConversionSummary()
+
+    def is_done(entry: Dict[str, Any]) -> bool:
+        if "error" in entry:
+            return not retry_failed
+        # Entries saved while their conversion was pending have neither
+        return "output" in entry and os.path.exists(
+            os.path.join(output_dir, entry["output"])
+        )
+
+    def keep(relative: str, entry: Dict[str, Any]) -> None:
+        files[relative] = entry
+        summary.unchanged += 1
+        if "error" in entry:
+            summary.failed[relative] = entry["error"]
+
+    # Absolute path -> path relative to source_dir, of the files being converted
+    pending: Dict[str, str] = {}
+
+    def to_convert() -> Iterator[str]:
+        for relative, path, stat in _walk(source_dir):
+            old = reusable.get(relative)
+            # The size and modification time tell unchanged files apart, without
+            # reading them
+            if (
+                old is not None
+                and old["size"] == stat.st_size
+                and old["mtime_ns"] == stat.st_mtime_ns
+                and is_done(old)
+            ):
+                keep(relative, old)
+                continue
+
+            try:
+                digest = _sha256(path)
+            except OSError as e:
+                files[relative] = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "sha256": None,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+                summary.failed[relative] = files[relative]["error"]
+                continue
+            entry = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": digest,
+            }
+
+            # Touched (or copied over), but with the same content
+            if old is not None and old["sha256"] == digest and is_done(old):
+                keep(relative, {**old, **entry})
+                continue
+
+            files[relative] = entry
+            pending[path] = relative
+            yield path
+
+    last_save = time.monotonic()
+    for result in markitdown.convert_many(
+        to_convert(), workers=workers, ordered=False, **kwargs
+    ):
+        if time.monotonic() - last_save > MANIFEST_SAVE_INTERVAL:
+            _save_manifest(manifest_path, manifest)
+            last_save = time.monotonic()
+
+        relative = pending.pop(result.source)
+        entry = files[relative]
+        output = output_path(relative)
+        destination = os.path.join(output_dir, output)
+        if result.ok:
+            assert result.result is not None
+            try:
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                with open(destination, "w", encoding="utf-8") as fh:
+                    fh.write(result.result.markdown)
+                entry["output"] = output
+                summary.converted += 1
+                continue
+            except OSError as e:
+                error = f"{type(e).__name__}: {e}"
+        else:
+            error = f"{type(result.exception).__name__}: {result.exception}"
+        entry["error"] = error
+        summary.failed[relative] = error
+        # The output of an earlier version of the file is no longer valid
+        if os.path.exists(destination):
+            os.remove(destination)
+
+    # The outputs of files that are gone
+    for relative, old in previous_files.items():
+        if relative in files or "output" not in old:
+            continue
+        destination = os.path.join(output_dir, old["output"])
+        if os.path.exists(destination):
+            os.remove(destination)
+            summary.removed += 1
+
+    _save_manifest(manifest_path, manifest)
+    return summary
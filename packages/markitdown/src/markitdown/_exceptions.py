@@ -1,3 +1,4 @@
+import traceback
 from typing import Optional, List, Any
 
 MISSING_DEPENDENCY_MESSAGE = """{converter} recognized the input as a potential {extension} file, but the dependencies needed to read {extension} files have not been installed. To resolve this error, include the optional dependency [{feature}] or [all] when installing MarkItDown. For example:
@@ -48,6 +49,18 @@ class FailedConversionAttempt(object):
         self.converter = converter
         self.exc_info = exc_info
 
+        # The traceback is kept, but not the local variables of its frames, which
+        # would keep the buffers of the failed conversion (e.g., the whole content of
+        # the file, or a parsed document) alive for as long as the exception
+        if exc_info is not None:
+            exc: Optional[BaseException] = exc_info[1]
+            seen = set()
+            while exc is not None and id(exc) not in seen:
+                seen.add(id(exc))
+                if exc.__traceback__ is not None:
+                    traceback.clear_frames(exc.__traceback__)
+                exc = exc.__cause__ or exc.__context__
+
 
 class FileConversionException(MarkItDownException):
     """
@@ -74,3 +87,47 @@ class FileConversionException(MarkItDownException):
                         message += f" - {type(attempt.converter).__name__} threw {attempt.exc_info[0].__name__} with message: {attempt.exc_info[1]}\n"
 
         super().__init__(message)
+
+
+class ConversionCancelledException(MarkItDownException):
+    """
+    Thrown when a conversion is cancelled before it completes (e.g., because
+    the asyncio task awaiting it was cancelled). Unlike other exceptions raised
+    by converters, it is not caught and recorded as a failed attempt: it ends the
+    conversion immediately.
+    """
+
+    pass
+
+
+class InputTooLargeException(MarkItDownException):
+    """
+    Thrown when the input to be buffered (e.g., a non-seekable stream, or the body
+    of an HTTP response) is larger than the `max_input_size` set on MarkItDown.
+    It is raised as soon as the limit is known to be exceeded, before the rest of
+    the input is read.
+    """
+
+    pass
+
+
+class ConversionTimeoutException(MarkItDownException):
+    """
+    Thrown when a conversion does not complete within the time allowed to it: the
+    `conversion_timeout` of a MarkItDown instance converting in worker processes
+    (whose worker is then killed), or the `deadline` option of a conversion, when
+    it passes before any output could be returned. Like ConversionCancelledException,
+    it is not caught and recorded as a failed attempt.
+    """
+
+    pass
+
+
+class ResourceLimitException(MarkItDownException):
+    """
+    Thrown when a conversion uses more resources than allowed to it (e.g., more
+    memory than the `max_worker_memory` of a MarkItDown instance converting in
+    worker processes, whose worker is then killed).
+    """
+
+    pass
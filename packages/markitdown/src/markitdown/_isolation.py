@@ -0,0 +1,344 @@
+import io
+import multiprocessing
+import os
+import pickle
+import queue
+import signal
+import threading
+import time
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from ._base_converter import DocumentConverterResult
+from ._batch import _init_worker, _picklable_exception
+from ._cancellation import raise_if_cancelled
+from ._exceptions import (
+    ConversionTimeoutException,
+    MarkItDownException,
+    ResourceLimitException,
+)
+from ._stream_info import StreamInfo
+
+# Workers are replaced after this many conversions, so that memory lost to
+# fragmentation or leaks (e.g., in native libraries) does not accumulate
+DEFAULT_MAX_CONVERSIONS_PER_WORKER = 100
+
+# How often the parent checks the deadline, memory use and cancellation of the
+# conversions it is waiting for
+POLL_INTERVAL = 0.05  # Seconds
+
+# Options that cannot be sent to a worker process: they are honored by the parent
+_LOCAL_OPTIONS = {"budget", "cancel_event", "tracer", "trace_parent", "sniff"}
+
+# The arguments of MarkItDown that configure isolation, which its workers (and
+# those of convert_many()) do not inherit
+ISOLATION_INIT_KWARGS = {
+    "isolation",
+    "isolation_workers",
+    "conversion_timeout",
+    "max_worker_memory",
+    "max_conversions_per_worker",
+}
+
+# Arguments of MarkItDown that are honored by the parent (callbacks are not called
+# across processes, and the cache is shared by the conversions of all the workers)
+_PARENT_INIT_KWARGS = ISOLATION_INIT_KWARGS | {
+    "cache",
+    "stats_callback",
+    "instrumentation_callback",
+    "tracer",
+}
+
+# How long a worker is left to return the partial output of a conversion past its
+# `deadline` option (see remaining_time()), before it is killed as hung
+DEADLINE_GRACE_PERIOD = 2.0  # Seconds
+
+# How worker processes are started. They are not forked from this process, which
+# may be running other threads (e.g., other conversions, when a worker is replaced)
+# whose locks would be copied, held, into the worker.
+START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+_READY = "ready"
+
+_page_size: Optional[int] = None
+
+
+def _rss(pid: int) -> Optional[int]:
+    """The resident memory of a process, in bytes, where the platform reports it."""
+    global _page_size
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as fh:
+            resident_pages = int(fh.read().split()[1])
+        if _page_size is None:
+            _page_size = os.sysconf("SC_PAGE_SIZE")
+        return resident_pages * _page_size
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _worker_main(conn: Any, init_kwargs: Dict[str, Any]) -> None:
+    """The loop of a worker process: convert requests until told to stop."""
+    from . import _batch
+
+    # Interrupting the parent (e.g., Ctrl+C) stops the workers through it
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    _init_worker(init_kwargs)
+    markitdown = _batch._worker_markitdown
+    assert markitdown is not None
+    conn.send(_READY)
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+
+        source, stream_info, kwargs = request
+        result: Optional[DocumentConverterResult] = None
+        exc: Optional[BaseException] = None
+        try:
+            if isinstance(source, str):
+                result = markitdown.convert_local(
+                    source, stream_info=stream_info, **kwargs
+                )
+            else:
+                result = markitdown.convert_stream(
+                    io.BytesIO(source), stream_info=stream_info, **kwargs
+                )
+        except Exception as e:
+            exc = _picklable_exception(e)
+        conn.send((result, exc))
+
+
+class _Worker:
+    """A worker process, and its end of the pipe to it."""
+
+    def __init__(self, context: Any, init_kwargs: Dict[str, Any]):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, init_kwargs),
+            name="markitdown-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.conversions = 0
+
+    def wait_ready(self) -> None:
+        """Wait for the worker to be warmed up (which is not part of any deadline)."""
+        if self.ready:
+            return
+        try:
+            message = self.conn.recv()
+        except (EOFError, OSError):
+            message = None
+        if message != _READY:
+            self.kill()
+            raise MarkItDownException(
+                f"A worker process failed to start (exit code {self.process.exitcode})"
+            )
+        self.ready = True
+
+    def stop(self) -> None:
+        """Ask the worker to exit, once it is idle."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class IsolatedPool:
+    """
+    Runs conversions in a pool of worker processes (see the `isolation` option of
+    MarkItDown). The workers are started, and warmed up, ahead of the conversions,
+    and each converts one document at a time, so that a conversion that hangs, or
+    uses too much memory, can be stopped by killing its worker, without affecting the
+    others, or the calling process. Killed workers are replaced, as are workers that
+    reached max_conversions_per_worker.
+
+    convert() may be called from several threads: each call waits for an idle worker.
+    """
+
+    def __init__(
+        self,
+        init_kwargs: Dict[str, Any],
+        *,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_memory: Optional[int] = None,
+        max_conversions_per_worker: Optional[int] = DEFAULT_MAX_CONVERSIONS_PER_WORKER,
+    ):
+        self._init_kwargs = {
+            key: value
+            for key, value in init_kwargs.items()
+            if key not in _PARENT_INIT_KWARGS
+        }
+        self._workers = workers or os.cpu_count() or 1
+        if self._workers < 1:
+            raise ValueError(f"workers must be at least 1, got {self._workers}")
+        self._timeout = timeout
+        self._max_memory = max_memory
+        self._max_conversions = max_conversions_per_worker
+        try:
+            pickle.dumps(self._init_kwargs)
+        except Exception as e:
+            raise ValueError(
+                f"The arguments of MarkItDown must be picklable to isolate conversions: {e}"
+            ) from e
+        self._context = multiprocessing.get_context(START_METHOD)
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._all: List[_Worker] = []
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        for _ in range(self._workers):
+            self._idle.put(self._start_worker())
+
+    def _start_worker(self) -> _Worker:
+        worker = _Worker(self._context, self._init_kwargs)
+        with self._lock:
+            self._all.append(worker)
+        return worker
+
+    def _retire(self, worker: _Worker, *, kill: bool) -> None:
+        """Stop (or kill) a worker, and start its replacement, unless closed."""
+        with self._lock:
+            if worker in self._all:
+                self._all.remove(worker)
+        if kill:
+            worker.kill()
+        else:
+            worker.stop()
+        if not self._closed:
+            self._idle.put(self._start_worker())
+
+    def convert(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        kwargs: Dict[str, Any],
+    ) -> DocumentConverterResult:
+        """
+        Convert a stream in a worker. Local files (with a local_path) are read by the
+        worker; other streams are read here, and sent to it.
+        """
+        if self._closed:
+            raise MarkItDownException("The worker processes were shut down")
+
+        source: Any
+        path = stream_info.local_path
+        if path is not None and getattr(file_stream, "name", None) == path:
+            source = path
+        else:
+            source = file_stream.read()
+        options = {
+            key: value
+            for key, value in kwargs.items()
+            if key not in _LOCAL_OPTIONS and not key.startswith("_")
+        }
+
+        while True:
+            if self._closed:
+                raise MarkItDownException("The worker processes were shut down")
+            try:
+                worker = self._idle.get(timeout=1.0)
+                break
+            except queue.Empty:
+                continue
+        try:
+            worker.wait_ready()
+        except MarkItDownException:
+            self._retire(worker, kill=True)
+            raise
+
+        result, exc = self._run(worker, (source, stream_info, options), kwargs)
+        worker.conversions += 1
+        if self._exceeds_memory(worker) or (
+            self._max_conversions is not None
+            and worker.conversions >= self._max_conversions
+        ):
+            self._retire(worker, kill=False)
+        else:
+            self._idle.put(worker)
+
+        if exc is not None:
+            raise exc
+        assert result is not None
+        return result
+
+    def _exceeds_memory(self, worker: _Worker) -> bool:
+        if self._max_memory is None:
+            return False
+        rss = _rss(worker.process.pid)  # type: ignore[arg-type]
+        return rss is not None and rss > self._max_memory
+
+    def _run(
+        self, worker: _Worker, request: Tuple, kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[DocumentConverterResult], Optional[BaseException]]:
+        """
+        Send a request to a worker, and wait for its outcome, within the limits. A
+        conversion with a `deadline` option that comes first is left to stop at its
+        deadline, and return its partial output, for DEADLINE_GRACE_PERIOD seconds
+        after it, even past the timeout of the pool. (The deadline is a
+        time.monotonic() timestamp, which the workers share with this process.)
+        """
+        limit = None if self._timeout is None else time.monotonic() + self._timeout
+        message = f"The conversion did not complete within {self._timeout} seconds"
+        deadline = kwargs.get("deadline")
+        if deadline is not None and (limit is None or deadline < limit):
+            limit = deadline + DEADLINE_GRACE_PERIOD
+            message = (
+                f"The conversion did not stop within {DEADLINE_GRACE_PERIOD} seconds "
+                "of its deadline"
+            )
+        # (Cancellation is checked here, but the deadline is left to the worker)
+        cancellation = {"cancel_event": kwargs.get("cancel_event")}
+        try:
+            worker.conn.send(request)
+            while not worker.conn.poll(POLL_INTERVAL):
+                if limit is not None and time.monotonic() > limit:
+                    self._retire(worker, kill=True)
+                    raise ConversionTimeoutException(message)
+                if self._exceeds_memory(worker):
+                    self._retire(worker, kill=True)
+                    raise ResourceLimitException(
+                        f"The conversion used more than {self._max_memory} bytes of memory"
+                    )
+                try:
+                    raise_if_cancelled(cancellation)
+                except MarkItDownException:
+                    self._retire(worker, kill=True)
+                    raise
+            return worker.conn.recv()
+        except (EOFError, OSError):
+            # The worker died (e.g., it was killed by the system for its memory use)
+            worker.process.join()
+            exitcode = worker.process.exitcode
+            self._retire(worker, kill=True)
+            if exitcode == -signal.SIGKILL:
+                raise ResourceLimitException(
+                    "The worker process was killed during the conversion (e.g., for its memory use)"
+                )
+            raise MarkItDownException(
+                f"The worker process died during the conversion (exit code {exitcode})"
+            )
+
+    def close(self) -> None:
+        """Stop the workers. Conversions in progress are killed."""
+        self._closed = True
+        with self._lock:
+            workers, self._all = self._all, []
+        for worker in workers:
+            worker.kill()
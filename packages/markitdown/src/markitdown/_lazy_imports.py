@@ -0,0 +1,122 @@
+import importlib
+import importlib.util
+import sys
+import threading
+import warnings
+from types import ModuleType
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
+
+_import_lock = threading.Lock()
+
+# Cache of find_spec() probes, keyed by top-level package name
+_available: Dict[str, bool] = {}
+
+
+class LazyModule:
+    """
+    A stand-in for an optional dependency, which is imported on first use.
+
+    Many converters depend on heavy optional packages (pandas, pdfminer, python-pptx,
+    the Azure SDK, etc.). Importing them all up-front makes even a trivial conversion
+    pay for every one of them. A LazyModule defers the import until an attribute of
+    the module is first accessed, e.g.:
+
+        pdfminer = LazyModule("pdfminer", "pdfminer.high_level")
+        ...
+        pdfminer.high_level.extract_text(file_stream)
+
+    Converters should call dependency_exc_info() before first use, so that a missing
+    dependency can be reported with a helpful MissingDependencyException.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *submodules: str,
+        ignore_warnings: Sequence[Type[Warning]] = (),
+    ):
+        """
+        Parameters:
+        - name: The name of the module to import (e.g., "pandas").
+        - submodules: Any submodules that must also be imported (e.g., "pdfminer.high_level").
+        - ignore_warnings: Categories of warnings to suppress while importing.
+        """
+        self.__name = name
+        self.__submodules = submodules
+        self.__ignore_warnings = ignore_warnings
+        self.__module: Optional[ModuleType] = None
+        self.__exc_info: Optional[Tuple] = None
+
+    def __getattr__(self, attr: str) -> Any:
+        exc_info = self._load()
+        if exc_info is not None:
+            raise exc_info[1].with_traceback(exc_info[2])
+        return getattr(self.__module, attr)
+
+    def __repr__(self) -> str:
+        return f"<LazyModule '{self.__name}'>"
+
+    def _is_available(self) -> bool:
+        """Check if the module is installed, without importing it."""
+        return self._missing_package() is None
+
+    def _missing_package(self) -> Optional[str]:
+        """Return the name of the first top-level package that is not installed, if any."""
+        for name in (self.__name,) + self.__submodules:
+            package = name.split(".")[0]
+            if package not in _available:
+                _available[package] = importlib.util.find_spec(package) is not None
+            if not _available[package]:
+                return package
+        return None
+
+    def _load(self) -> Optional[Tuple]:
+        """
+        Import the module (once). Return None on success, or the exc_info of the
+        ImportError, which is preserved so it can be reported on each use.
+        """
+        if self.__module is not None or self.__exc_info is not None:
+            return self.__exc_info
+
+        with _import_lock:
+            if self.__module is None and self.__exc_info is None:
+                try:
+                    # Skip the import machinery for packages that are not installed
+                    missing_package = self._missing_package()
+                    if missing_package is not None:
+                        raise ModuleNotFoundError(
+                            f"No module named '{missing_package}'", name=missing_package
+                        )
+
+                    with warnings.catch_warnings():
+                        for category in self.__ignore_warnings:
+                            warnings.filterwarnings("ignore", category=category)
+                        for submodule in self.__submodules:
+                            importlib.import_module(submodule)
+                        self.__module = importlib.import_module(self.__name)
+                except ImportError:
+                    # Preserve the error and stack trace for later
+                    self.__exc_info = sys.exc_info()
+
+        return self.__exc_info
+
+
+def is_available(*modules: LazyModule) -> bool:
+    """
+    Probe whether all the given optional dependencies are installed, using
+    importlib.util.find_spec(). Nothing is imported.
+    """
+    return all(module._is_available() for module in modules)
+
+
+def dependency_exc_info(*modules: LazyModule) -> Optional[Tuple]:
+    """
+    Import the given optional dependencies, if they have not been imported already.
+    Return None if all were imported successfully. Otherwise, return the exc_info of
+    the first failed import, to be chained to a MissingDependencyException.
+    """
+    for module in modules:
+        exc_info = module._load()
+        if exc_info is not None:
+            return exc_info
+    return None
@@ -1,23 +1,51 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
 import mimetypes
 import os
 import re
 import sys
 import shutil
+import threading
+import time
 import traceback
+import weakref
 import io
 from dataclasses import dataclass
 from importlib.metadata import entry_points
-from typing import Any, List, Dict, Optional, Union, BinaryIO
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    List,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Union,
+    BinaryIO,
+    ContextManager,
+    Mapping,
+    NoReturn,
+    Tuple,
+    TYPE_CHECKING,
+)
 from pathlib import Path
 from urllib.parse import urlparse
 from warnings import warn
 import requests
-import magika
 import charset_normalizer
 import codecs
 
 from ._stream_info import StreamInfo
-from ._uri_utils import parse_data_uri, file_uri_to_path
+from ._uri_utils import iter_data_uri, file_uri_to_path
+from ._lazy_imports import LazyModule, is_available
+from ._cancellation import deadline_passed, raise_if_cancelled, remaining_time
+from ._sniff import SniffContext
+from ._budget import OutputBudget
+from ._probe import ProbeResult, estimate_cost
 
 from .converters import (
     PlainTextConverter,
@@ -42,13 +70,47 @@ from .converters import (
 )
 
 from ._base_converter import DocumentConverter, DocumentConverterResult
+from ._converter_index import ConverterIndex
+from ._batch import BatchConversionResult, BatchSource, convert_many
+from ._directory import DirectoryConversionSummary, convert_directory
+from ._isolation import (
+    DEFAULT_MAX_CONVERSIONS_PER_WORKER,
+    ISOLATION_INIT_KWARGS,
+    IsolatedPool,
+)
+from ._cache import ConversionCache, cache_key, converters_fingerprint
+from ._normalize import MarkdownNormalizer
+from ._stats import (
+    ConversionStats,
+    ConverterAttempt,
+    record_outcome,
+    stage,
+    time_fragments,
+)
+from ._tracing import NoOpTracer, Tracer, trace_span
+from ._buffer import (
+    DEFAULT_SPOOL_MAX_MEMORY,
+    READ_SIZE,
+    CountingStream,
+    content_length,
+    open_local,
+    read_chunks,
+    spool,
+    spool_async,
+)
 
 from ._exceptions import (
     FileConversionException,
     UnsupportedFormatException,
     FailedConversionAttempt,
+    ConversionCancelledException,
+    ConversionTimeoutException,
 )
 
+# Optional dependency, used for non-blocking HTTP requests in convert_uri_async().
+# When it is not installed, requests are made with `requests` in the async executor.
+httpx = LazyModule("httpx")
+
 
 # Lower priority values are tried first.
 PRIORITY_SPECIFIC_FILE_FORMAT = (
@@ -60,28 +122,134 @@ PRIORITY_GENERIC_FILE_FORMAT = (
 
 
 _plugins: Union[None, List[Any]] = None  # If None, plugins have not been loaded yet.
+_plugins_lock = threading.Lock()
 
 
 def _load_plugins() -> Union[None, List[Any]]:
-    """Lazy load plugins, exiting early if already loaded."""
+    """Lazy load plugins, exiting early if already loaded. Thread-safe."""
     global _plugins
 
     # Skip if we've already loaded plugins
     if _plugins is not None:
         return _plugins
 
-    # Load plugins
-    _plugins = []
-    for entry_point in entry_points(group="markitdown.plugin"):
-        try:
-            _plugins.append(entry_point.load())
-        except Exception:
-            tb = traceback.format_exc()
-            warn(f"Plugin '{entry_point.name}' failed to load ... skipping:\n{tb}")
+    with _plugins_lock:
+        # Another thread may have loaded the plugins while we were waiting for the lock
+        if _plugins is None:
+            plugins = []
+            for entry_point in entry_points(group="markitdown.plugin"):
+                try:
+                    plugins.append(entry_point.load())
+                except Exception:
+                    tb = traceback.format_exc()
+                    warn(
+                        f"Plugin '{entry_point.name}' failed to load ... skipping:\n{tb}"
+                    )
+            _plugins = plugins
 
     return _plugins
 
 
+# Magika (and onnxruntime) are slow to import, so they are imported on first use
+if TYPE_CHECKING:
+    import magika
+
+# The Magika model is loaded on first use, and shared by all MarkItDown instances in the process.
+_magika: Union[None, "magika.Magika"] = None
+_magika_lock = threading.Lock()
+
+
+def _get_magika(
+    instrumentation_callback: Optional[Callable[[str, float], None]] = None,
+) -> "magika.Magika":
+    """Lazy load the Magika model, exiting early if already loaded. Thread-safe."""
+    global _magika
+
+    # Skip if we've already loaded the model
+    if _magika is not None:
+        return _magika
+
+    with _magika_lock:
+        # Another thread may have loaded the model while we were waiting for the lock
+        if _magika is None:
+            start = time.perf_counter()
+            import magika
+
+            _magika = magika.Magika()
+            if instrumentation_callback is not None:
+                instrumentation_callback("magika_load", time.perf_counter() - start)
+
+    return _magika
+
+
+# Converter work scheduled by the *_async methods runs on this executor, unless a
+# different one is passed to the MarkItDown constructor (see `async_executor`). It is
+# shared by all MarkItDown instances in the process, so that the number of concurrent
+# conversions stays bounded, even when an instance is created per request.
+DEFAULT_ASYNC_MAX_WORKERS = os.cpu_count() or 1
+
+_async_executor: Union[None, concurrent.futures.Executor] = None
+_async_executor_lock = threading.Lock()
+
+
+def _get_async_executor() -> concurrent.futures.Executor:
+    """Lazily create the shared executor used for async conversions. Thread-safe."""
+    global _async_executor
+
+    if _async_executor is not None:
+        return _async_executor
+
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=DEFAULT_ASYNC_MAX_WORKERS,
+                thread_name_prefix="markitdown",
+            )
+
+    return _async_executor
+
+
+def _call_accepts(
+    converter: DocumentConverter,
+    file_stream: BinaryIO,
+    stream_info: StreamInfo,
+    kwargs: Dict[str, Any],
+) -> bool:
+    """Check if the converter accepts the stream (converters may not implement accepts())."""
+    try:
+        return converter.accepts(file_stream, stream_info, **kwargs)
+    except NotImplementedError:
+        return False
+
+
+class _Attempts:
+    """
+    The failed attempts of a conversion, so that a converter is not tried again under
+    a guess that it already failed with, nor, if it failed because of the content
+    itself (see DocumentConverter.content_failure_types), under any other guess.
+    """
+
+    def __init__(self) -> None:
+        self._failed: Set[Tuple[int, StreamInfo]] = set()
+        self._exhausted: Set[int] = set()
+
+    def should_try(self, converter: DocumentConverter, stream_info: StreamInfo) -> bool:
+        return (
+            id(converter) not in self._exhausted
+            and (id(converter), stream_info) not in self._failed
+        )
+
+    def failed(
+        self,
+        converter: DocumentConverter,
+        stream_info: StreamInfo,
+        error: BaseException,
+    ) -> None:
+        self._failed.add((id(converter), stream_info))
+        if converter.is_content_failure(error):
+            self._exhausted.add(id(converter))
+
+
 @dataclass(kw_only=True, frozen=True)
 class ConverterRegistration:
     """A registration of a converter with its priority and other metadata."""
@@ -92,7 +260,12 @@ class ConverterRegistration:
 
 class MarkItDown:
     """(In preview) An extremely simple text-based document reader, suitable for LLM use.
-    This reader will convert common file-types or webpages to Markdown."""
+    This reader will convert common file-types or webpages to Markdown.
+
+    An instance may be shared by several threads, which may convert concurrently, and
+    register converters while other threads convert (a conversion uses the converters
+    registered when it started). This relies on converters being reentrant (see
+    DocumentConverter), which the built-in converters are."""
 
     def __init__(
         self,
@@ -104,13 +277,65 @@ class MarkItDown:
         self._builtins_enabled = False
         self._plugins_enabled = False
 
+        # Kept so that convert_many() can build equivalent instances in worker processes
+        self._init_kwargs: Dict[str, Any] = dict(kwargs)
+
         requests_session = kwargs.get("requests_session")
         if requests_session is None:
             self._requests_session = requests.Session()
         else:
             self._requests_session = requests_session
 
-        self._magika = magika.Magika()
+        # Called with (event name, duration in seconds) for instrumented operations.
+        # Events are "magika_load" and "magika_identify".
+        self._instrumentation_callback: Optional[
+            Callable[[str, float], None]
+        ] = kwargs.get("instrumentation_callback")
+
+        # Per-conversion stats (see ConversionStats) are collected when collect_stats
+        # is True, either here or as a conversion option, and passed to the
+        # stats_callback, if any (which implies collect_stats=True).
+        self._stats_callback: Optional[Callable[[ConversionStats], None]] = kwargs.get(
+            "stats_callback"
+        )
+        self._collect_stats: bool = (
+            kwargs.get("collect_stats", False) or self._stats_callback is not None
+        )
+
+        # Records the stages of conversions as spans (see Tracer). With the default
+        # NoOpTracer, tracing is skipped altogether.
+        tracer: Optional[Tracer] = kwargs.get("tracer")
+        self._tracer: Optional[Tracer] = (
+            None if isinstance(tracer, NoOpTracer) else tracer
+        )
+
+        # Executor for the converter work scheduled by the *_async methods. Its size
+        # bounds the number of conversions that run concurrently. Defaults to an
+        # executor shared by all instances (see DEFAULT_ASYNC_MAX_WORKERS).
+        self._async_executor: Optional[concurrent.futures.Executor] = kwargs.get(
+            "async_executor"
+        )
+
+        # Optional cache of conversion results (see ConversionCache)
+        self._cache: Optional[ConversionCache] = kwargs.get("cache")
+        # The fingerprint of the registered converters, and the index it was taken of
+        self._converters_fingerprint: Optional[Tuple[ConverterIndex, str]] = None
+
+        # Optional httpx.AsyncClient, used by convert_uri_async()
+        self._async_http_client: Any = kwargs.get("async_http_client")
+
+        # Input that is not seekable (streams, HTTP response bodies, data URIs) is
+        # buffered in memory up to spool_max_memory bytes, and in a temporary file
+        # beyond that. If max_input_size is set, larger inputs are rejected with an
+        # InputTooLargeException.
+        self._spool_max_memory: int = kwargs.get(
+            "spool_max_memory", DEFAULT_SPOOL_MAX_MEMORY
+        )
+        self._max_input_size: Optional[int] = kwargs.get("max_input_size")
+
+        # Page-parallel extraction of PDFs (see PdfConverter), unless set per conversion
+        self._pdf_workers: Optional[int] = kwargs.get("pdf_workers")
+        self._pdf_pages_per_chunk: Optional[int] = kwargs.get("pdf_pages_per_chunk")
 
         # TODO - remove these (see enable_builtins)
         self._llm_client: Any = None
@@ -118,8 +343,12 @@ class MarkItDown:
         self._exiftool_path: Union[str | None] = None
         self._style_map: Union[str | None] = None
 
-        # Register the converters
+        # Register the converters. Registration replaces the list and its index (rather
+        # than changing them in place), so that conversions running in other threads
+        # keep consistent views of the converters.
         self._converters: List[ConverterRegistration] = []
+        self._converter_index = ConverterIndex()
+        self._registration_lock = threading.RLock()
 
         if (
             enable_builtins is None or enable_builtins
@@ -129,96 +358,248 @@ class MarkItDown:
         if enable_plugins:
             self.enable_plugins(**kwargs)
 
+        # With isolation="process", conversions run in a pool of worker processes
+        # (see IsolatedPool), each with a MarkItDown instance built with the same
+        # arguments. A conversion that runs for longer than conversion_timeout
+        # seconds, or whose worker uses more than max_worker_memory bytes, is stopped
+        # by killing its worker, and raises a ConversionTimeoutException, or a
+        # ResourceLimitException. Workers are replaced after
+        # max_conversions_per_worker conversions. Converters registered after
+        # construction are not registered in the workers, which are started afresh
+        # (see _isolation.START_METHOD), and sent the arguments, which must be picklable.
+        self._isolated_pool: Optional[IsolatedPool] = None
+        isolation = kwargs.get("isolation")
+        if isolation == "process":
+            init_kwargs = self._worker_init_kwargs()
+            init_kwargs["collect_stats"] = self._collect_stats
+            self._isolated_pool = IsolatedPool(
+                init_kwargs,
+                workers=kwargs.get("isolation_workers"),
+                timeout=kwargs.get("conversion_timeout"),
+                max_memory=kwargs.get("max_worker_memory"),
+                max_conversions_per_worker=kwargs.get(
+                    "max_conversions_per_worker", DEFAULT_MAX_CONVERSIONS_PER_WORKER
+                ),
+            )
+            weakref.finalize(self, self._isolated_pool.close)
+        elif isolation is not None:
+            raise ValueError(f"Unknown isolation: {isolation!r}")
+
+    def _worker_init_kwargs(self) -> Dict[str, Any]:
+        """The arguments of equivalent instances, for worker processes."""
+        init_kwargs = {
+            key: value
+            for key, value in self._init_kwargs.items()
+            if key not in ISOLATION_INIT_KWARGS
+        }
+        init_kwargs["enable_builtins"] = self._builtins_enabled
+        init_kwargs["enable_plugins"] = self._plugins_enabled
+        return init_kwargs
+
+    def close(self) -> None:
+        """
+        Release the resources held by this instance: the worker processes, if
+        conversions are isolated (see the isolation option). They are otherwise
+        released when the instance is garbage collected.
+        """
+        if self._isolated_pool is not None:
+            self._isolated_pool.close()
+
     def enable_builtins(self, **kwargs) -> None:
         """
         Enable and register built-in converters.
         Built-in converters are enabled by default.
         This method should only be called once, if built-ins were initially disabled.
         """
-        if not self._builtins_enabled:
-            # TODO: Move these into converter constructors
-            self._llm_client = kwargs.get("llm_client")
-            self._llm_model = kwargs.get("llm_model")
-            self._exiftool_path = kwargs.get("exiftool_path")
-            self._style_map = kwargs.get("style_map")
-
-            if self._exiftool_path is None:
-                self._exiftool_path = os.getenv("EXIFTOOL_PATH")
-
-            # Still none? Check well-known paths
-            if self._exiftool_path is None:
-                candidate = shutil.which("exiftool")
-                if candidate:
-                    candidate = os.path.abspath(candidate)
-                    if any(
-                        d == os.path.dirname(candidate)
-                        for d in [
-                            "/usr/bin",
-                            "/usr/local/bin",
-                            "/opt",
-                            "/opt/bin",
-                            "/opt/local/bin",
-                            "/opt/homebrew/bin",
-                            "C:\\Windows\\System32",
-                            "C:\\Program Files",
-                            "C:\\Program Files (x86)",
-                        ]
-                    ):
-                        self._exiftool_path = candidate
-
-            # Register converters for successful browsing operations
-            # Later registrations are tried first / take higher priority than earlier registrations
-            # To this end, the most specific converters should appear below the most generic converters
-            self.register_converter(
-                PlainTextConverter(), priority=PRIORITY_GENERIC_FILE_FORMAT
-            )
-            self.register_converter(
-                ZipConverter(markitdown=self), priority=PRIORITY_GENERIC_FILE_FORMAT
-            )
-            self.register_converter(
-                HtmlConverter(), priority=PRIORITY_GENERIC_FILE_FORMAT
-            )
-            self.register_converter(RssConverter())
-            self.register_converter(WikipediaConverter())
-            self.register_converter(YouTubeConverter())
-            self.register_converter(BingSerpConverter())
-            self.register_converter(DocxConverter())
-            self.register_converter(XlsxConverter())
-            self.register_converter(XlsConverter())
-            self.register_converter(PptxConverter())
-            self.register_converter(AudioConverter())
-            self.register_converter(ImageConverter())
-            self.register_converter(IpynbConverter())
-            self.register_converter(PdfConverter())
-            self.register_converter(OutlookMsgConverter())
-            self.register_converter(EpubConverter())
-            self.register_converter(CsvConverter())
-
-            # Register Document Intelligence converter at the top of the stack if endpoint is provided
-            docintel_endpoint = kwargs.get("docintel_endpoint")
-            if docintel_endpoint is not None:
-                docintel_args: Dict[str, Any] = {}
-                docintel_args["endpoint"] = docintel_endpoint
-
-                docintel_credential = kwargs.get("docintel_credential")
-                if docintel_credential is not None:
-                    docintel_args["credential"] = docintel_credential
-
-                docintel_types = kwargs.get("docintel_file_types")
-                if docintel_types is not None:
-                    docintel_args["file_types"] = docintel_types
-
-                docintel_version = kwargs.get("docintel_api_version")
-                if docintel_version is not None:
-                    docintel_args["api_version"] = docintel_version
-
+        with self._registration_lock:
+            if not self._builtins_enabled:
+                # TODO: Move these into converter constructors
+                self._llm_client = kwargs.get("llm_client")
+                self._llm_model = kwargs.get("llm_model")
+                self._exiftool_path = kwargs.get("exiftool_path")
+                self._style_map = kwargs.get("style_map")
+
+                if self._exiftool_path is None:
+                    self._exiftool_path = os.getenv("EXIFTOOL_PATH")
+
+                # Still none? Check well-known paths
+                if self._exiftool_path is None:
+                    candidate = shutil.which("exiftool")
+                    if candidate:
+                        candidate = os.path.abspath(candidate)
+                        if any(
+                            d == os.path.dirname(candidate)
+                            for d in [
+                                "/usr/bin",
+                                "/usr/local/bin",
+                                "/opt",
+                                "/opt/bin",
+                                "/opt/local/bin",
+                                "/opt/homebrew/bin",
+                                "C:\\Windows\\System32",
+                                "C:\\Program Files",
+                                "C:\\Program Files (x86)",
+                            ]
+                        ):
+                            self._exiftool_path = candidate
+
+                # Register converters for successful browsing operations
+                # Later registrations are tried first / take higher priority than earlier registrations
+                # To this end, the most specific converters should appear below the most generic converters
                 self.register_converter(
-                    DocumentIntelligenceConverter(**docintel_args),
+                    PlainTextConverter(), priority=PRIORITY_GENERIC_FILE_FORMAT
                 )
+                self.register_converter(
+                    ZipConverter(markitdown=self), priority=PRIORITY_GENERIC_FILE_FORMAT
+                )
+                self.register_converter(
+                    HtmlConverter(), priority=PRIORITY_GENERIC_FILE_FORMAT
+                )
+                self.register_converter(RssConverter())
+                self.register_converter(WikipediaConverter())
+                self.register_converter(YouTubeConverter())
+                self.register_converter(BingSerpConverter())
+                self.register_converter(DocxConverter())
+                self.register_converter(XlsxConverter())
+                self.register_converter(XlsConverter())
+                self.register_converter(PptxConverter())
+                self.register_converter(AudioConverter())
+                self.register_converter(ImageConverter())
+                self.register_converter(IpynbConverter())
+                self.register_converter(PdfConverter())
+                self.register_converter(OutlookMsgConverter())
+                self.register_converter(EpubConverter())
+                self.register_converter(CsvConverter())
+
+                # Register Document Intelligence converter at the top of the stack if endpoint is provided
+                docintel_endpoint = kwargs.get("docintel_endpoint")
+                if docintel_endpoint is not None:
+                    docintel_args: Dict[str, Any] = {}
+                    docintel_args["endpoint"] = docintel_endpoint
+
+                    docintel_credential = kwargs.get("docintel_credential")
+                    if docintel_credential is not None:
+                        docintel_args["credential"] = docintel_credential
+
+                    docintel_types = kwargs.get("docintel_file_types")
+                    if docintel_types is not None:
+                        docintel_args["file_types"] = docintel_types
+
+                    docintel_version = kwargs.get("docintel_api_version")
+                    if docintel_version is not None:
+                        docintel_args["api_version"] = docintel_version
+
+                    self.register_converter(
+                        DocumentIntelligenceConverter(**docintel_args),
+                    )
 
-            self._builtins_enabled = True
-        else:
-            warn("Built-in converters are already enabled.", RuntimeWarning)
+                self._builtins_enabled = True
+            else:
+                warn("Built-in converters are already enabled.", RuntimeWarning)
+
+    def warmup(self) -> None:
+        """
+        Load resources that are otherwise loaded lazily, on first use (e.g., the Magika
+        model used to identify streams). Servers can call this before reporting that
+        they are ready, so that the first request does not pay the loading cost.
+        The loaded resources are shared by all MarkItDown instances in the process.
+        """
+        _get_magika(self._instrumentation_callback)
+
+    def convert_many(
+        self,
+        sources: Iterable[BatchSource],
+        *,
+        workers: Optional[int] = None,
+        executor: str = "process",
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BatchConversionResult]:
+        """
+        Convert many sources in parallel, yielding a BatchConversionResult for each as it
+        completes. A failed conversion does not stop the batch: its exception is
+        reported on the corresponding BatchConversionResult instead.
+
+        Args:
+            - sources: paths (str or Path), urls, bytes, or binary streams
+            - workers: the number of worker processes or threads. Defaults to os.cpu_count()
+            - executor: "process" (the default) converts in a pool of worker processes,
+              each with its own MarkItDown instance, built once from the arguments this
+              instance was constructed with, and warmed up. Converters registered
+              after construction are not available to the workers, and the
+              constructor arguments must be picklable on platforms that spawn
+              (rather than fork) processes. "thread" converts in a pool of threads
+              sharing this instance, which suits I/O-bound batches (e.g., urls).
+            - ordered: if True (the default), results are yielded in the order of the
+              sources. Otherwise, they are yielded as soon as they complete.
+            - kwargs: additional arguments to pass to the converter
+
+        Paths are passed to worker processes as-is, and read there. Bytes are pickled
+        to worker processes, which copies them into the pipe, and again out of it
+        (memoryviews are first copied to bytes, since they cannot be pickled); a
+        worker then wraps its bytes (without copying them) in a BytesIO. Streams are
+        read in full before being sent to a worker process, since open files cannot
+        be shared. With the "thread" executor, nothing is copied, except bytearrays
+        and memoryviews, which BytesIO copies.
+        """
+        init_kwargs = self._worker_init_kwargs()
+
+        return convert_many(
+            self,
+            sources,
+            workers=workers,
+            executor=executor,
+            ordered=ordered,
+            init_kwargs=init_kwargs,
+            **kwargs,
+        )
+
+    def convert_directory(
+        self,
+        source_dir: Union[str, Path],
+        output_dir: Union[str, Path],
+        *,
+        workers: Optional[int] = None,
+        retry_failed: bool = False,
+        **kwargs: Any,
+    ) -> DirectoryConversionSummary:
+        """
+        Convert every file under source_dir, in parallel (see convert_many()), writing
+        the markdown of each to the same relative path under output_dir, with ".md"
+        appended (e.g., a/b.pdf to a/b.pdf.md).
+
+        A manifest in output_dir (.markitdown-manifest.json) records the size,
+        modification time and SHA-256 of each file, and its output or error, so that
+        later runs only convert new and changed files, and remove the outputs of
+        files that are gone. Files with a new modification time are hashed, and not
+        converted again if their content is unchanged. Everything is converted again
+        if the version of MarkItDown, or the options, changed. (Options that are
+        objects, such as an llm_client, are compared by type.)
+
+        Args:
+            - source_dir: the directory to convert. Symbolic links to directories
+              are not followed.
+            - output_dir: where the markdown goes, created if needed. It must not be
+              source_dir, or be inside it, or contain it (a ValueError is raised).
+            - workers: the number of worker processes. Defaults to os.cpu_count()
+            - retry_failed: if True, files that failed to convert are converted again
+              even if unchanged. Otherwise, they keep their error
+            - kwargs: additional arguments to pass to the converter
+
+        A failed conversion does not stop the others: it is recorded in the manifest,
+        and in the failed files of the returned DirectoryConversionSummary.
+        """
+        init_kwargs = self._worker_init_kwargs()
+
+        return convert_directory(
+            self,
+            str(source_dir),
+            str(output_dir),
+            workers=workers,
+            retry_failed=retry_failed,
+            init_kwargs=init_kwargs,
+            **kwargs,
+        )
 
     def enable_plugins(self, **kwargs) -> None:
         """
@@ -226,19 +607,20 @@ class MarkItDown:
         Plugins are disabled by default.
         This method should only be called once, if plugins were initially disabled.
         """
-        if not self._plugins_enabled:
-            # Load plugins
-            plugins = _load_plugins()
-            assert plugins is not None
-            for plugin in plugins:
-                try:
-                    plugin.register_converters(self, **kwargs)
-                except Exception:
-                    tb = traceback.format_exc()
-                    warn(f"Plugin '{plugin}' failed to register converters:\n{tb}")
-            self._plugins_enabled = True
-        else:
-            warn("Plugins converters are already enabled.", RuntimeWarning)
+        with self._registration_lock:
+            if not self._plugins_enabled:
+                # Load plugins
+                plugins = _load_plugins()
+                assert plugins is not None
+                for plugin in plugins:
+                    try:
+                        plugin.register_converters(self, **kwargs)
+                    except Exception:
+                        tb = traceback.format_exc()
+                        warn(f"Plugin '{plugin}' failed to register converters:\n{tb}")
+                self._plugins_enabled = True
+            else:
+                warn("Plugins converters are already enabled.", RuntimeWarning)
 
     def convert(
         self,
@@ -290,6 +672,339 @@ class MarkItDown:
                 f"Invalid source type: {type(source)}. Expected str, requests.Response, BinaryIO."
             )
 
+    def convert_iter(
+        self,
+        source: Union[str, requests.Response, Path, BinaryIO],
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """
+        Streaming version of convert(). Yields the markdown in fragments, as the
+        converter produces them (e.g., per page, slide, sheet, archive member, or feed
+        item), so that the first fragment is available early, and the whole document
+        need not be held in memory. Converters that do not support streaming produce
+        a single fragment. The concatenated fragments are equal to convert().markdown.
+
+        Args:
+            - source: can be a path (str or Path), uri, requests.Response, or binary stream
+            - stream_info: optional stream info to use for the conversion. If None, infer from source
+            - kwargs: additional arguments to pass to the converter
+        """
+        with self._open_source(source, stream_info, kwargs) as (stream, base_guess):
+            if self._isolated_pool is not None:
+                # The result of a worker is not streamed
+                yield self._convert_isolated(stream, base_guess, kwargs).markdown
+                return
+            with self._trace(
+                kwargs, "markitdown.convert", stream_info=base_guess
+            ) as kwargs:
+                stats = self._start_stats(kwargs)
+                if stats is not None:
+                    stream = CountingStream(stream)
+                # (A sniff option forwarded from another conversion is replaced)
+                budget, owned_budget = self._get_budget(kwargs)
+                kwargs = {**kwargs, "sniff": SniffContext(stream), "budget": budget}
+                with stage(stats, "identify"), trace_span(
+                    kwargs, "markitdown.identify"
+                ):
+                    guesses = self._get_stream_info_guesses(
+                        file_stream=stream,
+                        base_guess=base_guess,
+                        stats=stats,
+                        sniff=kwargs["sniff"],
+                    )
+                yield from self._convert_iter(
+                    file_stream=stream,
+                    stream_info_guesses=guesses,
+                    _stats=stats,
+                    _budget=owned_budget,
+                    **kwargs,
+                )
+
+    def probe(
+        self,
+        source: Union[str, requests.Response, Path, BinaryIO],
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        **kwargs: Any,
+    ) -> ProbeResult:
+        """
+        Find out how a document would be converted, and roughly what it would cost,
+        without converting it: the StreamInfo guesses, the converter that would be
+        selected (the first to accept the document), cheap structural counts (e.g., the
+        pages of a PDF; see DocumentConverter.probe()), and a cost class (see
+        estimate_cost()). Only headers and indexes are read, so that a probe takes
+        milliseconds, e.g., to route or reject documents before converting them.
+
+        Probes run in the calling process, whatever the isolation option. (Remote
+        sources are fetched, as for convert().)
+
+        Args:
+            - source: can be a path (str or Path), uri, requests.Response, or binary stream
+            - stream_info: optional stream info to use for the conversion. If None, infer from source
+            - kwargs: the options that the conversion would be given
+        """
+        with self._open_source(source, stream_info, kwargs) as (stream, base_guess):
+            sniff = SniffContext(stream)
+            kwargs = {**kwargs, "sniff": sniff}
+            guesses = self._get_stream_info_guesses(
+                file_stream=stream, base_guess=base_guess, sniff=sniff
+            )
+
+            converter: Optional[DocumentConverter] = None
+            accepted: Optional[StreamInfo] = None
+            structure: Dict[str, Any] = {}
+            cur_pos = stream.tell()
+            for converter, accepted, _kwargs in self._accepting_converters(
+                stream, guesses, self._get_conversion_options(kwargs)
+            ):
+                try:
+                    structure = converter.probe(stream, accepted, **_kwargs)
+                except Exception:
+                    # The document may still convert (or fail to); its structure is
+                    # only unknown
+                    structure = {}
+                finally:
+                    stream.seek(cur_pos)
+                break
+
+            return ProbeResult(
+                stream_info_guesses=guesses,
+                converter=None if converter is None else type(converter).__name__,
+                stream_info=accepted,
+                size=sniff.size,
+                structure=structure,
+                cost=estimate_cost(sniff.size, structure),
+            )
+
+    @contextlib.contextmanager
+    def _open_source(
+        self,
+        source: Union[str, requests.Response, Path, BinaryIO],
+        stream_info: Optional[StreamInfo],
+        kwargs: Dict[str, Any],
+    ) -> Iterator[Tuple[BinaryIO, StreamInfo]]:
+        """
+        Open any of the sources accepted by convert(), yielding a seekable binary stream
+        and a base guess of its StreamInfo. Local files are closed on exit.
+        """
+        if isinstance(source, Path):
+            source = str(source)
+
+        if isinstance(source, str):
+            uri = source.strip()
+            if uri.startswith("http:") or uri.startswith("https:"):
+                source = self._get(uri, kwargs)
+            elif uri.startswith("data:"):
+                mimetype, attributes, chunks = iter_data_uri(uri)
+                base_guess = StreamInfo(
+                    mimetype=mimetype, charset=attributes.get("charset")
+                )
+                if stream_info is not None:
+                    base_guess = base_guess.copy_and_update(stream_info)
+                with self._spool(chunks) as buffer:
+                    yield buffer, base_guess
+                return
+            else:
+                path = source
+                if uri.startswith("file:"):
+                    netloc, path = file_uri_to_path(uri)
+                    if netloc and netloc != "localhost":
+                        raise ValueError(
+                            f"Unsupported file URI: {uri}. Netloc must be empty or localhost."
+                        )
+                base_guess = StreamInfo(
+                    local_path=path,
+                    extension=os.path.splitext(path)[1],
+                    filename=os.path.basename(path),
+                )
+                if stream_info is not None:
+                    base_guess = base_guess.copy_and_update(stream_info)
+                with open_local(path) as fh:
+                    yield fh, base_guess
+                return
+
+        if isinstance(source, requests.Response):
+            base_guess = self._get_response_base_guess(source.headers, source.url)
+            if stream_info is not None:
+                base_guess = base_guess.copy_and_update(stream_info)
+            with self._spool_response(source, kwargs) as buffer:
+                yield buffer, base_guess
+        elif (
+            hasattr(source, "read")
+            and callable(source.read)
+            and not isinstance(source, io.TextIOBase)
+        ):
+            # Check if we have a seekable stream. If not, buffer it.
+            if source.seekable():
+                yield source, stream_info or StreamInfo()
+            else:
+                with self._spool(read_chunks(source)) as buffer:
+                    yield buffer, stream_info or StreamInfo()
+        else:
+            raise TypeError(
+                f"Invalid source type: {type(source)}. Expected str, requests.Response, BinaryIO."
+            )
+
+    async def convert_async(
+        self,
+        source: Union[str, requests.Response, Path, BinaryIO],
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        """
+        Asynchronous version of convert(). The conversion runs on the async executor
+        (see the `async_executor` constructor argument), so the event loop is not
+        blocked, and http: and https: URIs are fetched without blocking (see
+        convert_uri_async()).
+
+        If the awaiting task is cancelled, the cancellation propagates to the
+        conversion: if it has not started, it never will, and otherwise it is
+        abandoned at the next cancellation checkpoint.
+        """
+        if isinstance(source, str) and (
+            source.startswith("http:") or source.startswith("https:")
+        ):
+            _kwargs = {k: v for k, v in kwargs.items()}
+            if "url" in _kwargs:
+                _kwargs["mock_url"] = _kwargs["url"]
+                del _kwargs["url"]
+
+            return await self.convert_uri_async(
+                source, stream_info=stream_info, **_kwargs
+            )
+
+        return await self._run_async(
+            self.convert, source, stream_info=stream_info, **kwargs
+        )
+
+    async def convert_stream_async(
+        self,
+        stream: BinaryIO,
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        """Asynchronous version of convert_stream(). See convert_async()."""
+        return await self._run_async(
+            self.convert_stream, stream, stream_info=stream_info, **kwargs
+        )
+
+    async def convert_uri_async(
+        self,
+        uri: str,
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        file_extension: Optional[str] = None,  # Deprecated -- use stream_info
+        mock_url: Optional[
+            str
+        ] = None,  # Mock the request as if it came from a different URL
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        """
+        Asynchronous version of convert_uri(). See convert_async().
+
+        http: and https: URIs are fetched with httpx, if it is installed, and with the
+        (blocking) requests session on the async executor otherwise. An httpx.AsyncClient
+        may be passed to the constructor as `async_http_client`.
+        """
+        uri = uri.strip()
+
+        if not (uri.startswith("http:") or uri.startswith("https:")):
+            return await self._run_async(
+                self.convert_uri,
+                uri,
+                stream_info=stream_info,
+                file_extension=file_extension,
+                mock_url=mock_url,
+                **kwargs,
+            )
+
+        if not is_available(httpx):
+            response = await self._run_async(functools.partial(self._get, uri, kwargs))
+            return await self._run_async(
+                self.convert_response,
+                response,
+                stream_info=stream_info,
+                file_extension=file_extension,
+                url=mock_url,
+                **kwargs,
+            )
+
+        client = self._async_http_client
+        with self._trace(kwargs, "markitdown.fetch", {"markitdown.url": uri}):
+            if client is None:
+                async with httpx.AsyncClient(follow_redirects=True) as client:
+                    buffer, base_guess = await self._fetch_async(client, uri, kwargs)
+            else:
+                buffer, base_guess = await self._fetch_async(client, uri, kwargs)
+
+        # Update with any additional info from the arguments
+        if stream_info is not None:
+            base_guess = base_guess.copy_and_update(stream_info)
+        if file_extension is not None:
+            # Deprecated -- use stream_info
+            base_guess = base_guess.copy_and_update(extension=file_extension)
+        if mock_url is not None:
+            base_guess = base_guess.copy_and_update(url=mock_url)
+
+        with buffer:
+            return await self._run_async(
+                self.convert_stream, buffer, stream_info=base_guess, **kwargs
+            )
+
+    async def _fetch_async(
+        self, client: Any, uri: str, kwargs: Dict[str, Any]
+    ) -> tuple[BinaryIO, StreamInfo]:
+        """Fetch a http: or https: URI with httpx, returning the body and a base guess."""
+        raise_if_cancelled(kwargs)
+        # (The client's own timeout applies, unless there is a deadline)
+        timeout = remaining_time(kwargs)
+        request_kwargs = {} if timeout is None else {"timeout": timeout}
+
+        async def chunks(response: Any) -> AsyncIterator[bytes]:
+            async for chunk in response.aiter_bytes(READ_SIZE):
+                raise_if_cancelled(kwargs)
+                yield chunk
+
+        async with client.stream("GET", uri, **request_kwargs) as response:
+            response.raise_for_status()
+            buffer = await spool_async(
+                chunks(response),
+                max_memory=self._spool_max_memory,
+                max_size=self._max_input_size,
+                expected_size=content_length(response.headers),
+            )
+        return buffer, self._get_response_base_guess(
+            response.headers, str(response.url)
+        )
+
+    async def _run_async(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Run func(*args, **kwargs) on the async executor, and await the result. If the
+        awaiting task is cancelled, the `cancel_event` passed to the converters is set.
+        """
+        cancel_event = threading.Event()
+        if getattr(func, "__self__", None) is self:
+            # Conversion methods accept the cancel_event option (see raise_if_cancelled)
+            kwargs["cancel_event"] = cancel_event
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._async_executor or _get_async_executor(),
+            functools.partial(func, *args, **kwargs),
+        )
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # Abandon the work if it already started (otherwise it was dequeued)
+            cancel_event.set()
+            raise
+
     def convert_local(
         self,
         path: Union[str, Path],
@@ -321,11 +1036,10 @@ class MarkItDown:
             # Deprecated -- use stream_info
             base_guess = base_guess.copy_and_update(url=url)
 
-        with open(path, "rb") as fh:
-            guesses = self._get_stream_info_guesses(
-                file_stream=fh, base_guess=base_guess
-            )
-            return self._convert(file_stream=fh, stream_info_guesses=guesses, **kwargs)
+        # Memory-mapped, where possible, so that converters that need the whole
+        # content can use it in place (see read_buffer)
+        with open_local(path) as fh:
+            return self._identify_and_convert(fh, base_guess, **kwargs)
 
     def convert_stream(
         self,
@@ -336,8 +1050,6 @@ class MarkItDown:
         url: Optional[str] = None,  # Deprecated -- use stream_info
         **kwargs: Any,
     ) -> DocumentConverterResult:
-        guesses: List[StreamInfo] = []
-
         # Do we have anything on which to base a guess?
         base_guess = None
         if stream_info is not None or file_extension is not None or url is not None:
@@ -357,22 +1069,14 @@ class MarkItDown:
                 assert base_guess is not None  # for mypy
                 base_guess = base_guess.copy_and_update(url=url)
 
-        # Check if we have a seekable stream. If not, load the entire stream into memory.
-        if not stream.seekable():
-            buffer = io.BytesIO()
-            while True:
-                chunk = stream.read(4096)
-                if not chunk:
-                    break
-                buffer.write(chunk)
-            buffer.seek(0)
-            stream = buffer
-
-        # Add guesses based on stream content
-        guesses = self._get_stream_info_guesses(
-            file_stream=stream, base_guess=base_guess or StreamInfo()
-        )
-        return self._convert(file_stream=stream, stream_info_guesses=guesses, **kwargs)
+        with contextlib.ExitStack() as stack:
+            # Check if we have a seekable stream. If not, buffer it.
+            if not stream.seekable():
+                stream = stack.enter_context(self._spool(read_chunks(stream)))
+
+            return self._identify_and_convert(
+                stream, base_guess or StreamInfo(), **kwargs
+            )
 
     def convert_url(
         self,
@@ -422,7 +1126,7 @@ class MarkItDown:
             )
         # Data URIs
         elif uri.startswith("data:"):
-            mimetype, attributes, data = parse_data_uri(uri)
+            mimetype, attributes, chunks = iter_data_uri(uri)
 
             base_guess = StreamInfo(
                 mimetype=mimetype,
@@ -431,17 +1135,17 @@ class MarkItDown:
             if stream_info is not None:
                 base_guess = base_guess.copy_and_update(stream_info)
 
-            return self.convert_stream(
-                io.BytesIO(data),
-                stream_info=base_guess,
-                file_extension=file_extension,
-                url=mock_url,
-                **kwargs,
-            )
+            with self._spool(chunks) as buffer:
+                return self.convert_stream(
+                    buffer,
+                    stream_info=base_guess,
+                    file_extension=file_extension,
+                    url=mock_url,
+                    **kwargs,
+                )
         # HTTP/HTTPS URIs
         elif uri.startswith("http:") or uri.startswith("https:"):
-            response = self._requests_session.get(uri, stream=True)
-            response.raise_for_status()
+            response = self._get(uri, kwargs)
             return self.convert_response(
                 response,
                 stream_info=stream_info,
@@ -463,12 +1167,182 @@ class MarkItDown:
         url: Optional[str] = None,  # Deprecated -- use stream_info
         **kwargs: Any,
     ) -> DocumentConverterResult:
+        # Create an initial guess from the response headers and url
+        base_guess = self._get_response_base_guess(response.headers, response.url)
+
+        # Update with any additional info from the arguments
+        if stream_info is not None:
+            base_guess = base_guess.copy_and_update(stream_info)
+        if file_extension is not None:
+            # Deprecated -- use stream_info
+            base_guess = base_guess.copy_and_update(extension=file_extension)
+        if url is not None:
+            # Deprecated -- use stream_info
+            base_guess = base_guess.copy_and_update(url=url)
+
+        # Buffer the body, and convert it
+        with self._spool_response(response, kwargs) as buffer:
+            return self._identify_and_convert(buffer, base_guess, **kwargs)
+
+    def _identify_and_convert(
+        self, file_stream: BinaryIO, base_guess: StreamInfo, **kwargs: Any
+    ) -> DocumentConverterResult:
+        """Expand on the base guess using the stream content, and convert the stream."""
+        if self._isolated_pool is not None:
+            return self._convert_isolated(file_stream, base_guess, kwargs)
+        with self._trace(
+            kwargs, "markitdown.convert", stream_info=base_guess
+        ) as kwargs:
+            stats = self._start_stats(kwargs)
+            if stats is not None:
+                file_stream = CountingStream(file_stream)
+            # The start (and end) of the stream are read once, for Magika, charset
+            # detection and the converters' accepts() (a sniff option forwarded from
+            # another conversion is replaced)
+            budget, owned_budget = self._get_budget(kwargs)
+            kwargs = {**kwargs, "sniff": SniffContext(file_stream), "budget": budget}
+            with stage(stats, "identify"), trace_span(kwargs, "markitdown.identify"):
+                guesses = self._get_stream_info_guesses(
+                    file_stream=file_stream,
+                    base_guess=base_guess,
+                    stats=stats,
+                    sniff=kwargs["sniff"],
+                )
+            return self._convert(
+                file_stream=file_stream,
+                stream_info_guesses=guesses,
+                _stats=stats,
+                _budget=owned_budget,
+                **kwargs,
+            )
+
+    def _convert_isolated(
+        self, file_stream: BinaryIO, base_guess: StreamInfo, kwargs: Dict[str, Any]
+    ) -> DocumentConverterResult:
+        """
+        Convert the stream in a worker process (see the isolation option). The cache
+        is looked up (and added to) here, keyed on the base guess, since the stream is
+        identified in the worker.
+        """
+        assert self._isolated_pool is not None
+        raise_if_cancelled(kwargs)
+        with self._trace(
+            kwargs, "markitdown.convert", stream_info=base_guess
+        ) as kwargs:
+            options = self._get_conversion_options(kwargs)
+            key: Optional[str] = None
+            if self._uses_cache(options, self._get_budget(options)[1]):
+                stats = self._start_stats(kwargs)
+                with stage(stats, "cache"), trace_span(kwargs, "markitdown.cache"):
+                    key = self._get_cache_key(file_stream, [base_guess], options)
+                    cached = self._cache.get(key)  # type: ignore[union-attr]
+                if cached is not None:
+                    if stats is not None:
+                        stats.cache_hit = True
+                        cached.stats = stats
+                        self._finish_stats(stats, file_stream)
+                    return cached
+                # (The worker collects the stats of the conversion)
+                stats = None
+
+            result = self._isolated_pool.convert(file_stream, base_guess, kwargs)
+
+        # (Results cut short by their deadline are not cached)
+        if key is not None and not deadline_passed(options):
+            self._cache.put(key, result)  # type: ignore[union-attr]
+        # The workers collect stats, if asked to, but the callback is called here
+        if result.stats is not None and self._stats_callback is not None:
+            self._stats_callback(result.stats)
+        return result
+
+    def _get_budget(
+        self, kwargs: Dict[str, Any]
+    ) -> Tuple[OutputBudget, Optional[OutputBudget]]:
+        """
+        The output budget of a conversion (see OutputBudget), and the same if the
+        conversion owns it, i.e., it was not forwarded by the converter of another
+        conversion (e.g., of an archive), which enforces max_output_chars instead.
+        """
+        budget = kwargs.get("budget")
+        if isinstance(budget, OutputBudget):
+            return budget, None
+        budget = OutputBudget.from_options(kwargs)
+        return budget, budget
+
+    def _trace(
+        self,
+        kwargs: Dict[str, Any],
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        *,
+        stream_info: Optional[StreamInfo] = None,
+    ) -> ContextManager[Dict[str, Any]]:
+        """trace_span(), with this instance's tracer, unless the options carry one."""
+        if self._tracer is not None and kwargs.get("tracer") is None:
+            kwargs = {**kwargs, "tracer": self._tracer}
+        return trace_span(kwargs, name, attributes, stream_info=stream_info)
+
+    def _start_stats(self, kwargs: Dict[str, Any]) -> Optional[ConversionStats]:
+        """Start collecting stats for a conversion, if they were asked for."""
+        if self._collect_stats or kwargs.get("collect_stats"):
+            return ConversionStats()
+        return None
+
+    def _finish_stats(self, stats: ConversionStats, file_stream: BinaryIO) -> None:
+        """Record the totals of a conversion, and pass its stats to the callback."""
+        if isinstance(file_stream, CountingStream):
+            stats.bytes_read = file_stream.bytes_read
+        stats._finish()
+        if self._stats_callback is not None:
+            self._stats_callback(stats)
+
+    def _get(self, uri: str, kwargs: Dict[str, Any]) -> requests.Response:
+        """GET an http: or https: URI with the requests session. The body is streamed."""
+        raise_if_cancelled(kwargs)
+        with self._trace(kwargs, "markitdown.fetch", {"markitdown.url": uri}):
+            # The remaining time of the deadline bounds connecting, and each read
+            response = self._requests_session.get(
+                uri, stream=True, timeout=remaining_time(kwargs)
+            )
+            response.raise_for_status()
+        return response
+
+    def _spool(
+        self, chunks: Iterable[bytes], expected_size: Optional[int] = None
+    ) -> BinaryIO:
+        """Buffer non-seekable input (see the spool_max_memory and max_input_size options)."""
+        return spool(
+            chunks,
+            max_memory=self._spool_max_memory,
+            max_size=self._max_input_size,
+            expected_size=expected_size,
+        )
+
+    def _spool_response(
+        self, response: requests.Response, kwargs: Dict[str, Any]
+    ) -> BinaryIO:
+        """Buffer the body of an HTTP response, until cancelled or out of time."""
+
+        def chunks() -> Iterator[bytes]:
+            for chunk in response.iter_content(chunk_size=READ_SIZE):
+                raise_if_cancelled(kwargs)
+                yield chunk
+
+        return self._spool(chunks(), expected_size=content_length(response.headers))
+
+    def _get_response_base_guess(
+        self, headers: Mapping[str, str], url: str
+    ) -> StreamInfo:
+        """
+        Build a base StreamInfo guess from the headers (case-insensitive) and url of an
+        HTTP response.
+        """
         # If there is a content-type header, get the mimetype and charset (if present)
         mimetype: Optional[str] = None
         charset: Optional[str] = None
 
-        if "content-type" in response.headers:
-            parts = response.headers["content-type"].split(";")
+        if "content-type" in headers:
+            parts = headers["content-type"].split(";")
             mimetype = parts.pop(0).strip()
             for part in parts:
                 if part.strip().startswith("charset="):
@@ -479,8 +1353,8 @@ class MarkItDown:
         # If there is a content-disposition header, get the filename and possibly the extension
         filename: Optional[str] = None
         extension: Optional[str] = None
-        if "content-disposition" in response.headers:
-            m = re.search(r"filename=([^;]+)", response.headers["content-disposition"])
+        if "content-disposition" in headers:
+            m = re.search(r"filename=([^;]+)", headers["content-disposition"])
             if m:
                 filename = m.group(1).strip("\"'")
                 _, _extension = os.path.splitext(filename)
@@ -489,127 +1363,411 @@ class MarkItDown:
 
         # If there is still no filename, try to read it from the url
         if filename is None:
-            parsed_url = urlparse(response.url)
+            parsed_url = urlparse(url)
             _, _extension = os.path.splitext(parsed_url.path)
             if len(_extension) > 0:  # Looks like this might be a file!
                 filename = os.path.basename(parsed_url.path)
                 extension = _extension
 
         # Create an initial guess from all this information
-        base_guess = StreamInfo(
+        return StreamInfo(
             mimetype=mimetype,
             charset=charset,
             filename=filename,
             extension=extension,
-            url=response.url,
+            url=url,
         )
 
-        # Update with any additional info from the arguments
-        if stream_info is not None:
-            base_guess = base_guess.copy_and_update(stream_info)
-        if file_extension is not None:
-            # Deprecated -- use stream_info
-            base_guess = base_guess.copy_and_update(extension=file_extension)
-        if url is not None:
-            # Deprecated -- use stream_info
-            base_guess = base_guess.copy_and_update(url=url)
-
-        # Read into BytesIO
-        buffer = io.BytesIO()
-        for chunk in response.iter_content(chunk_size=512):
-            buffer.write(chunk)
-        buffer.seek(0)
-
-        # Convert
-        guesses = self._get_stream_info_guesses(
-            file_stream=buffer, base_guess=base_guess
-        )
-        return self._convert(file_stream=buffer, stream_info_guesses=guesses, **kwargs)
-
     def _convert(
-        self, *, file_stream: BinaryIO, stream_info_guesses: List[StreamInfo], **kwargs
+        self,
+        *,
+        file_stream: BinaryIO,
+        stream_info_guesses: List[StreamInfo],
+        _stats: Optional[ConversionStats] = None,
+        _budget: Optional[OutputBudget] = None,
+        **kwargs,
+    ) -> DocumentConverterResult:
+        try:
+            res = self._try_converters(
+                file_stream, stream_info_guesses, _stats, _budget, kwargs
+            )
+            res.stats = _stats
+            return res
+        finally:
+            if _stats is not None:
+                self._finish_stats(_stats, file_stream)
+
+    def _try_converters(
+        self,
+        file_stream: BinaryIO,
+        stream_info_guesses: List[StreamInfo],
+        stats: Optional[ConversionStats],
+        budget: Optional[OutputBudget],
+        kwargs: Dict[str, Any],
     ) -> DocumentConverterResult:
         res: Union[None, DocumentConverterResult] = None
 
         # Keep track of which converters throw exceptions
         failed_attempts: List[FailedConversionAttempt] = []
 
-        # Create a copy of the page_converters list, sorted by priority.
-        # We do this with each call to _convert because the priority of converters may change between calls.
-        # The sort is guaranteed to be stable, so converters with the same priority will remain in the same order.
-        sorted_registrations = sorted(self._converters, key=lambda x: x.priority)
-
         # Remember the initial stream position so that we can return to it
         cur_pos = file_stream.tell()
 
-        for stream_info in stream_info_guesses + [StreamInfo()]:
-            for converter_registration in sorted_registrations:
-                converter = converter_registration.converter
-                # Sanity check -- make sure the cur_pos is still the same
-                assert (
-                    cur_pos == file_stream.tell()
-                ), "File stream position should NOT change between guess iterations"
+        options = self._get_conversion_options(kwargs)
+
+        # Checks the normalization options before converting anything
+        normalizer = self._get_normalizer(options)
+
+        # Answer from the cache, if possible
+        key: Optional[str] = None
+        if self._uses_cache(options, budget):
+            with stage(stats, "cache"), trace_span(options, "markitdown.cache"):
+                key = self._get_cache_key(file_stream, stream_info_guesses, options)
+                cached = self._cache.get(key)
+            if cached is not None:
+                if stats is not None:
+                    stats.cache_hit = True
+                return cached
+
+        attempts = _Attempts()
+        for converter, stream_info, _kwargs in self._accepting_converters(
+            file_stream, stream_info_guesses, options, stats, attempts
+        ):
+            # Attempt the conversion
+            error: Optional[BaseException] = None
+            if budget is not None:
+                budget.reset()
+            with stage(stats, "convert") as timing:
+                try:
+                    with trace_span(
+                        _kwargs,
+                        "markitdown.converter",
+                        {"markitdown.converter": type(converter).__name__},
+                        stream_info=stream_info,
+                    ) as span_kwargs:
+                        if budget is not None and budget.max_output_chars is not None:
+                            # The output is measured as it is produced, so that the
+                            # converter stops at max_output_chars
+                            res = DocumentConverterResult.from_fragments(
+                                budget.limit(
+                                    converter.convert_iter(
+                                        file_stream, stream_info, **span_kwargs
+                                    )
+                                )
+                            )
+                        else:
+                            res = converter.convert(
+                                file_stream, stream_info, **span_kwargs
+                            )
+                except (ConversionCancelledException, ConversionTimeoutException):
+                    raise
+                except Exception as e:
+                    error = e
+                    attempts.failed(converter, stream_info, e)
+                    failed_attempts.append(
+                        FailedConversionAttempt(
+                            converter=converter, exc_info=sys.exc_info()
+                        )
+                    )
+                finally:
+                    file_stream.seek(cur_pos)
+            if stats is not None:
+                assert timing is not None  # for mypy
+                record_outcome(stats, timing.wall_time, error)
+
+            if res is not None:
+                # Normalize the content, in a single pass
+                with stage(stats, "normalize"), trace_span(
+                    options, "markitdown.normalize"
+                ):
+                    res.text_content = (
+                        normalizer.feed(res.text_content) + normalizer.close()
+                    )
+                if budget is not None:
+                    res.skipped = dict(budget.skipped)
 
-                _kwargs = {k: v for k, v in kwargs.items()}
+                # (Results cut short by their deadline are not cached)
+                if key is not None and not deadline_passed(options):
+                    assert self._cache is not None  # for mypy
+                    self._cache.put(key, res)
+                return res
 
-                # Copy any additional global options
-                if "llm_client" not in _kwargs and self._llm_client is not None:
-                    _kwargs["llm_client"] = self._llm_client
+        # If we got this far without success, report any exceptions
+        self._raise_conversion_failed(failed_attempts)
 
-                if "llm_model" not in _kwargs and self._llm_model is not None:
-                    _kwargs["llm_model"] = self._llm_model
+    def _convert_iter(
+        self,
+        *,
+        file_stream: BinaryIO,
+        stream_info_guesses: List[StreamInfo],
+        _stats: Optional[ConversionStats] = None,
+        _budget: Optional[OutputBudget] = None,
+        **kwargs,
+    ) -> Iterator[str]:
+        """
+        Streaming version of _convert(). Accepting converters are tried in turn, until
+        one produces its first fragment, at which point the conversion is committed to
+        that converter: an exception raised later can no longer fall back to the next
+        converter, and is raised as a FileConversionException.
+        """
+        try:
+            yield from self._try_converters_iter(
+                file_stream, stream_info_guesses, _stats, _budget, kwargs
+            )
+        finally:
+            if _stats is not None:
+                self._finish_stats(_stats, file_stream)
 
-                if "style_map" not in _kwargs and self._style_map is not None:
-                    _kwargs["style_map"] = self._style_map
+    def _try_converters_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info_guesses: List[StreamInfo],
+        stats: Optional[ConversionStats],
+        budget: Optional[OutputBudget],
+        kwargs: Dict[str, Any],
+    ) -> Iterator[str]:
+        failed_attempts: List[FailedConversionAttempt] = []
+        cur_pos = file_stream.tell()
+        options = self._get_conversion_options(kwargs)
+
+        # Cached results are served from the cache, but (since the output is not kept
+        # in memory) streamed conversions are not added to it.
+        if self._uses_cache(options, budget):
+            with stage(stats, "cache"), trace_span(options, "markitdown.cache"):
+                key = self._get_cache_key(file_stream, stream_info_guesses, options)
+                cached = self._cache.get(key)
+            if cached is not None:
+                if stats is not None:
+                    stats.cache_hit = True
+                yield cached.markdown
+                return
+
+        attempts = _Attempts()
+        for converter, stream_info, _kwargs in self._accepting_converters(
+            file_stream, stream_info_guesses, options, stats, attempts
+        ):
+            normalizer = self._get_normalizer(options)
+            committed = False
+            if budget is not None:
+                budget.reset()
+            try:
+                with trace_span(
+                    _kwargs,
+                    "markitdown.converter",
+                    {"markitdown.converter": type(converter).__name__},
+                    stream_info=stream_info,
+                ) as span_kwargs:
+                    fragments = converter.convert_iter(
+                        file_stream, stream_info, **span_kwargs
+                    )
+                    if budget is not None and budget.max_output_chars is not None:
+                        fragments = budget.limit(fragments)
+                    if stats is not None:
+                        fragments = time_fragments(stats, fragments)
+                    try:
+                        for fragment in fragments:
+                            committed = True
+                            with stage(stats, "normalize"):
+                                normalized = normalizer.feed(fragment)
+                            if normalized:
+                                yield normalized
+                    finally:
+                        fragments.close()
+                committed = True
+            except (ConversionCancelledException, ConversionTimeoutException):
+                raise
+            except Exception as e:
+                if stats is not None:
+                    record_outcome(stats, 0.0, e)
+                attempts.failed(converter, stream_info, e)
+                failed_attempts.append(
+                    FailedConversionAttempt(
+                        converter=converter, exc_info=sys.exc_info()
+                    )
+                )
+                if committed:
+                    raise FileConversionException(attempts=failed_attempts)
+            finally:
+                file_stream.seek(cur_pos)
+
+            if committed:
+                if stats is not None:
+                    record_outcome(stats, 0.0, None)
+                with stage(stats, "normalize"):
+                    remainder = normalizer.close()
+                if remainder:
+                    yield remainder
+                return
+
+        # If we got this far without success, report any exceptions
+        self._raise_conversion_failed(failed_attempts)
 
-                if "exiftool_path" not in _kwargs and self._exiftool_path is not None:
-                    _kwargs["exiftool_path"] = self._exiftool_path
+    def _get_conversion_options(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """The options passed to the converters: kwargs, plus global options."""
+        options = {k: v for k, v in kwargs.items()}
 
-                # Add the list of converters for nested processing
-                _kwargs["_parent_converters"] = self._converters
+        # Copy any additional global options
+        if "llm_client" not in options and self._llm_client is not None:
+            options["llm_client"] = self._llm_client
 
-                # Add legaxy kwargs
-                if stream_info is not None:
-                    if stream_info.extension is not None:
-                        _kwargs["file_extension"] = stream_info.extension
+        if "llm_model" not in options and self._llm_model is not None:
+            options["llm_model"] = self._llm_model
+
+        if "style_map" not in options and self._style_map is not None:
+            options["style_map"] = self._style_map
+
+        if "exiftool_path" not in options and self._exiftool_path is not None:
+            options["exiftool_path"] = self._exiftool_path
+
+        if "pdf_workers" not in options and self._pdf_workers is not None:
+            options["pdf_workers"] = self._pdf_workers
+
+        if (
+            "pdf_pages_per_chunk" not in options
+            and self._pdf_pages_per_chunk is not None
+        ):
+            options["pdf_pages_per_chunk"] = self._pdf_pages_per_chunk
+
+        if options.get("tracer") is None and self._tracer is not None:
+            options["tracer"] = self._tracer
+
+        return options
+
+    def _get_normalizer(self, options: Dict[str, Any]) -> MarkdownNormalizer:
+        """
+        A normalizer for the converted markdown. Besides the normalization that is
+        always applied, the options may ask for zero-width characters to be removed
+        (remove_zero_width_chars=True), and for a Unicode normalization form (e.g.,
+        unicode_form="NFC").
+        """
+        return MarkdownNormalizer(
+            remove_zero_width_chars=options.get("remove_zero_width_chars", False),
+            unicode_form=options.get("unicode_form"),
+        )
+
+    def _uses_cache(
+        self, options: Dict[str, Any], budget: Optional[OutputBudget]
+    ) -> bool:
+        """
+        Whether the result of a conversion may be looked up in (and added to) the
+        cache. The output of a conversion that shares the budget of another (e.g., of
+        a member of an archive; budget is then None) depends on what is left of that
+        budget, which is not part of the cache key, if it has any limit.
+        """
+        if self._cache is None:
+            return False
+        shared = options.get("budget")
+        return (
+            budget is not None
+            or not isinstance(shared, OutputBudget)
+            or not shared.limited
+        )
 
-                    if stream_info.url is not None:
-                        _kwargs["url"] = stream_info.url
+    def _get_cache_key(
+        self,
+        file_stream: BinaryIO,
+        stream_info_guesses: List[StreamInfo],
+        options: Dict[str, Any],
+    ) -> str:
+        index = self._converter_index
+        fingerprint = self._converters_fingerprint
+        if fingerprint is None or fingerprint[0] is not index:
+            fingerprint = (index, converters_fingerprint(index.registrations))
+            self._converters_fingerprint = fingerprint
+        return cache_key(
+            file_stream,
+            stream_info_guesses,
+            options,
+            fingerprint[1],
+        )
+
+    def _accepting_converters(
+        self,
+        file_stream: BinaryIO,
+        stream_info_guesses: List[StreamInfo],
+        options: Dict[str, Any],
+        stats: Optional[ConversionStats] = None,
+        attempts: Optional[_Attempts] = None,
+    ) -> Iterator[Tuple[DocumentConverter, StreamInfo, Dict[str, Any]]]:
+        """
+        Yield the converters that accept the stream, in the order in which they should
+        be tried, along with the guess they accepted, and the options to pass to them.
+        The stream must be returned to its initial position before resuming iteration.
+        If stats are collected, each converter consulted is added to stats.attempts.
+        Converters that need not be tried again (see _Attempts) are not consulted.
+        """
+        # The index is rebuilt whenever a converter is registered, so it already
+        # holds the registrations sorted by priority, bucketed by extension and mimetype.
+        converter_index = self._converter_index
+        converters = self._converters
+
+        # Remember the initial stream position so that we can check it is maintained
+        cur_pos = file_stream.tell()
+
+        for stream_info in stream_info_guesses + [StreamInfo()]:
+            # The options passed to the converters depend only on the guess, so they
+            # are prepared once per guess, rather than once per converter.
+            _kwargs = {k: v for k, v in options.items()}
+
+            # Add the list of converters for nested processing
+            _kwargs["_parent_converters"] = converters
+
+            # Add legaxy kwargs
+            if stream_info is not None:
+                if stream_info.extension is not None:
+                    _kwargs["file_extension"] = stream_info.extension
+
+                if stream_info.url is not None:
+                    _kwargs["url"] = stream_info.url
+
+            # Only the converters that could possibly accept this guess are consulted
+            for converter_registration in converter_index.candidates(stream_info):
+                converter = converter_registration.converter
+                if attempts is not None and not attempts.should_try(
+                    converter, stream_info
+                ):
+                    continue
+
+                # Stop here if the conversion was cancelled
+                raise_if_cancelled(_kwargs)
+
+                # Sanity check -- make sure the cur_pos is still the same
+                assert (
+                    cur_pos == file_stream.tell()
+                ), "File stream position should NOT change between guess iterations"
 
                 # Check if the converter will accept the file, and if so, try to convert it
-                _accepts = False
-                try:
-                    _accepts = converter.accepts(file_stream, stream_info, **_kwargs)
-                except NotImplementedError:
-                    pass
+                if stats is None:
+                    _accepts = _call_accepts(
+                        converter, file_stream, stream_info, _kwargs
+                    )
+                else:
+                    with stage(stats, "accepts") as timing:
+                        _accepts = _call_accepts(
+                            converter, file_stream, stream_info, _kwargs
+                        )
+                    assert timing is not None  # for mypy
+                    stats.attempts.append(
+                        ConverterAttempt(
+                            converter=type(converter).__name__,
+                            stream_info=stream_info,
+                            accepted=_accepts,
+                            accepts_time=timing.wall_time,
+                        )
+                    )
 
                 # accept() should not have changed the file stream position
                 assert (
                     cur_pos == file_stream.tell()
                 ), f"{type(converter).__name__}.accept() should NOT change the file_stream position"
 
-                # Attempt the conversion
                 if _accepts:
-                    try:
-                        res = converter.convert(file_stream, stream_info, **_kwargs)
-                    except Exception:
-                        failed_attempts.append(
-                            FailedConversionAttempt(
-                                converter=converter, exc_info=sys.exc_info()
-                            )
-                        )
-                    finally:
-                        file_stream.seek(cur_pos)
+                    yield converter, stream_info, _kwargs
 
-                if res is not None:
-                    # Normalize the content
-                    res.text_content = "\n".join(
-                        [line.rstrip() for line in re.split(r"\r?\n", res.text_content)]
-                    )
-                    res.text_content = re.sub(r"\n{3,}", "\n\n", res.text_content)
-                    return res
-
-        # If we got this far without success, report any exceptions
+    def _raise_conversion_failed(
+        self, failed_attempts: List[FailedConversionAttempt]
+    ) -> NoReturn:
+        # Report any exceptions
         if len(failed_attempts) > 0:
             raise FileConversionException(attempts=failed_attempts)
 
@@ -641,8 +1799,8 @@ class MarkItDown:
         priority PRIORITY_SPECIFIC_FILE_FORMAT (== 10), with lower values
         being tried first (i.e., higher priority).
 
-        Just prior to conversion, the converters are sorted by priority, using
-        a stable sort. This means that converters with the same priority will
+        Upon registration, the converters are sorted by priority, using a
+        stable sort. This means that converters with the same priority will
         remain in the same order, with the most recently registered converters
         appearing first.
 
@@ -653,16 +1811,29 @@ class MarkItDown:
         Plugins can register converters with any priority, to appear before or
         after the built-ins. For example, a plugin with priority 9 will run
         before the PlainTextConverter, but after the built-in converters.
+
+        At the same time, the converters are indexed by the extensions and
+        mimetype prefixes they declare (see DocumentConverter.accepted_file_extensions
+        and DocumentConverter.accepted_mime_type_prefixes), so that each conversion
+        only consults the converters that could possibly accept the stream.
         """
-        self._converters.insert(
-            0, ConverterRegistration(converter=converter, priority=priority)
-        )
+        with self._registration_lock:
+            converters = [
+                ConverterRegistration(converter=converter, priority=priority)
+            ] + self._converters
+            self._converter_index = ConverterIndex(converters)
+            self._converters = converters
 
     def _get_stream_info_guesses(
-        self, file_stream: BinaryIO, base_guess: StreamInfo
+        self,
+        file_stream: BinaryIO,
+        base_guess: StreamInfo,
+        stats: Optional[ConversionStats] = None,
+        sniff: Optional[SniffContext] = None,
     ) -> List[StreamInfo]:
         """
         Given a base guess, attempt to guess or expand on the stream info using the stream content (via magika).
+        The content is read through the sniff context, if given.
         """
         guesses: List[StreamInfo] = []
 
@@ -683,18 +1854,39 @@ class MarkItDown:
             if len(_e) > 0:
                 enhanced_guess = enhanced_guess.copy_and_update(extension=_e[0])
 
+        # If the caller fully described the stream, there is nothing for magika to add
+        if (
+            base_guess.mimetype is not None
+            and base_guess.extension is not None
+            and (
+                base_guess.charset is not None
+                or not base_guess.mimetype.startswith("text/")
+            )
+        ):
+            return [enhanced_guess]
+
         # Call magika to guess from the stream
+        if sniff is None:
+            sniff = SniffContext(file_stream)
         cur_pos = file_stream.tell()
         try:
-            result = self._magika.identify_stream(file_stream)
+            magika_model = _get_magika(self._instrumentation_callback)
+            start = time.perf_counter()
+            with stage(stats, "magika"):
+                result = magika_model.identify_stream(sniff.stream())
+            if self._instrumentation_callback is not None:
+                self._instrumentation_callback(
+                    "magika_identify", time.perf_counter() - start
+                )
             if result.status == "ok" and result.prediction.output.label != "unknown":
                 # If it's text, also guess the charset
                 charset = None
                 if result.prediction.output.is_text:
-                    # Read the first 4k to guess the charset
-                    file_stream.seek(cur_pos)
-                    stream_page = file_stream.read(4096)
-                    charset_result = charset_normalizer.from_bytes(stream_page).best()
+                    # Use the first 4k to guess the charset
+                    with stage(stats, "charset"):
+                        charset_result = charset_normalizer.from_bytes(
+                            sniff.prefix[:4096]
+                        ).best()
 
                     if charset_result is not None:
                         charset = self._normalize_charset(charset_result.encoding)
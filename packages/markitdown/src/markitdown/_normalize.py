@@ -0,0 +1,109 @@
+import unicodedata
+from typing import List, Optional
+
+# Zero-width characters, which some converters (and documents) leave in the output
+ZERO_WIDTH_CHARS = "\u200b\u200c\u200d\ufeff"
+
+UNICODE_FORMS = ("NFC", "NFD", "NFKC", "NFKD")
+
+# The newlines separating two non-blank lines, by the number of newlines between them
+_SEPARATORS = ("", "\n", "\n\n")
+
+
+class MarkdownNormalizer:
+    """
+    Incrementally normalizes markdown text, as produced by the converters, such that:
+
+        normalizer.feed(a) + normalizer.feed(b) + normalizer.close()
+
+    is equal to normalizing a + b in one go. Normalization strips trailing whitespace
+    from every line, and collapses runs of three or more newlines into two (i.e., at
+    most one blank line separates paragraphs). Optionally, zero-width characters are
+    removed, and the text is brought to a Unicode normalization form.
+
+    All steps are applied line by line, in a single pass over the text. Output lags
+    the input by at most one line: a line is only emitted once it is complete, and
+    newlines are only emitted once it is known how many to keep.
+    """
+
+    def __init__(
+        self,
+        *,
+        remove_zero_width_chars: bool = False,
+        unicode_form: Optional[str] = None,
+    ) -> None:
+        """
+        Parameters:
+        - remove_zero_width_chars: If True, remove zero-width spaces, joiners and
+          non-joiners, and byte order marks.
+        - unicode_form: If set, one of "NFC", "NFD", "NFKC" or "NFKD".
+        """
+        if unicode_form is not None and unicode_form not in UNICODE_FORMS:
+            raise ValueError(
+                f"Unsupported Unicode normalization form: {unicode_form}. Supported forms are: {', '.join(UNICODE_FORMS)}"
+            )
+        self._remove_zero_width_chars = remove_zero_width_chars
+        self._unicode_form = unicode_form
+        self._partial: List[str] = []  # Pieces of the incomplete last line
+        self._pending_newlines = 0  # Newlines seen since the last non-blank line
+
+    def feed(self, text: str) -> str:
+        """Normalize the next piece of text, returning what can be emitted so far."""
+        if self._remove_zero_width_chars:
+            # Characters are removed one by one, so this need not wait for whole
+            # lines. (str.replace() is much faster than str.translate() at this.)
+            for char in ZERO_WIDTH_CHARS:
+                if char in text:
+                    text = text.replace(char, "")
+
+        if "\n" not in text:
+            self._partial.append(text)
+            return ""
+
+        self._partial.append(text)
+        lines = "".join(self._partial).split("\n")
+        self._partial = [lines.pop()]
+        return self._normalize_lines(lines, emit_trailing_newlines=False)
+
+    def close(self) -> str:
+        """Return the remainder of the normalized text."""
+        lines = ["".join(self._partial)]
+        self._partial = []
+        return self._normalize_lines(lines, emit_trailing_newlines=True)
+
+    def _normalize_lines(self, lines: List[str], emit_trailing_newlines: bool) -> str:
+        """
+        Normalize complete lines. Each is followed by a newline, except when the
+        trailing newlines are emitted, i.e., when the text is closed.
+        """
+        if self._unicode_form is not None:
+            # Combining sequences never span lines, so lines can be normalized one
+            # at a time. Already normalized lines are returned as they are.
+            form = self._unicode_form
+            lines = [unicodedata.normalize(form, line) for line in lines]
+
+        out: List[str] = []
+        pending = self._pending_newlines
+        for line in lines:
+            line = line.rstrip()
+            if line:
+                out.append(_SEPARATORS[pending if pending < 2 else 2])
+                out.append(line)
+                pending = 1
+            else:
+                pending += 1
+
+        if emit_trailing_newlines:
+            # The last line was not followed by a newline
+            pending -= 1
+            out.append(_SEPARATORS[pending if pending < 2 else 2])
+            pending = 0
+
+        self._pending_newlines = pending
+        return "".join(out)
+
+
+def normalize_markdown(text: str, **kwargs) -> str:
+    """Normalize a whole text in one go. Options are as for MarkdownNormalizer."""
+    normalizer = MarkdownNormalizer(**kwargs)
+    return normalizer.feed(text) + normalizer.close()
@@ -0,0 +1,64 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional
+
+from ._stream_info import StreamInfo
+
+# The cost classes of conversions, from cheapest to most expensive
+COST_CLASSES = ("low", "medium", "high")
+
+# The structural counts (see DocumentConverter.probe()) from which a conversion is
+# of medium, or of high, cost
+COST_THRESHOLDS = {
+    "pages": (20, 200),
+    "slides": (30, 300),
+    "cells": (10_000, 1_000_000),  # Summed over the sheets of a workbook
+    "members": (50, 1_000),  # Of an archive
+    "spine": (30, 300),  # The chapters (and other documents) of an e-book
+    "uncompressed_size": (10 * 2**20, 200 * 2**20),  # Bytes
+}
+
+# The size of the input (in bytes) from which a conversion is of medium, or of high,
+# cost, when its structure tells no more
+SIZE_THRESHOLDS = (1 * 2**20, 50 * 2**20)
+
+
+@dataclass(kw_only=True, frozen=True)
+class ProbeResult:
+    """
+    What MarkItDown.probe() found out about a document, without converting it: how
+    it would be converted, and a rough idea of what that would cost.
+    """
+
+    # The StreamInfo guesses, most likely first, as the conversion would try them
+    stream_info_guesses: List[StreamInfo]
+    converter: Optional[str]  # The name of the converter class that would be selected
+    stream_info: Optional[StreamInfo]  # The guess it accepted the document under
+    size: int  # Bytes
+    # Cheap structural counts (e.g., {"pages": 12}; see DocumentConverter.probe())
+    structure: Dict[str, Any] = field(default_factory=dict)
+    cost: str = "low"  # One of COST_CLASSES (see estimate_cost())
+
+
+def estimate_cost(size: int, structure: Mapping[str, Any]) -> str:
+    """
+    The cost class of converting a document, from its size and its structure: the
+    highest class that any of its counts reaches (see COST_THRESHOLDS), or that its
+    size reaches, if its structure has no counts. Conversions that call a remote
+    service (structure["remote"]) are of high cost, whatever the document.
+    """
+    if structure.get("remote"):
+        return "high"
+
+    levels = [
+        _level(structure[key], thresholds)
+        for key, thresholds in COST_THRESHOLDS.items()
+        if isinstance(structure.get(key), int)
+    ]
+    if not levels:
+        levels.append(_level(size, SIZE_THRESHOLDS))
+    return COST_CLASSES[max(levels)]
+
+
+def _level(value: int, thresholds: tuple) -> int:
+    medium, high = thresholds
+    return 2 if value >= high else 1 if value >= medium else 0
@@ -0,0 +1,190 @@
+import codecs
+import io
+from typing import Any, BinaryIO, Dict, Mapping, Optional
+
+# The budget of the reads made to identify a stream: its first SNIFF_PREFIX_SIZE
+# bytes, and its last SNIFF_SUFFIX_SIZE bytes. (Magika reads at most 4 KiB of each.)
+SNIFF_PREFIX_SIZE = 64 * 1024
+SNIFF_SUFFIX_SIZE = 4 * 1024
+
+
+class SniffContext:
+    """
+    The start (prefix) and end (suffix) of a stream, from its position when the
+    context was created, read at most once, and shared by everything that identifies
+    the stream: Magika, charset detection, and the converters' accepts() (to which
+    it is passed as the `sniff` option).
+
+    Nothing is read until one of the properties is first used, and the position of
+    the stream is restored after reading.
+
+    What a converter works out from the sniffed bytes in accepts() (e.g., the type of
+    a feed) can be kept in `state`, for its convert() to reuse, under keys of its
+    choosing.
+    """
+
+    def __init__(
+        self,
+        file_stream: BinaryIO,
+        *,
+        prefix_size: int = SNIFF_PREFIX_SIZE,
+        suffix_size: int = SNIFF_SUFFIX_SIZE,
+    ):
+        self._stream = file_stream
+        self._start = file_stream.tell()
+        self.prefix_size = prefix_size
+        self.suffix_size = suffix_size
+        self._prefix: Optional[bytes] = None
+        self._suffix = b""
+        self._size = 0
+        self._texts: Dict[str, str] = {}
+        self.state: Dict[str, Any] = {}
+
+    def describes(self, file_stream: BinaryIO) -> bool:
+        """Whether this is the context of file_stream, at its current position."""
+        return file_stream is self._stream and file_stream.tell() == self._start
+
+    def _load(self) -> bytes:
+        if self._prefix is not None:
+            return self._prefix
+
+        stream = self._stream
+        try:
+            self._size = stream.seek(0, io.SEEK_END) - self._start
+            stream.seek(self._start)
+            prefix = stream.read(min(self.prefix_size, self._size))
+
+            # The suffix overlaps the prefix when the stream is short, in which case
+            # only the rest of it is read
+            suffix_start = max(self._size - self.suffix_size, 0)
+            if suffix_start >= len(prefix):
+                stream.seek(self._start + suffix_start)
+                self._suffix = stream.read(self._size - suffix_start)
+            else:
+                stream.seek(self._start + len(prefix))
+                self._suffix = prefix[suffix_start:] + stream.read(
+                    self._size - len(prefix)
+                )
+        finally:
+            stream.seek(self._start)
+
+        self._prefix = prefix
+        return prefix
+
+    @property
+    def prefix(self) -> bytes:
+        """The first prefix_size bytes of the stream (all of it, if shorter)."""
+        return self._load()
+
+    @property
+    def suffix(self) -> bytes:
+        """The last suffix_size bytes of the stream (all of it, if shorter)."""
+        self._load()
+        return self._suffix
+
+    @property
+    def size(self) -> int:
+        """The size of the stream, from its initial position."""
+        self._load()
+        return self._size
+
+    @property
+    def complete(self) -> bool:
+        """Whether the prefix holds the whole stream."""
+        return len(self._load()) >= self._size
+
+    def text(self, encoding: Optional[str] = None) -> str:
+        """
+        The prefix, decoded (UTF-8 by default), but for a character cut off by the
+        end of the prefix. Raises UnicodeDecodeError (or LookupError, for unknown
+        encodings) like bytes.decode(). The text is kept, so that it is decoded only
+        once: when the prefix is complete, it is the text of the whole stream.
+        """
+        encoding = encoding or "utf-8"
+        text = self._texts.get(encoding)
+        if text is None:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            text = decoder.decode(self.prefix, final=self.complete)
+            self._texts[encoding] = text
+        return text
+
+    def suffix_text(self, encoding: Optional[str] = None) -> str:
+        """The suffix, decoded leniently: undecodable bytes are replaced."""
+        return self.suffix.decode(encoding or "utf-8", errors="replace")
+
+    def stream(self) -> BinaryIO:
+        """
+        A read-only stream over the sniffed bytes, for libraries that insist on
+        reading a stream (like Magika). Reads that fall outside both the prefix and
+        the suffix go to the underlying stream.
+        """
+        self._load()
+        return _SniffStream(self)
+
+
+def sniff_of(file_stream: BinaryIO, kwargs: Mapping[str, Any]) -> SniffContext:
+    """
+    The context of file_stream passed as the `sniff` option, or else (e.g., when a
+    converter is used directly) a new one.
+    """
+    sniff = kwargs.get("sniff")
+    if isinstance(sniff, SniffContext) and sniff.describes(file_stream):
+        return sniff
+    return SniffContext(file_stream)
+
+
+class _SniffStream(io.BufferedIOBase):
+    """A read-only, seekable view of a stream, served from a SniffContext."""
+
+    def __init__(self, sniff: SniffContext):
+        super().__init__()
+        self._sniff = sniff
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._sniff.size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._pos = offset
+        return offset
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        sniff = self._sniff
+        start = min(self._pos, sniff.size)
+        end = sniff.size if size is None or size < 0 else min(start + size, sniff.size)
+        self._pos = end
+
+        prefix = sniff.prefix
+        if end <= len(prefix):
+            return prefix[start:end]
+        suffix_start = sniff.size - len(sniff.suffix)
+        if start >= suffix_start:
+            return sniff.suffix[start - suffix_start : end - suffix_start]
+
+        # Outside of the sniffed bytes
+        stream = sniff._stream
+        try:
+            stream.seek(sniff._start + start)
+            return stream.read(end - start)
+        finally:
+            stream.seek(sniff._start)
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
@@ -0,0 +1,183 @@
+import contextlib
+import threading
+import time
+import tracemalloc
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, ContextManager, Dict, Generator, Iterator, List, Optional
+
+from ._stream_info import StreamInfo
+
+# The stages of a conversion, in the order in which they run. Stages that do not
+# run (e.g., "magika", when the caller fully described the stream) are not reported.
+STAGES = (
+    "identify",  # Guessing the StreamInfo, including the two stages below
+    "magika",  # Identifying the content type with Magika
+    "charset",  # Detecting the charset of text content
+    "cache",  # Looking up the result in the cache, if any
+    "accepts",  # Calling accepts() on the candidate converters
+    "convert",  # Calling convert() on the accepting converters, failed or not
+    "normalize",  # Normalizing the converted markdown
+)
+
+
+@dataclass(kw_only=True)
+class StageStats:
+    """The time spent in a stage of a conversion, summed over its calls."""
+
+    wall_time: float = 0.0  # Seconds
+    cpu_time: float = 0.0  # Seconds of CPU time, in the converting thread
+    calls: int = 0
+
+
+@dataclass(kw_only=True)
+class ConverterAttempt:
+    """A converter that was consulted during a conversion, and how it went."""
+
+    converter: str  # The name of the converter class
+    stream_info: StreamInfo  # The guess it was consulted with
+    accepted: bool = False
+    succeeded: bool = False
+    error: Optional[str] = None  # The exception raised by convert(), if any
+    accepts_time: float = 0.0  # Wall time, in seconds
+    convert_time: float = 0.0  # Wall time, in seconds (0 if not accepted)
+
+
+# The stats of the conversions in progress whose peak memory is being recorded, to
+# tell which overlap others (see ConversionStats). (Stats that are never finished,
+# e.g., of conversions that failed early, drop out when they are collected.)
+_tracing_lock = threading.Lock()
+_tracing: "weakref.WeakValueDictionary[int, ConversionStats]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+@dataclass(kw_only=True)
+class ConversionStats:
+    """
+    Where the time of a conversion went. Collected on request (see the collect_stats
+    option of MarkItDown, and its stats_callback), and attached to the result as
+    DocumentConverterResult.stats.
+
+    Peak memory is only recorded while tracemalloc is tracing (e.g., when Python is
+    run with -X tracemalloc). It is the peak of the memory allocated during the
+    conversion, above what was allocated when it started. Since the peak of
+    tracemalloc is process-wide, it is only recorded for conversions that ran alone:
+    peak_memory is None for conversions that overlapped one in another thread (e.g.,
+    with convert_many() or convert_async()), or that started within another (e.g.,
+    the members of an archive, whose memory is part of the archive's).
+    """
+
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    attempts: List[ConverterAttempt] = field(default_factory=list)
+    stream_info: Optional[StreamInfo] = None  # The guess that succeeded
+    converter: Optional[str] = None  # The converter that succeeded
+    cache_hit: bool = False
+    bytes_read: int = 0  # Bytes read from the input, by all stages
+    peak_memory: Optional[int] = None  # Bytes (see above)
+    wall_time: float = 0.0  # Seconds, for the whole conversion
+    cpu_time: float = 0.0  # Seconds, for the whole conversion
+
+    def __post_init__(self) -> None:
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.thread_time()
+        self._start_memory: Optional[int] = None
+        self._thread = threading.get_ident()
+        self._overlapped = False
+        if tracemalloc.is_tracing():
+            with _tracing_lock:
+                others = list(_tracing.values())
+                for other in others:
+                    if other._thread != self._thread:
+                        other._overlapped = True
+                # (Resetting the peak would lose that of the others)
+                if others:
+                    self._overlapped = True
+                else:
+                    tracemalloc.reset_peak()
+                self._start_memory = tracemalloc.get_traced_memory()[0]
+                _tracing[id(self)] = self
+
+    def _finish(self) -> None:
+        """Record the totals, once the conversion is done."""
+        self.wall_time = time.perf_counter() - self._start_wall
+        self.cpu_time = time.thread_time() - self._start_cpu
+        if self._start_memory is None:
+            return
+        with _tracing_lock:
+            _tracing.pop(id(self), None)
+        if not self._overlapped and tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+            self.peak_memory = max(0, peak - self._start_memory)
+
+
+_NOT_COLLECTED: ContextManager[Any] = contextlib.nullcontext()
+
+
+def stage(
+    stats: Optional[ConversionStats], name: str
+) -> ContextManager[Optional[StageStats]]:
+    """
+    Time a stage of the conversion, adding it to stats. Yields the timing of this
+    call alone, which is filled in on exit. If stats are not collected (stats is
+    None), nothing is timed, and None is yielded.
+    """
+    if stats is None:
+        # Much cheaper than entering a generator-based context manager
+        return _NOT_COLLECTED
+    return _stage(stats, name)
+
+
+@contextlib.contextmanager
+def _stage(stats: ConversionStats, name: str) -> Iterator[StageStats]:
+    timing = StageStats(calls=1)
+    start_wall = time.perf_counter()
+    start_cpu = time.thread_time()
+    try:
+        yield timing
+    finally:
+        timing.wall_time = time.perf_counter() - start_wall
+        timing.cpu_time = time.thread_time() - start_cpu
+        total = stats.stages.setdefault(name, StageStats())
+        total.wall_time += timing.wall_time
+        total.cpu_time += timing.cpu_time
+        total.calls += 1
+
+
+def record_outcome(
+    stats: ConversionStats, convert_time: float, error: Optional[BaseException]
+) -> None:
+    """Record how the conversion by the last accepting converter went."""
+    attempt = stats.attempts[-1]
+    attempt.convert_time += convert_time
+    if error is not None:
+        attempt.error = f"{type(error).__name__}: {error}"
+    else:
+        attempt.succeeded = True
+        stats.converter = attempt.converter
+        stats.stream_info = attempt.stream_info
+
+
+_DONE = object()
+
+
+def time_fragments(
+    stats: ConversionStats, fragments: Generator[str, None, Any]
+) -> Generator[str, None, None]:
+    """
+    Time the steps of a convert_iter() generator as part of the "convert" stage,
+    excluding the time spent by the consumer between fragments.
+    """
+    attempt = stats.attempts[-1]
+    try:
+        while True:
+            try:
+                with _stage(stats, "convert") as timing:
+                    fragment = next(fragments, _DONE)
+            finally:
+                attempt.convert_time += timing.wall_time
+            if fragment is _DONE:
+                return
+            yield fragment
+    finally:
+        fragments.close()
@@ -0,0 +1,205 @@
+import contextlib
+from typing import Any, ContextManager, Dict, Iterator, Optional
+
+from ._exceptions import MissingDependencyException
+from ._lazy_imports import LazyModule, dependency_exc_info
+from ._stream_info import StreamInfo
+
+# Optional dependency of OpenTelemetryTracer
+opentelemetry = LazyModule("opentelemetry", "opentelemetry.trace")
+
+
+class Tracer:
+    """
+    Abstract superclass of tracers, which record the stages of conversions as spans.
+
+    A tracer is passed to MarkItDown as the `tracer` option, e.g.:
+
+        markitdown = MarkItDown(tracer=OpenTelemetryTracer())
+
+    Each conversion is then recorded as a "markitdown.convert" span, with child
+    spans for identifying the stream ("markitdown.identify"), looking it up in the
+    cache ("markitdown.cache"), each converter that attempts the conversion
+    ("markitdown.converter"), and normalizing the output ("markitdown.normalize",
+    except when streamed, since the output is then normalized fragment by fragment).
+    Fetching http: and https: URIs is recorded as a "markitdown.fetch" span.
+    Conversions started by converters (e.g., of the members of a zip archive) are
+    children of the converter's span.
+
+    Spans are threaded through the conversion explicitly, as the `trace_parent`
+    option, rather than through ambient context, so that conversions streamed with
+    convert_iter() (whose spans stay open between fragments) nest correctly. See
+    trace_span(), which converters can also use to record spans of their own.
+
+    Subclasses implement start_span() and end_span(). Both are called on the
+    converting thread, and may be called concurrently for different conversions.
+    """
+
+    def start_span(
+        self,
+        name: str,
+        parent: Any = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Start a span, returning a handle to pass to end_span(), and as the parent
+        of child spans. Spans without a parent are children of whatever span the
+        tracer considers current, if any (e.g., the span of the HTTP request being
+        served).
+        """
+        raise NotImplementedError()
+
+    def end_span(
+        self,
+        span: Any,
+        *,
+        error: Optional[BaseException] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """End a span, recording the exception that ended it, if any."""
+        raise NotImplementedError()
+
+
+class NoOpTracer(Tracer):
+    """
+    A tracer that records nothing. It is the default, and MarkItDown skips tracing
+    altogether when it is used, so that disabled tracing costs next to nothing.
+    """
+
+    def start_span(
+        self,
+        name: str,
+        parent: Any = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        return None
+
+    def end_span(
+        self,
+        span: Any,
+        *,
+        error: Optional[BaseException] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        pass
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    A tracer that records spans with OpenTelemetry (requires the opentelemetry-api
+    package, e.g., `pip install markitdown[opentelemetry]`). Spans are exported by
+    whatever TracerProvider the application configures.
+    """
+
+    def __init__(self, tracer: Any = None):
+        """
+        Parameters:
+        - tracer: An opentelemetry.trace.Tracer. Defaults to the "markitdown" tracer
+          of the global TracerProvider.
+        """
+        _dependency_exc_info = dependency_exc_info(opentelemetry)
+        if _dependency_exc_info is not None:
+            raise MissingDependencyException(
+                "OpenTelemetryTracer requires the opentelemetry-api package. To resolve this error, install it, e.g., with `pip install markitdown[opentelemetry]`."
+            ) from _dependency_exc_info[
+                1
+            ].with_traceback(  # type: ignore[union-attr]
+                _dependency_exc_info[2]
+            )
+        if tracer is None:
+            tracer = opentelemetry.trace.get_tracer("markitdown")
+        self._tracer = tracer
+
+    def start_span(
+        self,
+        name: str,
+        parent: Any = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        context = None
+        if parent is not None:
+            context = opentelemetry.trace.set_span_in_context(parent)
+        return self._tracer.start_span(name, context=context, attributes=attributes)
+
+    def end_span(
+        self,
+        span: Any,
+        *,
+        error: Optional[BaseException] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if attributes:
+            span.set_attributes(attributes)
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(
+                opentelemetry.trace.Status(
+                    opentelemetry.trace.StatusCode.ERROR,
+                    f"{type(error).__name__}: {error}",
+                )
+            )
+        span.end()
+
+
+def trace_span(
+    kwargs: Dict[str, Any],
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+    *,
+    stream_info: Optional[StreamInfo] = None,
+) -> ContextManager[Dict[str, Any]]:
+    """
+    Record a span, if the conversion options (kwargs) carry a `tracer`. The span is
+    a child of the `trace_parent` option, if any. Yields the options for the work
+    within the span, in which the span is the `trace_parent`, e.g.:
+
+        with trace_span(kwargs, "mypackage.page", {"mypackage.page": i}) as _kwargs:
+            self._markitdown.convert_stream(page_stream, **_kwargs)
+
+    Without a tracer, the options are yielded unchanged. If a stream_info is given,
+    it is described by the attributes of the span (see stream_info_attributes()).
+    Attributes whose value is None are left out.
+    """
+    tracer: Optional[Tracer] = kwargs.get("tracer")
+    if tracer is None:
+        # Much cheaper than entering a generator-based context manager
+        return contextlib.nullcontext(kwargs)
+    return _trace_span(tracer, kwargs, name, attributes, stream_info)
+
+
+@contextlib.contextmanager
+def _trace_span(
+    tracer: Tracer,
+    kwargs: Dict[str, Any],
+    name: str,
+    attributes: Optional[Dict[str, Any]],
+    stream_info: Optional[StreamInfo],
+) -> Iterator[Dict[str, Any]]:
+    if stream_info is not None:
+        attributes = {**stream_info_attributes(stream_info), **(attributes or {})}
+    if attributes:
+        attributes = {k: v for k, v in attributes.items() if v is not None}
+    span = tracer.start_span(name, kwargs.get("trace_parent"), attributes)
+    try:
+        yield {**kwargs, "trace_parent": span}
+    except GeneratorExit:
+        # A generator within the span was closed early (e.g., the consumer of
+        # convert_iter() stopped reading), which is not an error
+        tracer.end_span(span)
+        raise
+    except BaseException as e:
+        tracer.end_span(span, error=e)
+        raise
+    else:
+        tracer.end_span(span)
+
+
+def stream_info_attributes(stream_info: StreamInfo) -> Dict[str, Any]:
+    """Span attributes describing a stream."""
+    return {
+        "markitdown.mimetype": stream_info.mimetype,
+        "markitdown.extension": stream_info.extension,
+        "markitdown.charset": stream_info.charset,
+        "markitdown.filename": stream_info.filename,
+        "markitdown.url": stream_info.url,
+    }
@@ -1,9 +1,16 @@
 import base64
 import os
-from typing import Tuple, Dict
+import re
+from typing import Tuple, Dict, Iterator
 from urllib.request import url2pathname
 from urllib.parse import urlparse, unquote_to_bytes
 
+# The size of the pieces in which data URIs are decoded (a multiple of 4, so that
+# base64 data is split on quantum boundaries)
+DATA_URI_CHUNK_SIZE = 1024 * 1024
+
+_NON_BASE64_RE = re.compile(r"[^A-Za-z0-9+/=]")
+
 
 def file_uri_to_path(file_uri: str) -> Tuple[str | None, str]:
     """Convert a file URI to a local file path"""
@@ -17,6 +24,17 @@ def file_uri_to_path(file_uri: str) -> Tuple[str | None, str]:
 
 
 def parse_data_uri(uri: str) -> Tuple[str | None, Dict[str, str], bytes]:
+    mime_type, attributes, chunks = iter_data_uri(uri)
+    return mime_type, attributes, b"".join(chunks)
+
+
+def iter_data_uri(
+    uri: str, chunk_size: int = DATA_URI_CHUNK_SIZE
+) -> Tuple[str | None, Dict[str, str], Iterator[bytes]]:
+    """
+    Like parse_data_uri(), but the content is decoded lazily, in chunks, so that
+    large data URIs can be copied to a buffer without first decoding them in full.
+    """
     if not uri.startswith("data:"):
         raise ValueError("Not a data URI")
 
@@ -47,6 +65,36 @@ def parse_data_uri(uri: str) -> Tuple[str | None, Dict[str, str], bytes]:
         elif len(part) > 0:
             attributes[part] = ""
 
-    content = base64.b64decode(data) if is_base64 else unquote_to_bytes(data)
+    if is_base64:
+        chunks = _iter_base64_decoded(data, chunk_size)
+    else:
+        chunks = _iter_percent_decoded(data, chunk_size)
+
+    return mime_type, attributes, chunks
+
+
+def _iter_base64_decoded(data: str, chunk_size: int) -> Iterator[bytes]:
+    # As base64.b64decode() does, discard characters outside the base64 alphabet
+    if _NON_BASE64_RE.search(data):
+        data = _NON_BASE64_RE.sub("", data)
+
+    # Padding before the end cannot be decoded piecewise
+    if "=" in data[:-2]:
+        yield base64.b64decode(data)
+        return
+
+    chunk_size = max(4, chunk_size - chunk_size % 4)
+    for i in range(0, len(data), chunk_size):
+        yield base64.b64decode(data[i : i + chunk_size])
+
 
-    return mime_type, attributes, content
+def _iter_percent_decoded(data: str, chunk_size: int) -> Iterator[bytes]:
+    i = 0
+    while i < len(data):
+        end = i + chunk_size
+        # Do not split a %XX escape
+        escape = data.rfind("%", max(i, end - 2), end)
+        if escape != -1:
+            end = escape if escape > i else escape + 3
+        yield unquote_to_bytes(data[i:end])
+        i = end
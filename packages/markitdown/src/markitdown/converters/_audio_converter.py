@@ -4,7 +4,8 @@ from ._exiftool import exiftool_metadata
 from ._transcribe_audio import transcribe_audio
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-from .._exceptions import MissingDependencyException
+from .._exceptions import ConversionTimeoutException, MissingDependencyException
+from .._cancellation import TRUNCATION_MARKER, deadline_passed, remaining_time
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "audio/x-wav",
@@ -25,6 +26,9 @@ class AudioConverter(DocumentConverter):
     Converts audio files to markdown via extraction of metadata (if `exiftool` is installed), and speech transcription (if `speech_recognition` is installed).
     """
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -91,11 +95,23 @@ class AudioConverter(DocumentConverter):
         # Transcribe
         if audio_format:
             try:
-                transcript = transcribe_audio(file_stream, audio_format=audio_format)
+                transcript = transcribe_audio(
+                    file_stream,
+                    audio_format=audio_format,
+                    timeout=remaining_time(kwargs),
+                )
                 if transcript:
                     md_content += "\n\n### Audio Transcript:\n" + transcript
             except MissingDependencyException:
                 pass
+            except ConversionTimeoutException:
+                # Out of time: the metadata is all there is
+                md_content += TRUNCATION_MARKER
+            except Exception:
+                # (E.g., the timeout error of the recognizer, once the deadline passed)
+                if not deadline_passed(kwargs):
+                    raise
+                md_content += TRUNCATION_MARKER
 
         # Return the result
         return DocumentConverterResult(markdown=md_content.strip())
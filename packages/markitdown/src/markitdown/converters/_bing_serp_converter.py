@@ -26,6 +26,9 @@ class BingSerpConverter(DocumentConverter):
     NOTE: It is better to use the Bing API
     """
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -116,5 +119,10 @@ class BingSerpConverter(DocumentConverter):
 
         return DocumentConverterResult(
             markdown=webpage_text,
-            title=None if soup.title is None else soup.title.string,
+            # A str, as a NavigableString references (and pickles) the whole tree
+            title=(
+                None
+                if soup.title is None or soup.title.string is None
+                else str(soup.title.string)
+            ),
         )
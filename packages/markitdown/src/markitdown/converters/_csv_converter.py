@@ -1,9 +1,12 @@
 import csv
 import io
+import itertools
 from typing import BinaryIO, Any
 from charset_normalizer import from_bytes
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from .._buffer import read_buffer
+from .._budget import budget_of
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/csv",
@@ -17,6 +20,9 @@ class CsvConverter(DocumentConverter):
     Converts CSV files to Markdown tables.
     """
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+
     def __init__(self):
         super().__init__()
 
@@ -41,15 +47,23 @@ class CsvConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        # Read the file content
+        # Read the file content (memory-mapped local files are decoded in place)
+        buffer = read_buffer(file_stream)
         if stream_info.charset:
-            content = file_stream.read().decode(stream_info.charset)
+            content = str(buffer, stream_info.charset)
         else:
-            content = str(from_bytes(file_stream.read()).best())
+            content = str(from_bytes(bytes(buffer)).best())
 
-        # Parse CSV content
+        # Parse CSV content, up to the max_rows_per_table option
         reader = csv.reader(io.StringIO(content))
-        rows = list(reader)
+        budget = budget_of(kwargs)
+        if budget.max_rows_per_table is None:
+            rows = list(reader)
+        else:
+            # (The header, and the data rows)
+            rows = list(itertools.islice(reader, budget.max_rows_per_table + 1))
+            # Counting the rows left does not format them
+            budget.skip("rows", sum(1 for _ in reader))
 
         if not rows:
             return DocumentConverterResult(markdown="")
@@ -1,56 +1,35 @@
-import sys
 import re
 import os
-from typing import BinaryIO, Any, List
+from typing import BinaryIO, Any, Dict, List, TYPE_CHECKING
 from enum import Enum
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 from .._exceptions import MissingDependencyException
-
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
-    from azure.ai.documentintelligence import DocumentIntelligenceClient
-    from azure.ai.documentintelligence.models import (
-        AnalyzeDocumentRequest,
-        AnalyzeResult,
-        DocumentAnalysisFeature,
-    )
+from .._lazy_imports import LazyModule, dependency_exc_info
+from .._cancellation import raise_if_cancelled, remaining_time
+
+# Optional (but in this case, required) dependencies are imported lazily, when the
+# converter is instantiated. Import errors are reported at that point.
+documentintelligence = LazyModule(
+    "azure.ai.documentintelligence", "azure.ai.documentintelligence.models"
+)
+azure_credentials = LazyModule("azure.core.credentials")
+azure_identity = LazyModule("azure.identity")
+
+# Types for type hinting, which are not needed at runtime
+if TYPE_CHECKING:
+    from azure.ai.documentintelligence.models import AnalyzeResult
     from azure.core.credentials import AzureKeyCredential, TokenCredential
-    from azure.identity import DefaultAzureCredential
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
-
-    # Define these types for type hinting when the package is not available
-    class AzureKeyCredential:
-        pass
-
-    class TokenCredential:
-        pass
-
-    class DocumentIntelligenceClient:
-        pass
-
-    class AnalyzeDocumentRequest:
-        pass
-
-    class AnalyzeResult:
-        pass
-
-    class DocumentAnalysisFeature:
-        pass
-
-    class DefaultAzureCredential:
-        pass
 
 
 # TODO: currently, there is a bug in the document intelligence SDK with importing the "ContentFormat" enum.
 # This constant is a temporary fix until the bug is resolved.
 CONTENT_FORMAT = "markdown"
 
+# How often cancellation and the deadline are checked while waiting for an analysis
+POLL_INTERVAL = 1.0  # Seconds
+
 
 class DocumentIntelligenceFileType(str, Enum):
     """Enum of file types supported by the Document Intelligence Converter."""
@@ -130,7 +109,7 @@ class DocumentIntelligenceConverter(DocumentConverter):
         *,
         endpoint: str,
         api_version: str = "2024-07-31-preview",
-        credential: AzureKeyCredential | TokenCredential | None = None,
+        credential: "AzureKeyCredential | TokenCredential | None" = None,
         file_types: List[DocumentIntelligenceFileType] = [
             DocumentIntelligenceFileType.DOCX,
             DocumentIntelligenceFileType.PPTX,
@@ -154,10 +133,15 @@ class DocumentIntelligenceConverter(DocumentConverter):
 
         super().__init__()
         self._file_types = file_types
+        self.accepted_file_extensions = _get_file_extensions(file_types)
+        self.accepted_mime_type_prefixes = _get_mime_type_prefixes(file_types)
 
         # Raise an error if the dependencies are not available.
         # This is different than other converters since this one isn't even instantiated
         # unless explicitly requested.
+        _dependency_exc_info = dependency_exc_info(
+            documentintelligence, azure_credentials, azure_identity
+        )
         if _dependency_exc_info is not None:
             raise MissingDependencyException(
                 "DocumentIntelligenceConverter requires the optional dependency [az-doc-intel] (or [all]) to be installed. E.g., `pip install markitdown[az-doc-intel]`"
@@ -169,13 +153,15 @@ class DocumentIntelligenceConverter(DocumentConverter):
 
         if credential is None:
             if os.environ.get("AZURE_API_KEY") is None:
-                credential = DefaultAzureCredential()
+                credential = azure_identity.DefaultAzureCredential()
             else:
-                credential = AzureKeyCredential(os.environ["AZURE_API_KEY"])
+                credential = azure_credentials.AzureKeyCredential(
+                    os.environ["AZURE_API_KEY"]
+                )
 
         self.endpoint = endpoint
         self.api_version = api_version
-        self.doc_intel_client = DocumentIntelligenceClient(
+        self.doc_intel_client = documentintelligence.DocumentIntelligenceClient(
             endpoint=self.endpoint,
             api_version=self.api_version,
             credential=credential,
@@ -223,12 +209,22 @@ class DocumentIntelligenceConverter(DocumentConverter):
             if mimetype.startswith(prefix):
                 return []
 
+        features = documentintelligence.models.DocumentAnalysisFeature
         return [
-            DocumentAnalysisFeature.FORMULAS,  # enable formula extraction
-            DocumentAnalysisFeature.OCR_HIGH_RESOLUTION,  # enable high resolution OCR
-            DocumentAnalysisFeature.STYLE_FONT,  # enable font style extraction
+            features.FORMULAS,  # enable formula extraction
+            features.OCR_HIGH_RESOLUTION,  # enable high resolution OCR
+            features.STYLE_FONT,  # enable font style extraction
         ]
 
+    def probe(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Dict[str, Any]:
+        # The document is analyzed by the Document Intelligence service
+        return {"remote": True}
+
     def convert(
         self,
         file_stream: BinaryIO,
@@ -236,13 +232,23 @@ class DocumentIntelligenceConverter(DocumentConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         # Extract the text using Azure Document Intelligence
+        raise_if_cancelled(kwargs)
         poller = self.doc_intel_client.begin_analyze_document(
             model_id="prebuilt-layout",
-            body=AnalyzeDocumentRequest(bytes_source=file_stream.read()),
+            body=documentintelligence.models.AnalyzeDocumentRequest(
+                bytes_source=file_stream.read()
+            ),
             features=self._analysis_features(stream_info),
             output_content_format=CONTENT_FORMAT,  # TODO: replace with "ContentFormat.MARKDOWN" when the bug is fixed
         )
-        result: AnalyzeResult = poller.result()
+        # Wait for the analysis, until the conversion is cancelled or out of time
+        while not poller.done():
+            raise_if_cancelled(kwargs)
+            remaining = remaining_time(kwargs)
+            poller.wait(
+                POLL_INTERVAL if remaining is None else min(POLL_INTERVAL, remaining)
+            )
+        result: "AnalyzeResult" = poller.result()
 
         # remove comments from the markdown content generated by Doc Intelligence and append to markdown string
         markdown_text = re.sub(r"<!--.*?-->", "", result.content, flags=re.DOTALL)
@@ -1,21 +1,15 @@
-import sys
-
 from typing import BinaryIO, Any
 
 from ._html_converter import HtmlConverter
 from ..converter_utils.docx.pre_process import pre_process_docx
-from .._base_converter import DocumentConverterResult
+from .._base_converter import DocumentConverterResult, GUESS_INDEPENDENT_FAILURE_TYPES
 from .._stream_info import StreamInfo
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
+from .._lazy_imports import LazyModule, dependency_exc_info
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
-    import mammoth
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+# Optional (but in this case, required) dependencies are imported lazily, the first
+# time a conversion needs them. Import errors are reported at that point.
+mammoth = LazyModule("mammoth")
 
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
@@ -30,6 +24,10 @@ class DocxConverter(HtmlConverter):
     Converts DOCX files to Markdown. Style information (e.g.m headings) and tables are preserved where possible.
     """
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+    content_failure_types = GUESS_INDEPENDENT_FAILURE_TYPES
+
     def __init__(self):
         super().__init__()
         self._html_converter = HtmlConverter()
@@ -59,6 +57,7 @@ class DocxConverter(HtmlConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         # Check: the dependencies
+        _dependency_exc_info = dependency_exc_info(mammoth)
         if _dependency_exc_info is not None:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
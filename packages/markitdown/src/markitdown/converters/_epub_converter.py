@@ -3,11 +3,13 @@ import zipfile
 from defusedxml import minidom
 from xml.dom.minidom import Document
 
-from typing import BinaryIO, Any, Dict, List
+from typing import BinaryIO, Any, Dict, Generator, List, Optional
 
 from ._html_converter import HtmlConverter
-from .._base_converter import DocumentConverterResult
+from .._base_converter import DocumentConverterResult, GUESS_INDEPENDENT_FAILURE_TYPES
 from .._stream_info import StreamInfo
+from .._cancellation import TRUNCATION_MARKER, deadline_passed, raise_if_cancelled
+from .._budget import budget_of
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "application/epub",
@@ -28,6 +30,10 @@ class EpubConverter(HtmlConverter):
     Converts EPUB files to Markdown. Style information (e.g.m headings) and tables are preserved where possible.
     """
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+    content_failure_types = GUESS_INDEPENDENT_FAILURE_TYPES
+
     def __init__(self):
         super().__init__()
         self._html_converter = HtmlConverter()
@@ -50,12 +56,37 @@ class EpubConverter(HtmlConverter):
 
         return False
 
+    def probe(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Dict[str, Any]:
+        # The length of the spine, from the package document (content.opf)
+        with zipfile.ZipFile(file_stream, "r") as z:
+            container_dom = minidom.parse(z.open("META-INF/container.xml"))
+            opf_path = container_dom.getElementsByTagName("rootfile")[0].getAttribute(
+                "full-path"
+            )
+            opf_dom = minidom.parse(z.open(opf_path))
+            return {"spine": len(opf_dom.getElementsByTagName("itemref"))}
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        return DocumentConverterResult.from_fragments(
+            self.convert_iter(file_stream, stream_info, **kwargs)
+        )
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Generator[str, None, Optional[str]]:
         with zipfile.ZipFile(file_stream, "r") as z:
             # Extracts metadata (title, authors, language, publisher, date, description, cover) from an EPUB file."""
 
@@ -97,10 +128,29 @@ class EpubConverter(HtmlConverter):
                 if item_id in manifest
             ]
 
-            # Extract and convert the content
-            markdown_content: List[str] = []
-            for file in spine:
-                if file in z.namelist():
+            # Format and yield the metadata
+            metadata_markdown = []
+            for key, value in metadata.items():
+                if isinstance(value, list):
+                    value = ", ".join(value)
+                if value:
+                    metadata_markdown.append(f"**{key.capitalize()}:** {value}")
+
+            yield "\n".join(metadata_markdown)
+
+            # Extract, convert, and yield the content, one spine file at a time.
+            # (namelist() builds a new list on each call, so look up in a set.)
+            members = set(z.namelist())
+            budget = budget_of(kwargs)
+            for i, file in enumerate(spine):
+                if deadline_passed(kwargs):
+                    yield TRUNCATION_MARKER
+                    break
+                if budget.exhausted:
+                    budget.skip("chapters", len(spine) - i)
+                    break
+                raise_if_cancelled(kwargs)
+                if file in members:
                     with z.open(file) as f:
                         filename = os.path.basename(file)
                         extension = os.path.splitext(filename)[1].lower()
@@ -113,21 +163,9 @@ class EpubConverter(HtmlConverter):
                                 filename=filename,
                             ),
                         )
-                        markdown_content.append(converted_content.markdown.strip())
-
-            # Format and add the metadata
-            metadata_markdown = []
-            for key, value in metadata.items():
-                if isinstance(value, list):
-                    value = ", ".join(value)
-                if value:
-                    metadata_markdown.append(f"**{key.capitalize()}:** {value}")
+                        yield "\n\n" + converted_content.markdown.strip()
 
-            markdown_content.insert(0, "\n".join(metadata_markdown))
-
-            return DocumentConverterResult(
-                markdown="\n\n".join(markdown_content), title=metadata["title"]
-            )
+            return metadata["title"]
 
     def _get_text_from_node(self, dom: Document, tag_name: str) -> str | None:
         """Convenience function to extract a single occurrence of a tag (e.g., title)."""
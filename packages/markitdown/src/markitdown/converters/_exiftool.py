@@ -3,6 +3,8 @@ import subprocess
 import locale
 from typing import BinaryIO, Any, Union
 
+from .._buffer import read_buffer
+
 
 def exiftool_metadata(
     file_stream: BinaryIO,
@@ -18,7 +20,7 @@ def exiftool_metadata(
     try:
         output = subprocess.run(
             [exiftool_path, "-json", "-"],
-            input=file_stream.read(),
+            input=read_buffer(file_stream),
             capture_output=True,
             text=False,
         ).stdout
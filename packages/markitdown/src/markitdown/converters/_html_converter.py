@@ -20,6 +20,9 @@ ACCEPTED_FILE_EXTENSIONS = [
 class HtmlConverter(DocumentConverter):
     """Anything with content type text/html"""
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -67,7 +70,12 @@ class HtmlConverter(DocumentConverter):
 
         return DocumentConverterResult(
             markdown=webpage_text,
-            title=None if soup.title is None else soup.title.string,
+            # A str, as a NavigableString references (and pickles) the whole tree
+            title=(
+                None
+                if soup.title is None or soup.title.string is None
+                else str(soup.title.string)
+            ),
         )
 
     def convert_string(
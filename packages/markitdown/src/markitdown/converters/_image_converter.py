@@ -1,10 +1,12 @@
-from typing import BinaryIO, Any, Union
+from typing import BinaryIO, Any, Dict, Optional, Union
 import base64
 import mimetypes
 from ._exiftool import exiftool_metadata
 from ._llm_caption import llm_caption
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from .._cancellation import TRUNCATION_MARKER, deadline_passed, remaining_time
+from .._exceptions import ConversionTimeoutException
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "image/jpeg",
@@ -19,6 +21,9 @@ class ImageConverter(DocumentConverter):
     Converts images to markdown via extraction of metadata (if `exiftool` is installed), and description via a multimodal LLM (if an llm_client is configured).
     """
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -37,6 +42,17 @@ class ImageConverter(DocumentConverter):
 
         return False
 
+    def probe(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Dict[str, Any]:
+        # Images are described by an LLM, if one is configured
+        if kwargs.get("llm_client") is not None and kwargs.get("llm_model") is not None:
+            return {"remote": True}
+        return {}
+
     def convert(
         self,
         file_stream: BinaryIO,
@@ -70,13 +86,23 @@ class ImageConverter(DocumentConverter):
         llm_client = kwargs.get("llm_client")
         llm_model = kwargs.get("llm_model")
         if llm_client is not None and llm_model is not None:
-            llm_description = self._get_llm_description(
-                file_stream,
-                stream_info,
-                client=llm_client,
-                model=llm_model,
-                prompt=kwargs.get("llm_prompt"),
-            )
+            try:
+                llm_description = self._get_llm_description(
+                    file_stream,
+                    stream_info,
+                    client=llm_client,
+                    model=llm_model,
+                    prompt=kwargs.get("llm_prompt"),
+                    timeout=remaining_time(kwargs),
+                )
+            except ConversionTimeoutException:
+                # Out of time: the metadata is all there is
+                return DocumentConverterResult(markdown=md_content + TRUNCATION_MARKER)
+            except Exception:
+                # (E.g., the timeout error of the client, once the deadline passed)
+                if not deadline_passed(kwargs):
+                    raise
+                return DocumentConverterResult(markdown=md_content + TRUNCATION_MARKER)
 
             if llm_description is not None:
                 md_content += "\n# Description:\n" + llm_description.strip() + "\n"
@@ -93,7 +119,13 @@ class ImageConverter(DocumentConverter):
         client,
         model,
         prompt=None,
+        timeout: Optional[float] = None,
     ) -> Union[None, str]:
         return llm_caption(
-            file_stream, stream_info, client=client, model=model, prompt=prompt
+            file_stream,
+            stream_info,
+            client=client,
+            model=model,
+            prompt=prompt,
+            timeout=timeout,
         )
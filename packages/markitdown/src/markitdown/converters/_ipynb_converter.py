@@ -4,6 +4,8 @@ import json
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._exceptions import FileConversionException
 from .._stream_info import StreamInfo
+from .._buffer import read_buffer
+from .._sniff import sniff_of
 
 CANDIDATE_MIME_TYPE_PREFIXES = [
     "application/json",
@@ -15,6 +17,9 @@ ACCEPTED_FILE_EXTENSIONS = [".ipynb"]
 class IpynbConverter(DocumentConverter):
     """Converts Jupyter Notebook (.ipynb) files to Markdown."""
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = CANDIDATE_MIME_TYPE_PREFIXES
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -29,17 +34,19 @@ class IpynbConverter(DocumentConverter):
 
         for prefix in CANDIDATE_MIME_TYPE_PREFIXES:
             if mimetype.startswith(prefix):
-                # Read further to see if it's a notebook
-                cur_pos = file_stream.tell()
+                # Look for the notebook format, which usually follows the cells, in
+                # the start and end of the document
+                sniff = sniff_of(file_stream, kwargs)
                 try:
-                    encoding = stream_info.charset or "utf-8"
-                    notebook_content = file_stream.read().decode(encoding)
-                    return (
-                        "nbformat" in notebook_content
-                        and "nbformat_minor" in notebook_content
-                    )
-                finally:
-                    file_stream.seek(cur_pos)
+                    texts = [
+                        sniff.text(stream_info.charset),
+                        sniff.suffix_text(stream_info.charset),
+                    ]
+                except (UnicodeDecodeError, LookupError):
+                    return False
+                return any(
+                    "nbformat" in text and "nbformat_minor" in text for text in texts
+                )
 
         return False
 
@@ -49,9 +56,14 @@ class IpynbConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        # Parse and convert the notebook
+        # Parse and convert the notebook (decoded once, by accepts(), if it was sniffed
+        # in full)
         encoding = stream_info.charset or "utf-8"
-        notebook_content = file_stream.read().decode(encoding=encoding)
+        sniff = sniff_of(file_stream, kwargs)
+        if sniff.complete:
+            notebook_content = sniff.text(encoding)
+        else:
+            notebook_content = str(read_buffer(file_stream), encoding)
         return self._convert(json.loads(notebook_content))
 
     def _convert(self, notebook_content: dict) -> DocumentConverterResult:
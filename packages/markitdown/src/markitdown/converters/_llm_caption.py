@@ -1,14 +1,25 @@
-from typing import BinaryIO, Union
+from typing import BinaryIO, Optional, Union
 import base64
 import mimetypes
 
 from .._llm_utils import get_llm_prompt
 from .._stream_info import StreamInfo
+from .._buffer import read_buffer
+from .._exceptions import ConversionTimeoutException
 
 
 def llm_caption(
-    file_stream: BinaryIO, stream_info: StreamInfo, *, client, model, prompt=None
+    file_stream: BinaryIO,
+    stream_info: StreamInfo,
+    *,
+    client,
+    model,
+    prompt=None,
+    # Seconds, e.g., the remaining_time() of a conversion
+    timeout: Optional[float] = None,
 ) -> Union[None, str]:
+    if timeout is not None and timeout <= 0:
+        raise ConversionTimeoutException("No time is left to caption the image.")
     prompt = get_llm_prompt(prompt)
 
     # Get the content type
@@ -21,7 +32,7 @@ def llm_caption(
     # Convert to base64
     cur_pos = file_stream.tell()
     try:
-        base64_image = base64.b64encode(file_stream.read()).decode("utf-8")
+        base64_image = base64.b64encode(read_buffer(file_stream)).decode("utf-8")
     except Exception as e:
         return None
     finally:
@@ -46,6 +57,9 @@ def llm_caption(
         }
     ]
 
-    # Call the OpenAI API
-    response = client.chat.completions.create(model=model, messages=messages)
+    # Call the OpenAI API (the client's own timeout applies, unless one is given)
+    request_kwargs = {} if timeout is None else {"timeout": timeout}
+    response = client.chat.completions.create(
+        model=model, messages=messages, **request_kwargs
+    )
     return response.choices[0].message.content
@@ -1,18 +1,17 @@
-import sys
 from typing import Any, Union, BinaryIO
 from .._stream_info import StreamInfo
-from .._base_converter import DocumentConverter, DocumentConverterResult
+from .._base_converter import (
+    DocumentConverter,
+    DocumentConverterResult,
+    GUESS_INDEPENDENT_FAILURE_TYPES,
+)
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
+from .._lazy_imports import LazyModule, dependency_exc_info
+from .._sniff import sniff_of
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-olefile = None
-try:
-    import olefile  # type: ignore[no-redef]
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+# Optional (but in this case, required) dependencies are imported lazily, the first
+# time a conversion needs them. Import errors are reported at that point.
+olefile = LazyModule("olefile")
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "application/vnd.ms-outlook",
@@ -20,6 +19,14 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".msg"]
 
+# The signature of OLE compound files, and the names of the streams of an Outlook
+# message, as they appear in the directory of the file
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+OUTLOOK_STREAM_NAMES = [
+    "__properties_version1.0".encode("utf-16-le"),
+    "__recip_version1.0_#00000000".encode("utf-16-le"),
+]
+
 
 class OutlookMsgConverter(DocumentConverter):
     """Converts Outlook .msg files to markdown by extracting email metadata and content.
@@ -29,6 +36,8 @@ class OutlookMsgConverter(DocumentConverter):
     - Email body content
     """
 
+    content_failure_types = GUESS_INDEPENDENT_FAILURE_TYPES
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -46,29 +55,17 @@ class OutlookMsgConverter(DocumentConverter):
             if mimetype.startswith(prefix):
                 return True
 
-        # Brute force, check if we have an OLE file
-        cur_pos = file_stream.tell()
-        try:
-            if olefile and not olefile.isOleFile(file_stream):
+        # Check the sniffed content: an OLE file, whose directory (which is near the
+        # start of all but the largest files) has the streams of an Outlook message
+        sniff = sniff_of(file_stream, kwargs)
+        if not sniff.prefix.startswith(OLE_MAGIC):
+            return False
+        for name in OUTLOOK_STREAM_NAMES:
+            if name not in sniff.prefix and name not in sniff.suffix:
                 return False
-        finally:
-            file_stream.seek(cur_pos)
-
-        # Brue force, check if it's an Outlook file
-        try:
-            if olefile is not None:
-                msg = olefile.OleFileIO(file_stream)
-                toc = "\n".join([str(stream) for stream in msg.listdir()])
-                return (
-                    "__properties_version1.0" in toc
-                    and "__recip_version1.0_#00000000" in toc
-                )
-        except Exception as e:
-            pass
-        finally:
-            file_stream.seek(cur_pos)
 
-        return False
+        # Converting requires olefile
+        return dependency_exc_info(olefile) is None
 
     def convert(
         self,
@@ -77,6 +74,7 @@ class OutlookMsgConverter(DocumentConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         # Check: the dependencies
+        _dependency_exc_info = dependency_exc_info(olefile)
         if _dependency_exc_info is not None:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
@@ -90,9 +88,6 @@ class OutlookMsgConverter(DocumentConverter):
                 _dependency_exc_info[2]
             )
 
-        assert (
-            olefile is not None
-        )  # If we made it this far, olefile should be available
         msg = olefile.OleFileIO(file_stream)
 
         # Extract email metadata
@@ -126,7 +121,6 @@ class OutlookMsgConverter(DocumentConverter):
 
     def _get_stream_data(self, msg: Any, stream_path: str) -> Union[str, None]:
         """Helper to safely extract and decode stream data from the MSG file."""
-        assert olefile is not None
         assert isinstance(
             msg, olefile.OleFileIO
         )  # Ensure msg is of the correct type (type hinting is not possible with the optional olefile package)
@@ -1,23 +1,43 @@
-import sys
+import concurrent.futures
 import io
+import multiprocessing
 
-from typing import BinaryIO, Any
+from typing import (
+    BinaryIO,
+    Any,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 
-from .._base_converter import DocumentConverter, DocumentConverterResult
+from .._base_converter import (
+    DocumentConverter,
+    DocumentConverterResult,
+    GUESS_INDEPENDENT_FAILURE_TYPES,
+)
 from .._stream_info import StreamInfo
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
+from .._lazy_imports import LazyModule, dependency_exc_info
+from .._cancellation import TRUNCATION_MARKER, deadline_passed, raise_if_cancelled
+from .._budget import budget_of
 
-
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
-    import pdfminer
-    import pdfminer.high_level
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+# Optional (but in this case, required) dependencies are imported lazily, the first
+# time a conversion needs them. Import errors are reported at that point.
+pdfminer = LazyModule(
+    "pdfminer",
+    "pdfminer.converter",
+    "pdfminer.layout",
+    "pdfminer.pdfdocument",
+    "pdfminer.pdfinterp",
+    "pdfminer.pdfpage",
+    "pdfminer.pdfparser",
+    "pdfminer.pdftypes",
+)
 
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
@@ -27,12 +47,87 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".pdf"]
 
+# The pages extracted by each task of page-parallel extraction (see the pdf_workers
+# option), unless set by the pdf_pages_per_chunk option
+DEFAULT_PAGES_PER_CHUNK = 16
+
+# How often the parent checks the deadline and cancellation of the conversion while
+# it waits for the workers of page-parallel extraction
+POLL_INTERVAL = 0.1  # Seconds
+
+
+def _page_count(file_stream: BinaryIO) -> Optional[int]:
+    """
+    The number of pages of a PDF, read from the page tree of its document catalog,
+    which is found through the cross-reference table, without parsing any page.
+    """
+    parser = pdfminer.pdfparser.PDFParser(file_stream)
+    document = pdfminer.pdfdocument.PDFDocument(parser)
+    pages = pdfminer.pdftypes.resolve1(document.catalog.get("Pages"))
+    count = pdfminer.pdftypes.resolve1(pages.get("Count")) if pages else None
+    return count if isinstance(count, int) else None
+
+
+# The document of the worker processes of page-parallel extraction, and its pages,
+# which are parsed once per worker, on its first task
+_worker_source: Union[str, bytes, None] = None
+_worker_pages: Optional[List[Any]] = None
+
+
+def _init_page_worker(source: Union[str, bytes]) -> None:
+    global _worker_source, _worker_pages
+    _worker_source = source
+    _worker_pages = None
+
+
+def _extract_pages(start: int, end: int) -> Tuple[int, List[str]]:
+    """
+    Extract the text of the pages [start, end) of the document of this worker.
+    Returns the number of pages of the document (from its page tree), and the texts.
+    """
+    global _worker_pages
+    if _worker_pages is None:
+        assert _worker_source is not None
+        if isinstance(_worker_source, str):
+            # (The file stays open for the life of the worker)
+            fh: BinaryIO = open(_worker_source, "rb")
+        else:
+            fh = io.BytesIO(_worker_source)
+        _worker_pages = list(pdfminer.pdfpage.PDFPage.get_pages(fh, caching=True))
+
+    texts: List[str] = []
+    with io.StringIO() as output_string:
+        resource_manager = pdfminer.pdfinterp.PDFResourceManager(caching=True)
+        device = pdfminer.converter.TextConverter(
+            resource_manager,
+            output_string,
+            codec="utf-8",
+            laparams=pdfminer.layout.LAParams(),
+        )
+        interpreter = pdfminer.pdfinterp.PDFPageInterpreter(resource_manager, device)
+        for page in _worker_pages[start:end]:
+            interpreter.process_page(page)
+            texts.append(output_string.getvalue())
+            output_string.seek(0)
+            output_string.truncate()
+    return len(_worker_pages), texts
+
 
 class PdfConverter(DocumentConverter):
     """
     Converts PDFs to Markdown. Most style information is ignored, so the results are essentially plain-text.
+
+    Pages are extracted one at a time, in order. With the pdf_workers option (greater
+    than 1), documents of more than pdf_pages_per_chunk pages are instead split into
+    chunks of that many pages (DEFAULT_PAGES_PER_CHUNK, by default), which are extracted
+    concurrently by that many worker processes, and stitched back in order: the output
+    is the same, page for page.
     """
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+    content_failure_types = GUESS_INDEPENDENT_FAILURE_TYPES
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -51,13 +146,35 @@ class PdfConverter(DocumentConverter):
 
         return False
 
+    def probe(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Dict[str, Any]:
+        if dependency_exc_info(pdfminer) is not None:
+            return {}
+        count = _page_count(file_stream)
+        return {} if count is None else {"pages": count}
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        return DocumentConverterResult.from_fragments(
+            self.convert_iter(file_stream, stream_info, **kwargs)
+        )
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Generator[str, None, Optional[str]]:
         # Check the dependencies
+        _dependency_exc_info = dependency_exc_info(pdfminer)
         if _dependency_exc_info is not None:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
@@ -71,7 +188,171 @@ class PdfConverter(DocumentConverter):
                 _dependency_exc_info[2]
             )
 
-        assert isinstance(file_stream, io.IOBase)  # for mypy
-        return DocumentConverterResult(
-            markdown=pdfminer.high_level.extract_text(file_stream),
+        workers = kwargs.get("pdf_workers")
+        if workers is not None and workers < 1:
+            raise ValueError(f"pdf_workers must be at least 1, got {workers}")
+        pages_per_chunk = kwargs.get("pdf_pages_per_chunk") or DEFAULT_PAGES_PER_CHUNK
+        if pages_per_chunk < 1:
+            raise ValueError(
+                f"pdf_pages_per_chunk must be at least 1, got {pages_per_chunk}"
+            )
+
+        # Daemonic processes (e.g., the workers of the isolation option of MarkItDown)
+        # cannot start workers of their own
+        if (
+            workers is not None
+            and workers > 1
+            and not multiprocessing.current_process().daemon
+        ):
+            cur_pos = file_stream.tell()
+            count = _page_count(file_stream)
+            file_stream.seek(cur_pos)
+            if count is not None and count > pages_per_chunk:
+                converted = yield from self._convert_parallel(
+                    file_stream, stream_info, count, workers, pages_per_chunk, kwargs
+                )
+                if converted:
+                    return None
+                # The page tree does not have the number of pages that the catalog
+                # claims: the pages are extracted serially instead
+                file_stream.seek(cur_pos)
+
+        # This is pdfminer.high_level.extract_text(), yielding the text of each page
+        # as soon as it is extracted, rather than all of it at the end.
+        with io.StringIO() as output_string:
+            resource_manager = pdfminer.pdfinterp.PDFResourceManager(caching=True)
+            device = pdfminer.converter.TextConverter(
+                resource_manager,
+                output_string,
+                codec="utf-8",
+                laparams=pdfminer.layout.LAParams(),
+            )
+            interpreter = pdfminer.pdfinterp.PDFPageInterpreter(
+                resource_manager, device
+            )
+
+            budget = budget_of(kwargs)
+            pages = pdfminer.pdfpage.PDFPage.get_pages(file_stream, caching=True)
+            for i, page in enumerate(pages):
+                if deadline_passed(kwargs):
+                    yield TRUNCATION_MARKER
+                    break
+                if not budget.allows("pages", i):
+                    # (Counting the pages left does not extract them)
+                    budget.skip("pages", 1 + sum(1 for _ in pages))
+                    break
+                raise_if_cancelled(kwargs)
+                interpreter.process_page(page)
+                yield output_string.getvalue()
+                output_string.seek(0)
+                output_string.truncate()
+
+        return None
+
+    def _convert_parallel(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        count: int,
+        workers: int,
+        pages_per_chunk: int,
+        kwargs: Dict[str, Any],
+    ) -> Generator[str, None, bool]:
+        """
+        Extract the pages in chunks of pages_per_chunk, in a pool of worker processes,
+        and yield the text of each page, in order, as soon as its chunk (and those
+        before it) is extracted. Local files are read by the workers; other streams
+        are read here, and sent to them.
+
+        The chunks are planned from the page count of the catalog (count). Returns
+        False, having yielded nothing, if the page tree has another number of pages.
+        """
+        budget = budget_of(kwargs)
+        # Pages beyond max_pages are never extracted
+        end = count
+        while end > 0 and not budget.allows("pages", end - 1):
+            end -= 1
+        chunks = [
+            (start, min(start + pages_per_chunk, end))
+            for start in range(0, end, pages_per_chunk)
+        ]
+
+        source: Union[str, bytes]
+        path = stream_info.local_path
+        if path is not None and getattr(file_stream, "name", None) == path:
+            source = path
+        else:
+            source = file_stream.read()
+
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(workers, max(len(chunks), 1)),
+            initializer=_init_page_worker,
+            initargs=(source,),
         )
+        try:
+            extracted = 0
+            try:
+                for text in _ordered_pages(executor, chunks, workers, count, kwargs):
+                    if deadline_passed(kwargs):
+                        break
+                    if not budget.allows("pages", extracted):
+                        # (Reached max_output_chars)
+                        budget.skip("pages", count - extracted)
+                        return True
+                    raise_if_cancelled(kwargs)
+                    yield text
+                    extracted += 1
+            except _PageCountMismatch:
+                # (Every worker reads the same page tree, so that the first chunk
+                # tells, before anything is yielded)
+                assert extracted == 0
+                return False
+            if extracted < end and deadline_passed(kwargs):
+                yield TRUNCATION_MARKER
+                return True
+            budget.skip("pages", count - end)
+            return True
+        finally:
+            # Chunks that are still queued are dropped, and the workers exit once
+            # they finish the chunks they are extracting
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _PageCountMismatch(Exception):
+    """The page tree of a PDF does not have the number of pages of its catalog."""
+
+
+def _ordered_pages(
+    executor: concurrent.futures.Executor,
+    chunks: List[Tuple[int, int]],
+    workers: int,
+    count: int,
+    kwargs: Dict[str, Any],
+) -> Iterator[str]:
+    """
+    Yield the text of the pages of the chunks, in order, as they are extracted by
+    the executor, until the deadline of the conversion passes. Raises
+    _PageCountMismatch if the document does not have count pages. Twice as many
+    chunks as there are workers are queued at any time, so that the workers need not
+    wait for the parent, while the pages that are extracted ahead of the output are
+    bounded.
+    """
+    pending: List[concurrent.futures.Future] = []
+    next_chunk = 0
+    while next_chunk < len(chunks) or pending:
+        while next_chunk < len(chunks) and len(pending) < 2 * workers:
+            pending.append(executor.submit(_extract_pages, *chunks[next_chunk]))
+            next_chunk += 1
+
+        future = pending.pop(0)
+        while True:
+            try:
+                pages, texts = future.result(timeout=POLL_INTERVAL)
+                break
+            except concurrent.futures.TimeoutError:
+                if deadline_passed(kwargs):
+                    return
+                raise_if_cancelled(kwargs)
+        if pages != count:
+            raise _PageCountMismatch()
+        yield from texts
@@ -1,18 +1,8 @@
-import sys
-
 from typing import BinaryIO, Any
 from charset_normalizer import from_bytes
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
-    import mammoth  # noqa: F401
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+from .._buffer import read_buffer
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/",
@@ -63,9 +53,11 @@ class PlainTextConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        # Memory-mapped local files are decoded in place, rather than copied first
+        content = read_buffer(file_stream)
         if stream_info.charset:
-            text_content = file_stream.read().decode(stream_info.charset)
+            text_content = str(content, stream_info.charset)
         else:
-            text_content = str(from_bytes(file_stream.read()).best())
+            text_content = str(from_bytes(bytes(content)).best())
 
         return DocumentConverterResult(markdown=text_content)
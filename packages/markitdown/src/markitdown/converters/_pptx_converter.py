@@ -1,27 +1,34 @@
-import sys
 import base64
 import os
 import io
 import re
 import html
+import zipfile
 
-from typing import BinaryIO, Any
+from typing import BinaryIO, Any, Dict, Generator, Optional
 from operator import attrgetter
 
 from ._html_converter import HtmlConverter
 from ._llm_caption import llm_caption
-from .._base_converter import DocumentConverter, DocumentConverterResult
+from .._base_converter import (
+    DocumentConverter,
+    DocumentConverterResult,
+    GUESS_INDEPENDENT_FAILURE_TYPES,
+)
 from .._stream_info import StreamInfo
+from .._cancellation import (
+    TRUNCATION_MARKER,
+    deadline_passed,
+    raise_if_cancelled,
+    remaining_time,
+)
+from .._budget import budget_of
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
+from .._lazy_imports import LazyModule, dependency_exc_info
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
-    import pptx
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+# Optional (but in this case, required) dependencies are imported lazily, the first
+# time a conversion needs them. Import errors are reported at that point.
+pptx = LazyModule("pptx")
 
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
@@ -30,12 +37,19 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".pptx"]
 
+# The parts of a presentation that hold its slides
+_SLIDE_PART = re.compile(r"ppt/slides/slide\d+\.xml")
+
 
 class PptxConverter(DocumentConverter):
     """
     Converts PPTX files to Markdown. Supports heading, tables and images with alt text.
     """
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+    content_failure_types = GUESS_INDEPENDENT_FAILURE_TYPES
+
     def __init__(self):
         super().__init__()
         self._html_converter = HtmlConverter()
@@ -58,13 +72,34 @@ class PptxConverter(DocumentConverter):
 
         return False
 
+    def probe(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Dict[str, Any]:
+        # The slides are counted in the central directory of the package
+        with zipfile.ZipFile(file_stream, "r") as z:
+            return {"slides": sum(1 for n in z.namelist() if _SLIDE_PART.fullmatch(n))}
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        return DocumentConverterResult.from_fragments(
+            self.convert_iter(file_stream, stream_info, **kwargs)
+        )
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Generator[str, None, Optional[str]]:
         # Check the dependencies
+        _dependency_exc_info = dependency_exc_info(pptx)
         if _dependency_exc_info is not None:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
@@ -79,13 +114,23 @@ class PptxConverter(DocumentConverter):
             )
 
         # Perform the conversion
+        # Each slide is yielded as soon as it is converted
         presentation = pptx.Presentation(file_stream)
-        md_content = ""
+        budget = budget_of(kwargs)
         slide_num = 0
         for slide in presentation.slides:
+            if deadline_passed(kwargs):
+                yield TRUNCATION_MARKER
+                break
+            if not budget.allows("slides", slide_num):
+                budget.skip("slides", len(presentation.slides) - slide_num)
+                break
+            raise_if_cancelled(kwargs)
             slide_num += 1
 
-            md_content += f"\n\n<!-- Slide number: {slide_num} -->\n"
+            md_content = f"\n\n<!-- Slide number: {slide_num} -->\n"
+            if slide_num == 1:
+                md_content = md_content.lstrip()
 
             title = slide.shapes.title
 
@@ -123,6 +168,7 @@ class PptxConverter(DocumentConverter):
                                 client=llm_client,
                                 model=llm_model,
                                 prompt=kwargs.get("llm_prompt"),
+                                timeout=remaining_time(kwargs),
                             )
                         except Exception:
                             # Unable to generate a description
@@ -176,16 +222,18 @@ class PptxConverter(DocumentConverter):
             for shape in sorted_shapes:
                 get_shape_content(shape, **kwargs)
 
-            md_content = md_content.strip()
+            md_content = md_content.rstrip()
 
             if slide.has_notes_slide:
                 md_content += "\n\n### Notes:\n"
                 notes_frame = slide.notes_slide.notes_text_frame
                 if notes_frame is not None:
                     md_content += notes_frame.text
-                md_content = md_content.strip()
+                md_content = md_content.rstrip()
+
+            yield md_content
 
-        return DocumentConverterResult(markdown=md_content.strip())
+        return None
 
     def _is_picture(self, shape):
         if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
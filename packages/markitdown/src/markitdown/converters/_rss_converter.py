@@ -1,10 +1,12 @@
-from defusedxml import minidom
+from defusedxml import minidom, sax
 from xml.dom.minidom import Document, Element
-from typing import BinaryIO, Any, Union
+from xml.sax.handler import ContentHandler
+from typing import BinaryIO, Any, Dict, Generator, Optional, Union
 from bs4 import BeautifulSoup
 
 from ._markdownify import _CustomMarkdownify
 from .._stream_info import StreamInfo
+from .._sniff import SniffContext, sniff_of
 from .._base_converter import DocumentConverter, DocumentConverterResult
 
 PRECISE_MIME_TYPE_PREFIXES = [
@@ -25,13 +27,47 @@ CANDIDATE_FILE_EXTENSIONS = [
     ".xml",
 ]
 
+# The key of the feed type found by accepts(), in the state of the sniff context
+FEED_TYPE_STATE = "rss.feed_type"
+
+
+class _FeedTypeFound(Exception):
+    pass
+
+
+class _FeedTypeHandler(ContentHandler):
+    """
+    Finds the feed type of a document, like RssConverter._feed_type(), from the
+    start of the document, stopping (by raising _FeedTypeFound) once it is known.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.feed_type: Optional[str] = None
+        self._feed_depth = 0  # How many <feed> elements the parser is in
+
+    def startElement(self, name: str, attrs: Any) -> None:
+        if name == "rss":
+            self.feed_type = "rss"
+        elif name == "feed":
+            self._feed_depth += 1
+        elif name == "entry" and self._feed_depth > 0:
+            self.feed_type = "atom"
+        if self.feed_type is not None:
+            raise _FeedTypeFound()
+
+    def endElement(self, name: str) -> None:
+        if name == "feed":
+            self._feed_depth -= 1
+
 
 class RssConverter(DocumentConverter):
     """Convert RSS / Atom type to markdown"""
 
-    def __init__(self):
-        super().__init__()
-        self._kwargs = {}
+    accepted_file_extensions = PRECISE_FILE_EXTENSIONS + CANDIDATE_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = (
+        PRECISE_MIME_TYPE_PREFIXES + CANDIDATE_MIME_TYPE_PREFIXES
+    )
 
     def accepts(
         self,
@@ -52,24 +88,32 @@ class RssConverter(DocumentConverter):
 
         # Check for precise mimetypes and file extensions
         if extension in CANDIDATE_FILE_EXTENSIONS:
-            return self._check_xml(file_stream)
+            return self._check_xml(file_stream, kwargs)
 
         for prefix in CANDIDATE_MIME_TYPE_PREFIXES:
             if mimetype.startswith(prefix):
-                return self._check_xml(file_stream)
+                return self._check_xml(file_stream, kwargs)
 
         return False
 
-    def _check_xml(self, file_stream: BinaryIO) -> bool:
-        cur_pos = file_stream.tell()
-        try:
-            doc = minidom.parse(file_stream)
-            return self._feed_type(doc) is not None
-        except BaseException as _:
-            pass
-        finally:
-            file_stream.seek(cur_pos)
-        return False
+    def _check_xml(self, file_stream: BinaryIO, kwargs: Dict[str, Any]) -> bool:
+        # Parse as much of the document as was sniffed, until the feed type is known,
+        # which is kept for convert()
+        sniff = sniff_of(file_stream, kwargs)
+        if FEED_TYPE_STATE not in sniff.state:
+            handler = _FeedTypeHandler()
+            parser = sax.make_parser()
+            parser.setContentHandler(handler)
+            try:
+                parser.feed(sniff.prefix)
+                if sniff.complete:
+                    parser.close()
+            except _FeedTypeFound:
+                pass
+            except Exception:
+                handler.feed_type = None
+            sniff.state[FEED_TYPE_STATE] = handler.feed_type
+        return sniff.state[FEED_TYPE_STATE] is not None
 
     def _feed_type(self, doc: Any) -> str | None:
         if doc.getElementsByTagName("rss"):
@@ -87,21 +131,37 @@ class RssConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        self._kwargs = kwargs
+        return DocumentConverterResult.from_fragments(
+            self.convert_iter(file_stream, stream_info, **kwargs)
+        )
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Generator[str, None, Optional[str]]:
+        # The feed type may already be known, from accepts()
+        sniff = kwargs.get("sniff")
+        feed_type = None
+        if isinstance(sniff, SniffContext) and sniff.describes(file_stream):
+            feed_type = sniff.state.get(FEED_TYPE_STATE)
         doc = minidom.parse(file_stream)
-        feed_type = self._feed_type(doc)
+        if feed_type is None:
+            feed_type = self._feed_type(doc)
 
         if feed_type == "rss":
-            return self._parse_rss_type(doc)
+            return (yield from self._parse_rss_type(doc, kwargs))
         elif feed_type == "atom":
-            return self._parse_atom_type(doc)
+            return (yield from self._parse_atom_type(doc, kwargs))
         else:
             raise ValueError("Unknown feed type")
 
-    def _parse_atom_type(self, doc: Document) -> DocumentConverterResult:
-        """Parse the type of an Atom feed.
-
-        Returns None if the feed type is not recognized or something goes wrong.
+    def _parse_atom_type(
+        self, doc: Document, kwargs: Dict[str, Any]
+    ) -> Generator[str, None, Optional[str]]:
+        """Parse the type of an Atom feed, yielding the markdown of each entry in turn,
+        and returning the title of the feed.
         """
         root = doc.getElementsByTagName("feed")[0]
         title = self._get_data_by_tag_name(root, "title")
@@ -110,30 +170,31 @@ class RssConverter(DocumentConverter):
         md_text = f"# {title}\n"
         if subtitle:
             md_text += f"{subtitle}\n"
+        yield md_text
         for entry in entries:
             entry_title = self._get_data_by_tag_name(entry, "title")
             entry_summary = self._get_data_by_tag_name(entry, "summary")
             entry_updated = self._get_data_by_tag_name(entry, "updated")
             entry_content = self._get_data_by_tag_name(entry, "content")
 
+            md_text = ""
             if entry_title:
                 md_text += f"\n## {entry_title}\n"
             if entry_updated:
                 md_text += f"Updated on: {entry_updated}\n"
             if entry_summary:
-                md_text += self._parse_content(entry_summary)
+                md_text += self._parse_content(entry_summary, kwargs)
             if entry_content:
-                md_text += self._parse_content(entry_content)
+                md_text += self._parse_content(entry_content, kwargs)
+            yield md_text
 
-        return DocumentConverterResult(
-            markdown=md_text,
-            title=title,
-        )
+        return title
 
-    def _parse_rss_type(self, doc: Document) -> DocumentConverterResult:
-        """Parse the type of an RSS feed.
-
-        Returns None if the feed type is not recognized or something goes wrong.
+    def _parse_rss_type(
+        self, doc: Document, kwargs: Dict[str, Any]
+    ) -> Generator[str, None, Optional[str]]:
+        """Parse the type of an RSS feed, yielding the markdown of each item in turn,
+        and returning the title of the channel.
         """
         root = doc.getElementsByTagName("rss")[0]
         channel_list = root.getElementsByTagName("channel")
@@ -143,36 +204,37 @@ class RssConverter(DocumentConverter):
         channel_title = self._get_data_by_tag_name(channel, "title")
         channel_description = self._get_data_by_tag_name(channel, "description")
         items = channel.getElementsByTagName("item")
-        if channel_title:
-            md_text = f"# {channel_title}\n"
+        if not channel_title:
+            raise ValueError("No channel title found in RSS feed")
+        md_text = f"# {channel_title}\n"
         if channel_description:
             md_text += f"{channel_description}\n"
+        yield md_text
         for item in items:
             title = self._get_data_by_tag_name(item, "title")
             description = self._get_data_by_tag_name(item, "description")
             pubDate = self._get_data_by_tag_name(item, "pubDate")
             content = self._get_data_by_tag_name(item, "content:encoded")
 
+            md_text = ""
             if title:
                 md_text += f"\n## {title}\n"
             if pubDate:
                 md_text += f"Published on: {pubDate}\n"
             if description:
-                md_text += self._parse_content(description)
+                md_text += self._parse_content(description, kwargs)
             if content:
-                md_text += self._parse_content(content)
+                md_text += self._parse_content(content, kwargs)
+            yield md_text
 
-        return DocumentConverterResult(
-            markdown=md_text,
-            title=channel_title,
-        )
+        return channel_title
 
-    def _parse_content(self, content: str) -> str:
+    def _parse_content(self, content: str, kwargs: Dict[str, Any]) -> str:
         """Parse the content of an RSS feed item"""
         try:
             # using bs4 because many RSS feeds have HTML-styled content
             soup = BeautifulSoup(content, "html.parser")
-            return _CustomMarkdownify(**self._kwargs).convert_soup(soup)
+            return _CustomMarkdownify(**kwargs).convert_soup(soup)
         except BaseException as _:
             return content
 
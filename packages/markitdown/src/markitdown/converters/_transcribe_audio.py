@@ -1,27 +1,26 @@
 import io
-import sys
-from typing import BinaryIO
-from .._exceptions import MissingDependencyException
+from typing import BinaryIO, Optional
+from .._exceptions import ConversionTimeoutException, MissingDependencyException
+from .._lazy_imports import LazyModule, dependency_exc_info
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
-    # Suppress some warnings on library import
-    import warnings
+# Optional (but in this case, required) dependencies are imported lazily, the first
+# time a conversion needs them. Import errors are reported at that point.
+# Some warnings are suppressed on library import.
+sr = LazyModule(
+    "speech_recognition", ignore_warnings=[DeprecationWarning, SyntaxWarning]
+)
+pydub = LazyModule("pydub", ignore_warnings=[DeprecationWarning, SyntaxWarning])
 
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=DeprecationWarning)
-        warnings.filterwarnings("ignore", category=SyntaxWarning)
-        import speech_recognition as sr
-        import pydub
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
 
-
-def transcribe_audio(file_stream: BinaryIO, *, audio_format: str = "wav") -> str:
+def transcribe_audio(
+    file_stream: BinaryIO,
+    *,
+    audio_format: str = "wav",
+    # Seconds, e.g., the remaining_time() of a conversion
+    timeout: Optional[float] = None,
+) -> str:
     # Check for installed dependencies
+    _dependency_exc_info = dependency_exc_info(sr, pydub)
     if _dependency_exc_info is not None:
         raise MissingDependencyException(
             "Speech transcription requires installing MarkItdown with the [audio-transcription] optional dependencies. E.g., `pip install markitdown[audio-transcription]` or `pip install markitdown[all]`"
@@ -42,7 +41,12 @@ def transcribe_audio(file_stream: BinaryIO, *, audio_format: str = "wav") -> str
     else:
         raise ValueError(f"Unsupported audio format: {audio_format}")
 
+    if timeout is not None and timeout <= 0:
+        raise ConversionTimeoutException("No time is left to transcribe the audio.")
+
     recognizer = sr.Recognizer()
+    # Bounds the call to the speech recognition service
+    recognizer.operation_timeout = timeout
     with sr.AudioFile(audio_source) as source:
         audio = recognizer.record(source)
         transcript = recognizer.recognize_google(audio).strip()
@@ -20,6 +20,9 @@ ACCEPTED_FILE_EXTENSIONS = [
 class WikipediaConverter(DocumentConverter):
     """Handle Wikipedia pages separately, focusing only on the main document content."""
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -83,5 +86,6 @@ class WikipediaConverter(DocumentConverter):
 
         return DocumentConverterResult(
             markdown=webpage_text,
-            title=main_title,
+            # A str, as a NavigableString references (and pickles) the whole tree
+            title=None if main_title is None else str(main_title),
         )
@@ -1,25 +1,25 @@
-import sys
-from typing import BinaryIO, Any
+import posixpath
+import re
+import zipfile
+from typing import BinaryIO, Any, Dict, Generator, Iterator, Optional
+from defusedxml import ElementTree
 from ._html_converter import HtmlConverter
-from .._base_converter import DocumentConverter, DocumentConverterResult
+from .._base_converter import (
+    DocumentConverter,
+    DocumentConverterResult,
+    GUESS_INDEPENDENT_FAILURE_TYPES,
+)
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
 from .._stream_info import StreamInfo
+from .._cancellation import TRUNCATION_MARKER, deadline_passed, raise_if_cancelled
+from .._budget import budget_of
+from .._lazy_imports import LazyModule, dependency_exc_info
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_xlsx_dependency_exc_info = None
-try:
-    import pandas as pd
-    import openpyxl  # noqa: F401
-except ImportError:
-    _xlsx_dependency_exc_info = sys.exc_info()
-
-_xls_dependency_exc_info = None
-try:
-    import pandas as pd  # noqa: F811
-    import xlrd  # noqa: F401
-except ImportError:
-    _xls_dependency_exc_info = sys.exc_info()
+# Optional (but in this case, required) dependencies are imported lazily, the first
+# time a conversion needs them. Import errors are reported at that point.
+pd = LazyModule("pandas")
+openpyxl = LazyModule("openpyxl")
+xlrd = LazyModule("xlrd")
 
 ACCEPTED_XLSX_MIME_TYPE_PREFIXES = [
     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
@@ -32,12 +32,124 @@ ACCEPTED_XLS_MIME_TYPE_PREFIXES = [
 ]
 ACCEPTED_XLS_FILE_EXTENSIONS = [".xls"]
 
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# The <dimension> element comes before the data of a worksheet, so only the start
+# of the worksheet part is read to find it
+_DIMENSION_PREFIX_SIZE = 4096
+_DIMENSION = re.compile(
+    rb'<(?:\w+:)?dimension\s+ref="([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?"'
+)
+
+
+def _convert_sheets(
+    workbook: Any, html_converter: HtmlConverter, **kwargs: Any
+) -> Iterator[str]:
+    """
+    Convert the sheets of a pandas.ExcelFile to Markdown tables, one at a time, so that
+    only one sheet is loaded at once, and each is yielded as soon as it is converted.
+    """
+    budget = budget_of(kwargs)
+    max_rows = budget.max_rows_per_table
+    for i, sheet_name in enumerate(workbook.sheet_names):
+        if deadline_passed(kwargs):
+            yield TRUNCATION_MARKER
+            break
+        if not budget.allows("sheets", i):
+            budget.skip("sheets", len(workbook.sheet_names) - i)
+            break
+        raise_if_cancelled(kwargs)
+
+        if max_rows is None:
+            sheet = workbook.parse(sheet_name)
+        else:
+            # Only the rows to convert are read (and one more, to tell whether
+            # there are more). (Reading resets the dimensions of the sheet.)
+            rows = _sheet_rows(workbook, sheet_name)
+            sheet = workbook.parse(sheet_name, nrows=max_rows + 1)
+            if len(sheet) > max_rows:
+                sheet = sheet.iloc[:max_rows]
+                # (At least one, if the size of the sheet is unknown)
+                skipped = 1 if rows is None else max(rows - 1 - max_rows, 1)
+                budget.skip("rows", skipped)
+
+        html_content = sheet.to_html(index=False)
+        yield (
+            ("\n\n" if i > 0 else "")
+            + f"## {sheet_name}\n"
+            + html_converter.convert_string(html_content, **kwargs).markdown.strip()
+        )
+
+
+def _sheet_rows(workbook: Any, sheet_name: str) -> Optional[int]:
+    """
+    The number of rows of a sheet (including its header), from the dimensions
+    recorded in the workbook, without reading the rows, or None if unknown.
+    """
+    try:
+        book = workbook.book
+        if hasattr(book, "sheet_by_name"):  # xlrd
+            return book.sheet_by_name(sheet_name).nrows
+        return book[sheet_name].max_row  # openpyxl
+    except Exception:
+        return None
+
+
+def _column_number(letters: bytes) -> int:
+    number = 0
+    for letter in letters:
+        number = number * 26 + letter - ord("A") + 1
+    return number
+
+
+def _xlsx_dimensions(z: zipfile.ZipFile) -> Dict[str, Optional[Dict[str, int]]]:
+    """
+    The number of rows and columns of each sheet of an XLSX package, by name, from
+    the dimensions recorded in the sheets, or None for sheets that do not record them.
+    """
+    workbook = ElementTree.fromstring(z.read("xl/workbook.xml"))
+    rels = ElementTree.fromstring(z.read("xl/_rels/workbook.xml.rels"))
+    targets = {
+        rel.get("Id"): rel.get("Target", "")
+        for rel in rels.iter(f"{_PACKAGE_REL_NS}Relationship")
+    }
+
+    dimensions: Dict[str, Optional[Dict[str, int]]] = {}
+    for sheet in workbook.iter(f"{_MAIN_NS}sheet"):
+        target = targets.get(sheet.get(f"{_REL_NS}id"), "")
+        if target.startswith("/"):
+            part = target[1:]
+        else:
+            part = posixpath.normpath(posixpath.join("xl", target))
+        match = None
+        try:
+            with z.open(part) as fh:
+                match = _DIMENSION.search(fh.read(_DIMENSION_PREFIX_SIZE))
+        except KeyError:
+            pass
+        if match is None:
+            dimensions[sheet.get("name", "")] = None
+            continue
+        first_col, first_row, last_col, last_row = match.groups()
+        last_col, last_row = last_col or first_col, last_row or first_row
+        dimensions[sheet.get("name", "")] = {
+            "rows": int(last_row) - int(first_row) + 1,
+            "columns": _column_number(last_col) - _column_number(first_col) + 1,
+        }
+    return dimensions
+
 
 class XlsxConverter(DocumentConverter):
     """
     Converts XLSX files to Markdown, with each sheet presented as a separate Markdown table.
     """
 
+    accepted_file_extensions = ACCEPTED_XLSX_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_XLSX_MIME_TYPE_PREFIXES
+    content_failure_types = GUESS_INDEPENDENT_FAILURE_TYPES
+
     def __init__(self):
         super().__init__()
         self._html_converter = HtmlConverter()
@@ -60,13 +172,38 @@ class XlsxConverter(DocumentConverter):
 
         return False
 
+    def probe(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Dict[str, Any]:
+        with zipfile.ZipFile(file_stream, "r") as z:
+            dimensions = _xlsx_dimensions(z)
+        return {
+            "sheets": len(dimensions),
+            "dimensions": dimensions,
+            "cells": sum(d["rows"] * d["columns"] for d in dimensions.values() if d),
+        }
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        return DocumentConverterResult.from_fragments(
+            self.convert_iter(file_stream, stream_info, **kwargs)
+        )
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Generator[str, None, Optional[str]]:
         # Check the dependencies
+        _xlsx_dependency_exc_info = dependency_exc_info(pd, openpyxl)
         if _xlsx_dependency_exc_info is not None:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
@@ -80,19 +217,9 @@ class XlsxConverter(DocumentConverter):
                 _xlsx_dependency_exc_info[2]
             )
 
-        sheets = pd.read_excel(file_stream, sheet_name=None, engine="openpyxl")
-        md_content = ""
-        for s in sheets:
-            md_content += f"## {s}\n"
-            html_content = sheets[s].to_html(index=False)
-            md_content += (
-                self._html_converter.convert_string(
-                    html_content, **kwargs
-                ).markdown.strip()
-                + "\n\n"
-            )
-
-        return DocumentConverterResult(markdown=md_content.strip())
+        with pd.ExcelFile(file_stream, engine="openpyxl") as workbook:
+            yield from _convert_sheets(workbook, self._html_converter, **kwargs)
+        return None
 
 
 class XlsConverter(DocumentConverter):
@@ -100,6 +227,10 @@ class XlsConverter(DocumentConverter):
     Converts XLS files to Markdown, with each sheet presented as a separate Markdown table.
     """
 
+    accepted_file_extensions = ACCEPTED_XLS_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_XLS_MIME_TYPE_PREFIXES
+    content_failure_types = GUESS_INDEPENDENT_FAILURE_TYPES
+
     def __init__(self):
         super().__init__()
         self._html_converter = HtmlConverter()
@@ -128,7 +259,18 @@ class XlsConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        return DocumentConverterResult.from_fragments(
+            self.convert_iter(file_stream, stream_info, **kwargs)
+        )
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Generator[str, None, Optional[str]]:
         # Load the dependencies
+        _xls_dependency_exc_info = dependency_exc_info(pd, xlrd)
         if _xls_dependency_exc_info is not None:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
@@ -142,16 +284,6 @@ class XlsConverter(DocumentConverter):
                 _xls_dependency_exc_info[2]
             )
 
-        sheets = pd.read_excel(file_stream, sheet_name=None, engine="xlrd")
-        md_content = ""
-        for s in sheets:
-            md_content += f"## {s}\n"
-            html_content = sheets[s].to_html(index=False)
-            md_content += (
-                self._html_converter.convert_string(
-                    html_content, **kwargs
-                ).markdown.strip()
-                + "\n\n"
-            )
-
-        return DocumentConverterResult(markdown=md_content.strip())
+        with pd.ExcelFile(file_stream, engine="xlrd") as workbook:
+            yield from _convert_sheets(workbook, self._html_converter, **kwargs)
+        return None
@@ -2,25 +2,42 @@ import json
 import time
 import re
 import bs4
+import requests
 from typing import Any, BinaryIO, Dict, List, Union
 from urllib.parse import parse_qs, urlparse, unquote
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-
-# Optional YouTube transcription support
-try:
-    # Suppress some warnings on library import
-    import warnings
-
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=SyntaxWarning)
-        # Patch submitted upstream to fix the SyntaxWarning
-        from youtube_transcript_api import YouTubeTranscriptApi
-
-    IS_YOUTUBE_TRANSCRIPT_CAPABLE = True
-except ModuleNotFoundError:
-    IS_YOUTUBE_TRANSCRIPT_CAPABLE = False
+from .._lazy_imports import LazyModule, dependency_exc_info
+from .._cancellation import TRUNCATION_MARKER, deadline_passed, remaining_time
+from .._exceptions import ConversionTimeoutException
+
+# Optional YouTube transcription support, imported lazily on first use.
+# Suppress some warnings on library import (patch submitted upstream to fix the SyntaxWarning)
+youtube_transcript_api = LazyModule(
+    "youtube_transcript_api", ignore_warnings=[SyntaxWarning]
+)
+
+
+class _DeadlineSession(requests.Session):
+    """
+    A session whose requests time out when the deadline of the conversion passes
+    (see remaining_time()), unless they are given a timeout of their own.
+    """
+
+    def __init__(self, kwargs: Dict[str, Any]):
+        super().__init__()
+        self._kwargs = kwargs
+
+    def request(self, *args, **request_kwargs):  # type: ignore[override]
+        remaining = remaining_time(self._kwargs)
+        if remaining is not None and request_kwargs.get("timeout") is None:
+            if remaining <= 0:
+                raise ConversionTimeoutException(
+                    "The deadline of the conversion passed."
+                )
+            request_kwargs["timeout"] = remaining
+        return super().request(*args, **request_kwargs)
 
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
@@ -37,6 +54,9 @@ ACCEPTED_FILE_EXTENSIONS = [
 class YouTubeConverter(DocumentConverter):
     """Handle YouTube specially, focusing on the video title, description, and transcript."""
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -144,15 +164,33 @@ class YouTubeConverter(DocumentConverter):
         if description:
             webpage_text += f"\n### Description\n{description}\n"
 
-        if IS_YOUTUBE_TRANSCRIPT_CAPABLE:
-            ytt_api = YouTubeTranscriptApi()
+        if dependency_exc_info(youtube_transcript_api) is None and deadline_passed(
+            kwargs
+        ):
+            # Out of time to fetch the transcript
+            webpage_text += TRUNCATION_MARKER
+        elif dependency_exc_info(youtube_transcript_api) is None:
+            # (The requests of the first fetch, too, are bounded by the deadline)
+            ytt_api = youtube_transcript_api.YouTubeTranscriptApi(
+                http_client=_DeadlineSession(kwargs)
+            )
             transcript_text = ""
+            truncated = False
+            transcript_list = None
             parsed_url = urlparse(stream_info.url)  # type: ignore
             params = parse_qs(parsed_url.query)  # type: ignore
             if "v" in params and params["v"][0]:
                 video_id = str(params["v"][0])
-                transcript_list = ytt_api.list(video_id)
                 languages = ["en"]
+                try:
+                    transcript_list = ytt_api.list(video_id)
+                except Exception:
+                    if not deadline_passed(kwargs):
+                        raise
+                    # Out of time to list the transcripts
+                    transcript_list = None
+                    truncated = True
+            if transcript_list is not None:
                 for transcript in transcript_list:
                     languages.append(transcript.language_code)
                     break
@@ -167,15 +205,22 @@ class YouTubeConverter(DocumentConverter):
                         ),
                         retries=3,  # Retry 3 times
                         delay=2,  # 2 seconds delay between retries
+                        kwargs=kwargs,
                     )
 
                     if transcript:
                         transcript_text = " ".join(
                             [part.text for part in transcript]
                         )  # type: ignore
+                except ConversionTimeoutException:
+                    # Out of time to retry
+                    truncated = True
                 except Exception as e:
                     # No transcript available
-                    if len(languages) == 1:
+                    if deadline_passed(kwargs):
+                        # Out of time to translate a transcript
+                        truncated = True
+                    elif len(languages) == 1:
                         print(f"Error fetching transcript: {e}")
                     else:
                         # Translate transcript into first kwarg
@@ -187,6 +232,8 @@ class YouTubeConverter(DocumentConverter):
                         transcript_text = " ".join([part.text for part in transcript])
             if transcript_text:
                 webpage_text += f"\n### Transcript\n{transcript_text}\n"
+            elif truncated:
+                webpage_text += TRUNCATION_MARKER
 
         title = title if title else (soup.title.string if soup.title else "")
         assert isinstance(title, str)
@@ -223,15 +270,27 @@ class YouTubeConverter(DocumentConverter):
                     return result
         return None
 
-    def _retry_operation(self, operation, retries=3, delay=2):
-        """Retries the operation if it fails."""
+    def _retry_operation(self, operation, retries=3, delay=2, kwargs=None):
+        """
+        Retries the operation if it fails, unless the deadline of the conversion
+        (see remaining_time()) would pass first.
+        """
         attempt = 0
         while attempt < retries:
             try:
                 return operation()  # Attempt the operation
             except Exception as e:
                 print(f"Attempt {attempt + 1} failed: {e}")
+                if deadline_passed(kwargs or {}):
+                    raise ConversionTimeoutException(
+                        f"Operation failed after {attempt + 1} attempts, with the deadline passed."
+                    ) from e
                 if attempt < retries - 1:
+                    remaining = remaining_time(kwargs or {})
+                    if remaining is not None and remaining <= delay:
+                        raise ConversionTimeoutException(
+                            f"Operation failed after {attempt + 1} attempts, with no time left to retry."
+                        ) from e
                     time.sleep(delay)  # Wait before retrying
                 attempt += 1
         # If all attempts fail, raise the last exception
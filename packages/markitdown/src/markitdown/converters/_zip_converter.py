@@ -2,11 +2,21 @@ import zipfile
 import io
 import os
 
-from typing import BinaryIO, Any, TYPE_CHECKING
+from typing import BinaryIO, Any, Dict, Generator, Iterator, Optional, TYPE_CHECKING
 
-from .._base_converter import DocumentConverter, DocumentConverterResult
+from .._base_converter import (
+    DocumentConverter,
+    DocumentConverterResult,
+    GUESS_INDEPENDENT_FAILURE_TYPES,
+)
 from .._stream_info import StreamInfo
-from .._exceptions import UnsupportedFormatException, FileConversionException
+from .._cancellation import TRUNCATION_MARKER, deadline_passed, raise_if_cancelled
+from .._budget import budget_of
+from .._exceptions import (
+    ConversionTimeoutException,
+    UnsupportedFormatException,
+    FileConversionException,
+)
 
 # Break otherwise circular import for type hinting
 if TYPE_CHECKING:
@@ -58,6 +68,10 @@ class ZipConverter(DocumentConverter):
     - Cleans up temporary files after processing
     """
 
+    accepted_file_extensions = ACCEPTED_FILE_EXTENSIONS
+    accepted_mime_type_prefixes = ACCEPTED_MIME_TYPE_PREFIXES
+    content_failure_types = GUESS_INDEPENDENT_FAILURE_TYPES
+
     def __init__(
         self,
         *,
@@ -84,33 +98,112 @@ class ZipConverter(DocumentConverter):
 
         return False
 
+    def probe(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Dict[str, Any]:
+        # From the central directory: the members are not decompressed
+        with zipfile.ZipFile(file_stream, "r") as zipObj:
+            members = [info for info in zipObj.infolist() if not info.is_dir()]
+            return {
+                "members": len(members),
+                "uncompressed_size": sum(info.file_size for info in members),
+            }
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        return DocumentConverterResult.from_fragments(
+            self.convert_iter(file_stream, stream_info, **kwargs)
+        )
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Generator[str, None, Optional[str]]:
+        yield from _rstrip_fragments(
+            self._iter_members(file_stream, stream_info, kwargs)
+        )
+        return None
+
+    def _iter_members(
+        self, file_stream: BinaryIO, stream_info: StreamInfo, kwargs: Dict[str, Any]
+    ) -> Iterator[str]:
         file_path = stream_info.url or stream_info.local_path or stream_info.filename
-        md_content = f"Content from the zip file `{file_path}`:\n\n"
+        yield f"Content from the zip file `{file_path}`:"
 
         with zipfile.ZipFile(file_stream, "r") as zipObj:
-            for name in zipObj.namelist():
+            # The end of the output so far, which is already marked as truncated
+            # if the conversion of the last member was cut short by the deadline
+            tail = ""
+            # Shared with the conversions of the members
+            budget = budget_of(kwargs)
+            names = zipObj.namelist()
+            for i, name in enumerate(names):
+                if deadline_passed(kwargs):
+                    if not tail.endswith(TRUNCATION_MARKER.strip()):
+                        yield TRUNCATION_MARKER
+                    break
+                if budget.exhausted:
+                    budget.skip("members", len(names) - i)
+                    break
+                raise_if_cancelled(kwargs)
+                z_file_stream = io.BytesIO(zipObj.read(name))
+                z_file_stream_info = StreamInfo(
+                    extension=os.path.splitext(name)[1],
+                    filename=os.path.basename(name),
+                )
+                fragments = self._markitdown.convert_iter(
+                    z_file_stream,
+                    stream_info=z_file_stream_info,
+                    cancel_event=kwargs.get("cancel_event"),
+                    deadline=kwargs.get("deadline"),
+                    budget=budget,
+                    tracer=kwargs.get("tracer"),
+                    trace_parent=kwargs.get("trace_parent"),
+                )
+                # Members that cannot be converted are skipped, which is only known
+                # once the conversion of the member has produced its first fragment
                 try:
-                    z_file_stream = io.BytesIO(zipObj.read(name))
-                    z_file_stream_info = StreamInfo(
-                        extension=os.path.splitext(name)[1],
-                        filename=os.path.basename(name),
-                    )
-                    result = self._markitdown.convert_stream(
-                        stream=z_file_stream,
-                        stream_info=z_file_stream_info,
-                    )
-                    if result is not None:
-                        md_content += f"## File: {name}\n\n"
-                        md_content += result.markdown + "\n\n"
-                except UnsupportedFormatException:
-                    pass
+                    first = next(fragments, "")
+                except (UnsupportedFormatException, FileConversionException):
+                    continue
+                except ConversionTimeoutException:
+                    # The deadline passed before the member could be converted
+                    yield TRUNCATION_MARKER
+                    break
+
+                yield f"\n\n## File: {name}\n\n" + first
+                tail = first[-len(TRUNCATION_MARKER) :]
+                try:
+                    for fragment in fragments:
+                        yield fragment
+                        tail = (tail + fragment)[-len(TRUNCATION_MARKER) :]
                 except FileConversionException:
+                    # The member failed part-way through. Keep what was converted.
                     pass
+                except ConversionTimeoutException:
+                    yield TRUNCATION_MARKER
+                    break
+
 
-        return DocumentConverterResult(markdown=md_content.strip())
+def _rstrip_fragments(fragments: Iterator[str]) -> Iterator[str]:
+    """
+    Yield the fragments, holding back whitespace until it is known not to be trailing,
+    such that the concatenated output has no trailing whitespace.
+    """
+    pending = ""
+    for fragment in fragments:
+        stripped = fragment.rstrip()
+        if stripped:
+            yield pending + stripped
+            pending = fragment[len(stripped) :]
+        else:
+            pending += fragment
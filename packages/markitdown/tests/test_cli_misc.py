@@ -1,6 +1,16 @@
 #!/usr/bin/env python3 -m pytest
+import io
+import os
+import socket
 import subprocess
-from markitdown import __version__
+import sys
+import tempfile
+import time
+
+import pytest
+
+from markitdown import __version__, UnsupportedFormatException
+from markitdown._daemon import DaemonUnavailable, convert_with_daemon
 
 # This file contains CLI tests that are not directly tested by the FileTestVectors.
 # This includes things like help messages, version numbers, and invalid flags.
@@ -27,8 +37,167 @@ def test_invalid_flag() -> None:
     assert "SYNTAX" in result.stderr, "Expected 'SYNTAX' to appear in STDERR"
 
 
+def test_lazy_imports() -> None:
+    # Starting the CLI should not import the heavy optional dependencies of the
+    # converters. They are imported on first use.
+    heavy_modules = [
+        "azure",
+        "bs4",
+        "magika",
+        "mammoth",
+        "olefile",
+        "onnxruntime",
+        "openpyxl",
+        "pandas",
+        "pdfminer",
+        "pptx",
+        "pydub",
+        "requests",
+        "speech_recognition",
+        "xlrd",
+        "youtube_transcript_api",
+    ]
+    script = (
+        "import sys; import markitdown.__main__; "
+        f"print(','.join(m for m in {heavy_modules!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, f"Import exited with error: {result.stderr}"
+    assert (
+        result.stdout.strip() == ""
+    ), f"Heavy modules imported at startup: {result.stdout}"
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+def test_daemon() -> None:
+    test_files = os.path.join(os.path.dirname(__file__), "test_files")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        socket_path = os.path.join(tmpdir, "markitdown.sock")
+        env = {**os.environ, "MARKITDOWN_SOCKET": socket_path}
+
+        def markitdown(*args: str, **kwargs) -> subprocess.CompletedProcess:
+            return subprocess.run(
+                [sys.executable, "-m", "markitdown", *args],
+                capture_output=True,
+                env=env,
+                cwd=test_files,
+                **kwargs,
+            )
+
+        # Without a daemon, conversions are local
+        local = markitdown("test.docx")
+        assert local.returncode == 0, local.stderr
+
+        daemon = subprocess.Popen(
+            [sys.executable, "-m", "markitdown", "--daemon", "--workers", "2"],
+            env=env,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            deadline = time.monotonic() + 60
+            while not os.path.exists(socket_path):
+                assert daemon.poll() is None, daemon.stderr.read()  # type: ignore[union-attr]
+                assert time.monotonic() < deadline, "The daemon did not start"
+                time.sleep(0.1)
+
+            # A relative path, resolved in the working directory of the client
+            result = markitdown("test.docx")
+            assert result.returncode == 0, result.stderr
+            assert result.stdout == local.stdout
+
+            # Standard input, with hints
+            with open(os.path.join(test_files, "test.json"), "rb") as fh:
+                result = markitdown("-x", "json", stdin=fh)
+            assert result.returncode == 0, result.stderr
+            assert b'"key1": "string_value"' in result.stdout
+
+            # URIs are converted as they are, rather than as local paths
+            uri = "data:text/plain;base64,SGVsbG8sIGRhZW1vbiE="
+            result = markitdown(uri)
+            assert result.returncode == 0, result.stderr
+            assert result.stdout == markitdown("--no-daemon", uri).stdout
+            assert b"Hello, daemon!" in result.stdout
+
+            # Failures are reported as by local conversions
+            result = markitdown("does_not_exist.docx")
+            assert result.returncode != 0
+            assert b"does_not_exist.docx" in result.stderr
+
+            # ... and raised as the same exceptions
+            init_kwargs = {"enable_plugins": False}
+            with pytest.raises(FileNotFoundError):
+                convert_with_daemon(
+                    socket_path,
+                    path=os.path.join(test_files, "does_not_exist.docx"),
+                    init_kwargs=init_kwargs,
+                )
+            with pytest.raises(UnsupportedFormatException):
+                convert_with_daemon(
+                    socket_path,
+                    content=b"\x00\xff" * 1024,
+                    stream_info={"extension": ".bin"},
+                    init_kwargs=init_kwargs,
+                )
+
+            # Streams are sent from their position
+            stream = io.BytesIO(b"Skipped. Hello, stream!")
+            stream.seek(9)
+            markdown, _ = convert_with_daemon(
+                socket_path,
+                content=stream,
+                stream_info={"extension": ".txt"},
+                init_kwargs=init_kwargs,
+            )
+            assert markdown == "Hello, stream!"
+
+            # Other options are converted locally
+            result = markitdown("--use-plugins", "test.docx")
+            assert result.returncode == 0, result.stderr
+            assert result.stdout == local.stdout
+
+            # A second daemon on the same socket refuses to start
+            second = markitdown("--daemon", timeout=60)
+            assert second.returncode != 0
+            assert b"already listening" in second.stderr
+        finally:
+            daemon.terminate()
+            daemon.wait(timeout=60)
+        assert not os.path.exists(socket_path)
+
+        # Paths that are not sockets of the user are never connected to
+        with open(socket_path, "w") as fh:
+            fh.write("not a socket")
+        result = markitdown("test.docx")
+        assert result.returncode == 0, result.stderr
+        assert result.stdout == local.stdout
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+def test_daemon_socket_owner() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        socket_path = os.path.join(tmpdir, "markitdown.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(socket_path)
+            server.listen()
+            # A socket of another user is refused before connecting to it
+            real_getuid = os.getuid
+            os.getuid = lambda: real_getuid() + 1  # type: ignore[assignment]
+            try:
+                with pytest.raises(DaemonUnavailable, match="another user"):
+                    convert_with_daemon(socket_path, content=b"hello")
+            finally:
+                os.getuid = real_getuid  # type: ignore[assignment]
+
+
 if __name__ == "__main__":
     """Runs this file's tests from the command line."""
     test_version()
     test_invalid_flag()
+    test_lazy_imports()
+    test_daemon()
+    test_daemon_socket_owner()
     print("All tests passed!")
@@ -1,18 +1,73 @@
 #!/usr/bin/env python3 -m pytest
+import asyncio
+import base64
+import concurrent.futures
+import functools
+import http.server
 import io
+import json
+import multiprocessing
 import os
+import random
 import re
 import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+import weakref
+import zipfile
 import pytest
+import requests
 
 from markitdown._uri_utils import parse_data_uri, file_uri_to_path
 
 from markitdown import (
     MarkItDown,
+    MarkItDownException,
+    DocumentConverter,
     UnsupportedFormatException,
     FileConversionException,
     StreamInfo,
+    DocumentConverterResult,
+    ConversionCancelledException,
+    InputTooLargeException,
+    ConversionTimeoutException,
+    ResourceLimitException,
+    MemoryCache,
+    DiskCache,
+    ConversionStats,
+    MissingDependencyException,
+    NoOpTracer,
+    OpenTelemetryTracer,
+    Tracer,
 )
+from markitdown._buffer import (
+    READ_SIZE,
+    CountingStream,
+    MmapStream,
+    open_local,
+    read_buffer,
+    read_chunks,
+    spool,
+)
+from markitdown._cancellation import (
+    TRUNCATION_MARKER,
+    raise_if_cancelled,
+    remaining_time,
+)
+from markitdown._base_converter import GUESS_INDEPENDENT_FAILURE_TYPES
+from markitdown._budget import budget_of
+from markitdown import _isolation
+from markitdown._probe import estimate_cost
+from markitdown._sniff import SNIFF_PREFIX_SIZE, SNIFF_SUFFIX_SIZE, SniffContext
+from markitdown.converters import (
+    IpynbConverter,
+    OutlookMsgConverter,
+    PlainTextConverter,
+    RssConverter,
+)
+from markitdown._normalize import MarkdownNormalizer, normalize_markdown
 
 # This file contains module tests that are not directly tested by the FileTestVectors.
 # This includes things like helper functions and runtime conversion options
@@ -251,6 +306,1373 @@ def test_file_uris() -> None:
     assert path == "/path/to/file.txt"
 
 
+def test_converter_index() -> None:
+    markitdown = MarkItDown()
+    index = markitdown._converter_index
+
+    # Every converter that accepts a guess must be among the candidates, and the
+    # candidates must be tried in the same order as the full registration list.
+    for filename in os.listdir(TEST_FILES_DIR):
+        with open(os.path.join(TEST_FILES_DIR, filename), "rb") as stream:
+            guesses = markitdown._get_stream_info_guesses(
+                stream,
+                base_guess=StreamInfo(
+                    filename=filename, extension=os.path.splitext(filename)[1]
+                ),
+            )
+            for guess in guesses + [StreamInfo()]:
+                candidates = index.candidates(guess)
+                assert list(candidates) == [
+                    r for r in index.registrations if r in candidates
+                ]
+                for registration in index.registrations:
+                    if registration.converter.accepts(stream, guess):
+                        assert registration in candidates
+
+    # Converters without hints are consulted for every stream
+    candidates = [type(r.converter).__name__ for r in index.candidates(StreamInfo())]
+    assert "PlainTextConverter" in candidates
+    assert "PdfConverter" not in candidates
+
+    # Converters with hints are only consulted for matching streams
+    candidates = [
+        type(r.converter).__name__
+        for r in index.candidates(StreamInfo(mimetype="APPLICATION/PDF"))
+    ]
+    assert "PdfConverter" in candidates
+    assert "DocxConverter" not in candidates
+
+    # Newly registered converters are indexed
+    class _RtfConverter(DocumentConverter):
+        accepted_file_extensions = [".rtf"]
+
+    rtf_converter = _RtfConverter()
+    markitdown.register_converter(rtf_converter)
+    index = markitdown._converter_index
+    assert index.candidates(StreamInfo(extension=".rtf"))[0].converter is rtf_converter
+    assert rtf_converter not in [
+        r.converter for r in index.candidates(StreamInfo(extension=".pdf"))
+    ]
+
+
+def test_magika_lazy_loading() -> None:
+    import markitdown._markitdown as _markitdown
+
+    events = []
+    shared_magika = _markitdown._magika
+    _markitdown._magika = None
+    try:
+        # Constructing a MarkItDown instance does not load the model
+        markitdown = MarkItDown(
+            instrumentation_callback=lambda event, seconds: events.append(event)
+        )
+        assert _markitdown._magika is None
+
+        # A fully described stream does not need the model
+        result = markitdown.convert_stream(
+            io.BytesIO(b"Hello, World!"),
+            stream_info=StreamInfo(
+                mimetype="text/plain", extension=".txt", charset="utf-8"
+            ),
+        )
+        assert result.markdown == "Hello, World!"
+        assert _markitdown._magika is None
+        assert events == []
+
+        # Warming up loads the model once, and it is shared by all instances
+        markitdown.warmup()
+        markitdown.warmup()
+        assert events == ["magika_load"]
+        assert _markitdown._get_magika() is _markitdown._magika
+        assert _markitdown._magika is not None
+
+        # Identification is reported through the callback
+        result = markitdown.convert_stream(
+            io.BytesIO(b"<html><body><h1>Test</h1></body></html>")
+        )
+        assert "# Test" in result.markdown
+        assert events == ["magika_load", "magika_identify"]
+    finally:
+        _markitdown._magika = shared_magika or _markitdown._magika
+
+
+def test_convert_many() -> None:
+    markitdown = MarkItDown()
+    with open(os.path.join(TEST_FILES_DIR, "test.docx"), "rb") as fh:
+        docx_bytes = fh.read()
+
+    sources = [
+        os.path.join(TEST_FILES_DIR, "test.pdf"),
+        docx_bytes,
+        os.path.join(TEST_FILES_DIR, "random.bin"),
+        io.BytesIO(b"<html><body><h1>Test</h1></body></html>"),
+        memoryview(docx_bytes),
+        bytearray(docx_bytes),
+    ]
+
+    for executor in ["process", "thread"]:
+        # Ordered results are yielded in the order of the sources
+        results = list(markitdown.convert_many(sources, workers=2, executor=executor))
+        sources[3].seek(0)
+        assert [r.index for r in results] == [0, 1, 2, 3, 4, 5]
+        assert [r.ok for r in results] == [True, True, False, True, True, True]
+        assert results[4].result.markdown == results[1].result.markdown
+        assert results[5].result.markdown == results[1].result.markdown
+        assert results[1].source is docx_bytes
+        assert (
+            "While there is contemporaneous exploration" in results[0].result.markdown
+        )
+        assert "# Abstract" in results[1].result.markdown
+        assert isinstance(results[2].exception, UnsupportedFormatException)
+        assert "# Test" in results[3].result.markdown
+
+        # Unordered results cover every source exactly once
+        results = list(
+            markitdown.convert_many(
+                sources, workers=2, executor=executor, ordered=False
+            )
+        )
+        sources[3].seek(0)
+        assert sorted(r.index for r in results) == [0, 1, 2, 3, 4, 5]
+
+
+def test_convert_directory() -> None:
+    markitdown = MarkItDown()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = os.path.join(tmpdir, "source")
+        output_dir = os.path.join(tmpdir, "output")
+        os.makedirs(os.path.join(source_dir, "sub"))
+        shutil.copy(os.path.join(TEST_FILES_DIR, "test.docx"), source_dir)
+        shutil.copy(os.path.join(TEST_FILES_DIR, "random.bin"), source_dir)
+        with open(os.path.join(source_dir, "sub", "notes.txt"), "w") as fh:
+            fh.write("Hello, world!")
+
+        # The tree is mirrored, and failures are recorded rather than raised
+        summary = markitdown.convert_directory(source_dir, output_dir, workers=2)
+        assert summary.converted == 2
+        assert summary.unchanged == 0
+        assert list(summary.failed) == ["random.bin"]
+        assert "UnsupportedFormatException" in summary.failed["random.bin"]
+        assert not summary.ok
+        with open(os.path.join(output_dir, "test.docx.md"), "r") as fh:
+            assert "# Abstract" in fh.read()
+        with open(os.path.join(output_dir, "sub", "notes.txt.md"), "r") as fh:
+            assert fh.read() == "Hello, world!"
+        assert not os.path.exists(os.path.join(output_dir, "random.bin.md"))
+
+        # Unchanged files are skipped, including failed ones (unless retried)
+        summary = markitdown.convert_directory(source_dir, output_dir, workers=2)
+        assert (summary.converted, summary.unchanged) == (0, 3)
+        assert list(summary.failed) == ["random.bin"]
+        summary = markitdown.convert_directory(
+            source_dir, output_dir, workers=2, retry_failed=True
+        )
+        assert (summary.converted, summary.unchanged) == (0, 2)
+        assert list(summary.failed) == ["random.bin"]
+
+        # Touched files are hashed, and not converted again if their content is
+        # unchanged; changed files are converted again
+        notes_path = os.path.join(source_dir, "sub", "notes.txt")
+        os.utime(os.path.join(source_dir, "test.docx"), ns=(0, 0))
+        with open(notes_path, "w") as fh:
+            fh.write("Goodbye, world!")
+        os.utime(notes_path, ns=(1, 1))
+        summary = markitdown.convert_directory(source_dir, output_dir, workers=2)
+        assert (summary.converted, summary.unchanged) == (1, 2)
+        with open(os.path.join(output_dir, "sub", "notes.txt.md"), "r") as fh:
+            assert fh.read() == "Goodbye, world!"
+
+        # The outputs of deleted files are removed
+        os.remove(os.path.join(source_dir, "test.docx"))
+        summary = markitdown.convert_directory(source_dir, output_dir, workers=2)
+        assert (summary.converted, summary.unchanged, summary.removed) == (0, 2, 1)
+        assert not os.path.exists(os.path.join(output_dir, "test.docx.md"))
+
+        # Options that are objects are compared by type, from one run to the next
+        for _ in range(2):
+            summary = MarkItDown(requests_session=requests.Session()).convert_directory(
+                source_dir, output_dir, workers=2
+            )
+        assert (summary.converted, summary.unchanged) == (0, 2)
+
+        # Other options invalidate every output
+        summary = markitdown.convert_directory(
+            source_dir, output_dir, workers=2, keep_data_uris=True
+        )
+        assert (summary.converted, summary.unchanged) == (1, 0)
+
+        # Outputs cannot go to the source directory, or be read from it
+        for source, output in [
+            (source_dir, source_dir),
+            (source_dir, os.path.join(source_dir, "markdown")),
+            (source_dir, tmpdir),
+        ]:
+            with pytest.raises(ValueError, match="inside one another"):
+                markitdown.convert_directory(source, output)
+
+
+def test_convert_async() -> None:
+    markitdown = MarkItDown()
+
+    # Serve the test files locally, to exercise non-blocking http: fetches
+    handler = functools.partial(
+        http.server.SimpleHTTPRequestHandler, directory=TEST_FILES_DIR
+    )
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    async def convert_all():
+        return await asyncio.gather(
+            markitdown.convert_async(os.path.join(TEST_FILES_DIR, "test.docx")),
+            markitdown.convert_uri_async(f"{base_url}/test.pdf"),
+            markitdown.convert_stream_async(
+                io.BytesIO(b"<html><body><h1>Test</h1></body></html>")
+            ),
+        )
+
+    try:
+        docx_result, pdf_result, html_result = asyncio.run(convert_all())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "# Abstract" in docx_result.markdown
+    assert "While there is contemporaneous exploration" in pdf_result.markdown
+    assert "# Test" in html_result.markdown
+
+
+def test_convert_async_cancellation() -> None:
+    started = threading.Event()
+    stopped = threading.Event()
+
+    class _SlowConverter(DocumentConverter):
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return True
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            started.set()
+            try:
+                for _ in range(1000):
+                    raise_if_cancelled(kwargs)
+                    time.sleep(0.01)
+            except ConversionCancelledException:
+                stopped.set()
+                raise
+            return DocumentConverterResult(markdown="finished")
+
+    markitdown = MarkItDown(enable_builtins=False)
+    markitdown.register_converter(_SlowConverter())
+
+    async def convert_and_cancel():
+        task = asyncio.create_task(
+            markitdown.convert_stream_async(
+                io.BytesIO(b"slow"), stream_info=StreamInfo(extension=".slow")
+            )
+        )
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(convert_and_cancel())
+
+    # The cancellation propagated to the converter, which stopped early
+    assert stopped.wait(5)
+
+
+def test_conversion_cache() -> None:
+    pdf_path = os.path.join(TEST_FILES_DIR, "test.pdf")
+    cache_dir = tempfile.mkdtemp()
+    try:
+        _test_conversion_cache(pdf_path, cache_dir)
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+def _test_conversion_cache(pdf_path: str, cache_dir: str) -> None:
+    for cache in [MemoryCache(), DiskCache(cache_dir, ttl=3600)]:
+        markitdown = MarkItDown(cache=cache)
+
+        # Count the conversions that actually run
+        conversions = []
+        for registration in markitdown._converters:
+            converter = registration.converter
+            if type(converter).__name__ == "PdfConverter":
+                convert = converter.convert
+                converter.convert = lambda *args, **kwargs: (
+                    conversions.append(1) or convert(*args, **kwargs)
+                )
+
+        first = markitdown.convert(pdf_path)
+        second = markitdown.convert(pdf_path)
+        assert second.markdown == first.markdown
+        assert second.title == first.title
+        assert len(conversions) == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.entries == 1
+
+        # Options that may change the output are part of the key
+        markitdown.convert(pdf_path, keep_data_uris=True)
+        assert len(conversions) == 2
+        assert cache.stats.misses == 2
+
+        # The same content, described the same way, hits however it is read
+        with open(pdf_path, "rb") as fh:
+            markitdown.convert_stream(
+                io.BytesIO(fh.read()),
+                stream_info=StreamInfo(
+                    extension=".pdf", filename="test.pdf", local_path=pdf_path
+                ),
+            )
+        assert len(conversions) == 2
+        assert cache.stats.hits == 2
+
+    # A disk cache is shared by instances, and evicts entries to stay within bounds
+    cache = DiskCache(cache_dir, max_size=cache.stats.size)
+    assert cache.stats.entries == 2
+    markitdown = MarkItDown(cache=cache)
+    markitdown.convert(pdf_path)
+    assert cache.stats.hits == 1
+    markitdown.convert_stream(io.BytesIO(b"Hello, World!"))
+    assert cache.stats.evictions == 1
+    assert cache.stats.size <= cache._max_size
+
+    # Expired entries are misses
+    cache = DiskCache(cache_dir, ttl=0)
+    MarkItDown(cache=cache).convert(pdf_path)
+    assert cache.stats.hits == 0
+    assert cache.stats.evictions == 1
+
+    # Entries that are missing (e.g., evicted by another process) or unreadable
+    # are misses, and no longer count towards the size
+    cache = DiskCache(cache_dir)
+    entries, size = cache.stats.entries, cache.stats.size
+    first, second = list(cache._entries)[:2]
+    removed = cache._entries[first] + cache._entries[second]
+    os.remove(cache._path(first))
+    with open(cache._path(second), "wb") as fh:
+        fh.write(b"not zlib")
+    assert cache.get(first) is None and cache.get(second) is None
+    assert cache.stats.entries == entries - 2
+    assert cache.stats.size == size - removed
+    assert not os.path.exists(cache._path(second))
+
+    # A memory cache is bounded by the size of its entries
+    cache = MemoryCache(max_size=1024)
+    markitdown = MarkItDown(cache=cache)
+    markitdown.convert_stream(io.BytesIO(b"a" * 512))
+    markitdown.convert_stream(io.BytesIO(b"b" * 512))
+    assert cache.stats.evictions == 1
+    assert cache.stats.entries == 1
+
+
+def test_convert_iter() -> None:
+    markitdown = MarkItDown()
+
+    # The streamed fragments add up to the converted markdown
+    for name in [
+        "test.pdf",
+        "test.pptx",
+        "test.xlsx",
+        "test.xls",
+        "test_files.zip",
+        "test_rss.xml",
+        "test.epub",
+        "test.docx",
+    ]:
+        path = os.path.join(TEST_FILES_DIR, name)
+        fragments = list(markitdown.convert_iter(path))
+        assert "".join(fragments) == markitdown.convert(path).markdown, name
+
+        # Converters that stream produce their output in several fragments
+        if name in ("test.pptx", "test_files.zip", "test_rss.xml"):
+            assert len(fragments) > 1, name
+
+    # Streams are accepted too, including ones that are not seekable
+    with open(os.path.join(TEST_FILES_DIR, "test.docx"), "rb") as fh:
+        data = fh.read()
+    fragments = markitdown.convert_iter(
+        io.BufferedReader(io.BytesIO(data)), stream_info=StreamInfo(extension=".docx")
+    )
+    assert "# Abstract" in "".join(fragments)
+
+    with pytest.raises(UnsupportedFormatException):
+        list(markitdown.convert_iter(os.path.join(TEST_FILES_DIR, "random.bin")))
+
+    # A converter that fails before producing any output falls back to the next one
+    class _FailingConverter(DocumentConverter):
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return True
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            raise ValueError("Failed")
+
+    markitdown.register_converter(_FailingConverter())
+    fragments = markitdown.convert_iter(io.BytesIO(b"Hello, World!"))
+    assert "".join(fragments) == "Hello, World!"
+
+
+def test_markdown_normalizer() -> None:
+    text = "# Title  \r\n\n\n\nSome\u200b text\t\n\n\n\ncafe\u0301\ufeff \n\n\n"
+    expected = "# Title\n\nSome text\n\ncaf\u00e9\n\n"
+    options = {"remove_zero_width_chars": True, "unicode_form": "NFC"}
+
+    # Normalizing in one go, or in chunks of any size, gives the same result
+    assert normalize_markdown(text, **options) == expected
+    for chunk_size in [1, 2, 3, 7]:
+        normalizer = MarkdownNormalizer(**options)
+        normalized = "".join(
+            normalizer.feed(text[i : i + chunk_size])
+            for i in range(0, len(text), chunk_size)
+        )
+        assert normalized + normalizer.close() == expected
+
+    # By default, only whitespace is normalized
+    assert normalize_markdown(text) == (
+        "# Title\n\nSome\u200b text\n\ncafe\u0301\ufeff\n\n"
+    )
+    with pytest.raises(ValueError):
+        MarkdownNormalizer(unicode_form="NFX")
+
+    # The options apply to conversions, streamed or not
+    markitdown = MarkItDown()
+    stream_info = StreamInfo(extension=".md", charset="utf-8")
+    result = markitdown.convert_stream(
+        io.BytesIO(text.encode("utf-8")), stream_info=stream_info, **options
+    )
+    assert result.markdown == expected
+    fragments = markitdown.convert_iter(
+        io.BytesIO(text.encode("utf-8")), stream_info=stream_info, **options
+    )
+    assert "".join(fragments) == expected
+
+
+def test_input_buffering() -> None:
+    class _NonSeekableStream(io.RawIOBase):
+        def __init__(self, data: bytes):
+            self._data = io.BytesIO(data)
+
+        def readable(self):
+            return True
+
+        def readinto(self, b):
+            data = self._data.read(len(b))
+            b[: len(data)] = data
+            return len(data)
+
+    with open(os.path.join(TEST_FILES_DIR, "test.docx"), "rb") as fh:
+        docx_bytes = fh.read()
+
+    # Buffers spill to disk beyond the memory threshold
+    spooled = spool(read_chunks(io.BytesIO(docx_bytes), 1024), max_memory=4096)
+    with spooled:
+        assert not isinstance(spooled, io.BytesIO)
+        assert spooled.read() == docx_bytes
+    with spool([b"small"], max_memory=4096) as spooled:
+        assert isinstance(spooled, io.BytesIO)
+
+    # Non-seekable streams and data URIs convert the same, whichever the buffer
+    markitdown = MarkItDown(spool_max_memory=1024)
+    result = markitdown.convert_stream(_NonSeekableStream(docx_bytes))
+    assert "# Abstract" in result.markdown
+    data_uri = "data:;base64," + base64.b64encode(docx_bytes).decode("ascii")
+    assert markitdown.convert(data_uri).markdown == result.markdown
+
+    # Input larger than max_input_size is rejected before it is read in full
+    stream = _NonSeekableStream(b"x" * (4 * READ_SIZE))
+    markitdown = MarkItDown(max_input_size=READ_SIZE)
+    with pytest.raises(InputTooLargeException):
+        markitdown.convert_stream(stream)
+    assert len(stream.read()) == 2 * READ_SIZE
+    with pytest.raises(InputTooLargeException):
+        spool([b""], max_size=10, expected_size=11)
+
+
+def test_local_files_memory_mapped() -> None:
+    csv_path = os.path.join(TEST_FILES_DIR, "test_mskanji.csv")
+    with open(csv_path, "rb") as fh:
+        csv_bytes = fh.read()
+
+    # Local files are memory-mapped, and their content is available without copying
+    with open_local(csv_path) as fh:
+        assert isinstance(fh, MmapStream)
+        assert fh.read(10) == csv_bytes[:10]
+        buffer = read_buffer(fh)
+        assert isinstance(buffer, memoryview)
+        assert buffer == csv_bytes[10:]
+        assert fh.read() == b""
+        fh.seek(0)
+        assert fh.readline() == csv_bytes[: csv_bytes.index(b"\n") + 1]
+    # Closing the stream while a view is still referenced does not fail
+    assert fh.closed
+    del buffer
+
+    # Empty files cannot be mapped, and are opened as regular files
+    temp_dir = tempfile.mkdtemp()
+    try:
+        empty_path = os.path.join(temp_dir, "empty.txt")
+        open(empty_path, "wb").close()
+        with open_local(empty_path) as fh:
+            assert not isinstance(fh, MmapStream)
+            assert read_buffer(fh) == b""
+        assert MarkItDown().convert(empty_path).markdown == ""
+    finally:
+        shutil.rmtree(temp_dir)
+
+    # Memory-mapped files convert as other streams do
+    markitdown = MarkItDown()
+    for name in ["test_mskanji.csv", "test.json", "test_notebook.ipynb", "test.docx"]:
+        path = os.path.join(TEST_FILES_DIR, name)
+        with open(path, "rb") as fh:
+            expected = markitdown.convert_stream(
+                io.BytesIO(fh.read()),
+                stream_info=StreamInfo(extension=os.path.splitext(name)[1]),
+            )
+        assert markitdown.convert(path).markdown == expected.markdown
+
+
+def test_accepts_prefix_budget() -> None:
+    class _HighWaterStream(io.BytesIO):
+        """Records how far into the stream anything was read."""
+
+        high_water = 0
+        bytes_read = 0
+
+        def read(self, size=-1):
+            data = super().read(size)
+            self.high_water = max(self.high_water, self.tell())
+            self.bytes_read += len(data)
+            return data
+
+        def read1(self, size=-1):
+            return self.read(size)
+
+        def readinto(self, b):
+            data = self.read(len(b))
+            b[: len(data)] = data
+            return len(data)
+
+    inputs = {}
+    for name in sorted(os.listdir(TEST_FILES_DIR)):
+        with open(os.path.join(TEST_FILES_DIR, name), "rb") as fh:
+            inputs[name] = fh.read()
+
+    # Large documents that are only told apart by their content
+    with open(os.path.join(TEST_FILES_DIR, "test_notebook.ipynb"), "rb") as fh:
+        notebook = json.load(fh)
+    notebook["cells"] *= 1000
+    inputs["large_notebook.json"] = json.dumps(notebook).encode("utf-8")
+    inputs["large_document.xml"] = (
+        b"<document>" + b"<p>Not a feed</p>" * 100000 + b"</document>"
+    )
+    inputs["large_feed.xml"] = inputs["test_rss.xml"] + b" " * (4 * SNIFF_PREFIX_SIZE)
+
+    markitdown = MarkItDown()
+    for name, data in inputs.items():
+        stream = _HighWaterStream(data)
+        sniff = SniffContext(stream)
+        assert sniff.prefix == data[:SNIFF_PREFIX_SIZE]
+        assert sniff.suffix == data[-SNIFF_SUFFIX_SIZE:]
+        assert sniff.complete == (len(data) <= SNIFF_PREFIX_SIZE)
+        assert stream.tell() == 0
+
+        base_guess = StreamInfo(extension=os.path.splitext(name)[1])
+        guesses = markitdown._get_stream_info_guesses(stream, base_guess, sniff=sniff)
+        guesses += [base_guess, StreamInfo()]
+
+        # Neither Magika, nor the charset detection, nor any accepts() reads beyond
+        # the prefix (the sniff context read everything they need)
+        stream.high_water = 0
+        for registration in markitdown._converters:
+            converter = registration.converter
+            for guess in guesses:
+                converter.accepts(stream, guess, sniff=sniff)
+                assert stream.tell() == 0
+                assert (
+                    stream.high_water <= SNIFF_PREFIX_SIZE
+                ), f"{type(converter).__name__}.accepts() read {name} too far"
+
+        # Documents are still told apart by their content
+        converters = {type(r.converter): r.converter for r in markitdown._converters}
+        if name.endswith(".json"):
+            assert converters[IpynbConverter].accepts(
+                stream, StreamInfo(mimetype="application/json"), sniff=sniff
+            ) == (name == "large_notebook.json")
+        if name.endswith(".xml"):
+            assert converters[RssConverter].accepts(
+                stream, StreamInfo(extension=".xml"), sniff=sniff
+            ) == (name != "large_document.xml")
+        assert converters[OutlookMsgConverter].accepts(
+            stream, StreamInfo(), sniff=sniff
+        ) == (name == "test_outlook_msg.msg")
+
+        # Without the option, converters sniff for themselves, within the same budget
+        for registration in markitdown._converters:
+            for guess in guesses:
+                stream.bytes_read = 0
+                registration.converter.accepts(stream, guess)
+                assert stream.bytes_read <= SNIFF_PREFIX_SIZE + SNIFF_SUFFIX_SIZE
+
+    # What accepts() found is reused by convert()
+    stream = io.BytesIO(inputs["large_feed.xml"])
+    sniff = SniffContext(stream)
+    rss_converter = RssConverter()
+    assert rss_converter.accepts(stream, StreamInfo(extension=".xml"), sniff=sniff)
+    assert sniff.state == {"rss.feed_type": "rss"}
+    assert (
+        rss_converter.convert(stream, StreamInfo(), sniff=sniff).markdown
+        == rss_converter.convert(
+            io.BytesIO(inputs["test_rss.xml"]), StreamInfo()
+        ).markdown
+    )
+
+    # The sniffed documents convert as before
+    result = markitdown.convert_stream(
+        io.BytesIO(inputs["large_notebook.json"]),
+        stream_info=StreamInfo(mimetype="application/json"),
+    )
+    assert "# Test Notebook" in result.markdown
+
+
+def test_conversion_stats() -> None:
+    docx_path = os.path.join(TEST_FILES_DIR, "test.docx")
+
+    # Stats are only collected on request
+    assert MarkItDown().convert(docx_path).stats is None
+
+    collected = []
+    markitdown = MarkItDown(stats_callback=collected.append)
+    result = markitdown.convert(docx_path)
+    stats = result.stats
+    assert isinstance(stats, ConversionStats)
+    assert collected == [stats]
+    assert stats.converter == "DocxConverter"
+    assert stats.stream_info is not None and stats.stream_info.extension == ".docx"
+    assert not stats.cache_hit
+    assert stats.bytes_read >= os.path.getsize(docx_path)
+    for name in ["identify", "accepts", "convert", "normalize"]:
+        assert stats.stages[name].calls >= 1
+        assert 0 <= stats.stages[name].wall_time <= stats.wall_time
+    assert stats.attempts[-1].converter == "DocxConverter"
+    assert stats.attempts[-1].accepted and stats.attempts[-1].succeeded
+    assert stats.peak_memory is None  # tracemalloc is not tracing
+
+    # Per conversion, Magika and charset detection are timed for unlabeled text
+    with open(os.path.join(TEST_FILES_DIR, "test_mskanji.csv"), "rb") as fh:
+        content = fh.read()
+    stats = MarkItDown().convert_stream(io.BytesIO(content), collect_stats=True).stats
+    assert stats is not None
+    assert stats.stages["magika"].calls == 1
+    assert stats.stages["charset"].calls == 1
+
+    # Failed attempts are part of the converter chain
+    class FailingConverter(DocumentConverter):
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return stream_info.extension == ".docx"
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            raise ValueError("Failed")
+
+    markitdown.register_converter(FailingConverter(), priority=-1.0)
+    stats = markitdown.convert(docx_path).stats
+    assert stats is not None
+    assert stats.attempts[0].converter == "FailingConverter"
+    assert stats.attempts[0].accepted and not stats.attempts[0].succeeded
+    assert stats.attempts[0].error == "ValueError: Failed"
+    assert stats.converter == "DocxConverter"
+
+    # Streamed and failed conversions are reported to the callback
+    collected.clear()
+    markdown = "".join(markitdown.convert_iter(docx_path))
+    assert markdown == result.markdown
+    assert collected[0].converter == "DocxConverter"
+    assert collected[0].stages["convert"].calls >= 2
+    with pytest.raises(UnsupportedFormatException):
+        markitdown.convert(os.path.join(TEST_FILES_DIR, "random.bin"))
+    assert collected[1].converter is None
+
+    # Cache hits are flagged
+    markitdown = MarkItDown(cache=MemoryCache(), collect_stats=True)
+    assert not markitdown.convert(docx_path).stats.cache_hit
+    assert markitdown.convert(docx_path).stats.cache_hit
+
+    # Peak memory is recorded while tracemalloc is tracing
+    tracemalloc.start()
+    try:
+        stats = MarkItDown().convert(docx_path, collect_stats=True).stats
+    finally:
+        tracemalloc.stop()
+    assert stats is not None and stats.peak_memory is not None
+    assert stats.peak_memory > 0
+
+    # ... but not for conversions that overlap one in another thread, or that start
+    # within another
+    tracemalloc.start()
+    try:
+        outer = ConversionStats()
+        nested = ConversionStats()
+        nested._finish()
+        outer._finish()
+        first = ConversionStats()
+        second = threading.Thread(target=lambda: ConversionStats()._finish())
+        second.start()
+        second.join()
+        first._finish()
+    finally:
+        tracemalloc.stop()
+    assert outer.peak_memory is not None and nested.peak_memory is None
+    assert first.peak_memory is None
+
+    # Reads through a CountingStream are counted, and converters see the same content
+    stream = CountingStream(io.BytesIO(content))
+    assert stream.read(10) == content[:10]
+    assert read_buffer(stream) == content[10:]
+    assert stream.bytes_read == len(content)
+    markitdown = MarkItDown()
+    for name in ["test.pdf", "test.pptx", "test.xlsx", "test_files.zip", "test.epub"]:
+        path = os.path.join(TEST_FILES_DIR, name)
+        expected = markitdown.convert(path).markdown
+        assert markitdown.convert(path, collect_stats=True).markdown == expected
+
+
+def test_tracing() -> None:
+    class RecordingTracer(Tracer):
+        def __init__(self):
+            self.spans = []
+
+        def start_span(self, name, parent=None, attributes=None):
+            span = {
+                "name": name,
+                "parent": parent,
+                "attributes": attributes or {},
+                "ended": False,
+                "error": None,
+            }
+            self.spans.append(span)
+            return span
+
+        def end_span(self, span, *, error=None, attributes=None):
+            assert not span["ended"]
+            span["ended"] = True
+            span["error"] = error
+
+    # Nested conversions are children of the converter that started them
+    tracer = RecordingTracer()
+    markitdown = MarkItDown(tracer=tracer)
+    markitdown.convert(os.path.join(TEST_FILES_DIR, "test_files.zip"))
+    assert all(span["ended"] and span["error"] is None for span in tracer.spans)
+    root, identify, zip_span = tracer.spans[:3]
+    assert root["name"] == "markitdown.convert" and root["parent"] is None
+    assert root["attributes"]["markitdown.extension"] == ".zip"
+    assert identify["name"] == "markitdown.identify" and identify["parent"] is root
+    assert zip_span["name"] == "markitdown.converter" and zip_span["parent"] is root
+    assert zip_span["attributes"]["markitdown.converter"] == "ZipConverter"
+    members = [span for span in tracer.spans if span["parent"] is zip_span]
+    with zipfile.ZipFile(os.path.join(TEST_FILES_DIR, "test_files.zip")) as z:
+        filenames = [os.path.basename(name) for name in z.namelist()]
+    assert [span["attributes"]["markitdown.filename"] for span in members] == [
+        filename for filename in filenames if filename
+    ]
+    assert {span["name"] for span in members} == {"markitdown.convert"}
+
+    # Failed converters end their span with the error
+    class FailingConverter(DocumentConverter):
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return stream_info.extension == ".docx"
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            raise ValueError("Failed")
+
+    docx_path = os.path.join(TEST_FILES_DIR, "test.docx")
+    markitdown.register_converter(FailingConverter(), priority=-1.0)
+    for convert in [
+        markitdown.convert,
+        lambda path: "".join(markitdown.convert_iter(path)),
+    ]:
+        tracer.spans.clear()
+        convert(docx_path)
+        converters = [s for s in tracer.spans if s["name"] == "markitdown.converter"]
+        assert [s["attributes"]["markitdown.converter"] for s in converters] == [
+            "FailingConverter",
+            "DocxConverter",
+        ]
+        assert isinstance(converters[0]["error"], ValueError)
+        assert converters[1]["error"] is None
+        assert all(span["ended"] for span in tracer.spans)
+
+    # Streamed conversions that are abandoned end their spans, without an error
+    tracer.spans.clear()
+    fragments = markitdown.convert_iter(os.path.join(TEST_FILES_DIR, "test.pptx"))
+    next(fragments)
+    fragments.close()
+    assert tracer.spans and all(span["ended"] for span in tracer.spans)
+    assert all(span["error"] is None for span in tracer.spans)
+
+    # A tracer can be passed per conversion, with a parent span
+    tracer = RecordingTracer()
+    parent = tracer.start_span("request")
+    MarkItDown().convert(docx_path, tracer=tracer, trace_parent=parent)
+    assert tracer.spans[1]["name"] == "markitdown.convert"
+    assert tracer.spans[1]["parent"] is parent
+
+    # Tracing is skipped altogether with the NoOpTracer
+    assert MarkItDown(tracer=NoOpTracer())._tracer is None
+
+    # OpenTelemetry is an optional dependency
+    try:
+        import opentelemetry.trace  # noqa: F401
+    except ImportError:
+        with pytest.raises(MissingDependencyException):
+            OpenTelemetryTracer()
+    else:
+        markitdown = MarkItDown(tracer=OpenTelemetryTracer())
+        assert "# Abstract" in markitdown.convert(docx_path).markdown
+
+
+def test_thread_safety() -> None:
+    # A feed whose conversion depends on its options
+    image = '&lt;img src="data:image/png;base64,iVBORw0KGgo=" alt="dot"&gt;'
+    items = "".join(
+        f"<item><title>Item {i}</title><description>{image} {i}</description></item>"
+        for i in range(200)
+    )
+    feed = (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>'
+        "<description>A feed</description>"
+        f"{items}</channel></rss>"
+    ).encode("utf-8")
+
+    inputs = []
+    for name in [
+        "test.docx",
+        "test.pptx",
+        "test.xlsx",
+        "test.pdf",
+        "test.epub",
+        "test.json",
+        "test_blog.html",
+        "test_mskanji.csv",
+        "test_notebook.ipynb",
+        "test_outlook_msg.msg",
+        "test_rss.xml",
+        "test_serp.html",
+        "test_wikipedia.html",
+    ]:
+        with open(os.path.join(TEST_FILES_DIR, name), "rb") as fh:
+            inputs.append((name, fh.read(), {}))
+    inputs.append(("feed.rss", feed, {"keep_data_uris": True}))
+    inputs.append(("feed.rss", feed, {"keep_data_uris": False}))
+
+    markitdown = MarkItDown()
+
+    def convert(name, data, options):
+        return markitdown.convert_stream(
+            io.BytesIO(data),
+            stream_info=StreamInfo(extension=os.path.splitext(name)[1]),
+            **options,
+        ).markdown
+
+    expected = [convert(*args) for args in inputs]
+    assert "(data:image/png;base64,iVBORw0KGgo=)" in expected[-2]
+    assert "(data:image/png;base64...)" in expected[-1]
+
+    # Converters are registered while other threads convert
+    class _NeverConverter(DocumentConverter):
+        accepted_file_extensions = [".never"]
+
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return False
+
+    def register():
+        for _ in range(50):
+            markitdown.register_converter(_NeverConverter(), priority=20.0)
+
+    tasks = list(range(len(inputs))) * 6
+    random.Random(0).shuffle(tasks)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as pool:
+        registering = pool.submit(register)
+        results = list(pool.map(lambda i: (i, convert(*inputs[i])), tasks))
+        registering.result()
+
+    for i, markdown in results:
+        assert markdown == expected[i], f"{inputs[i][0]} converted differently"
+    assert len(markitdown._converter_index.registrations) == len(markitdown._converters)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods()
+    or not os.path.exists("/proc/self"),
+    reason="Workers inherit the test's converter only when forked; memory is read from /proc",
+)
+def test_process_isolation() -> None:
+    # Workers started while this is patched in hang on "sleep" (replacements do not).
+    # They are forked, to inherit the patch.
+    original_convert = PlainTextConverter.convert
+
+    def convert(self, file_stream, stream_info, **kwargs):
+        prefix = file_stream.read(5)
+        if prefix == b"sleep":
+            time.sleep(60)
+        elif prefix == b"until":
+            # (Stops at the deadline, but only notices it a little late)
+            time.sleep(remaining_time(kwargs) + 0.5)
+            return DocumentConverterResult(markdown="Partial" + TRUNCATION_MARKER)
+        file_stream.seek(0)
+        return original_convert(self, file_stream, stream_info, **kwargs)
+
+    def isolated(**kwargs):
+        start_method = _isolation.START_METHOD
+        PlainTextConverter.convert = convert  # type: ignore[method-assign]
+        _isolation.START_METHOD = "fork"
+        try:
+            return MarkItDown(isolation="process", isolation_workers=1, **kwargs)
+        finally:
+            PlainTextConverter.convert = original_convert  # type: ignore[method-assign]
+            _isolation.START_METHOD = start_method
+
+    def convert_text(markitdown, text, **kwargs):
+        return markitdown.convert_stream(
+            io.BytesIO(text.encode("utf-8")),
+            stream_info=StreamInfo(extension=".txt"),
+            **kwargs,
+        ).markdown
+
+    def worker_pids(markitdown):
+        return [worker.process.pid for worker in markitdown._isolated_pool._all]
+
+    markitdown = isolated(conversion_timeout=2, max_conversions_per_worker=2)
+    try:
+        assert convert_text(markitdown, "Hello") == "Hello"
+        hung = worker_pids(markitdown)
+
+        # A hung conversion times out, and its worker is replaced
+        start = time.monotonic()
+        with pytest.raises(ConversionTimeoutException):
+            convert_text(markitdown, "sleep")
+        assert time.monotonic() - start < 30
+        assert worker_pids(markitdown) != hung
+
+        # Files are read by the workers, and converted like in this process
+        path = os.path.join(TEST_FILES_DIR, "test.docx")
+        assert markitdown.convert(path).markdown == MarkItDown().convert(path).markdown
+
+        # The worker is recycled after max_conversions_per_worker conversions
+        recycled = worker_pids(markitdown)
+        assert "".join(markitdown.convert_iter(io.BytesIO(b"World"))) == "World"
+        assert worker_pids(markitdown) != recycled
+
+        # Errors in workers are raised here
+        with pytest.raises(UnsupportedFormatException):
+            markitdown.convert_stream(
+                io.BytesIO(b"\x00\xff" * 1024),
+                stream_info=StreamInfo(extension=".bin"),
+            )
+    finally:
+        markitdown.close()
+    with pytest.raises(MarkItDownException):
+        convert_text(markitdown, "Hello")
+
+    # A worker over its memory limit is killed
+    markitdown = isolated(max_worker_memory=1)
+    try:
+        with pytest.raises(ResourceLimitException):
+            convert_text(markitdown, "sleep")
+    finally:
+        markitdown.close()
+
+    # A conversion with a deadline is left to return its partial output, even past
+    # the timeout, but is killed once it is late by the grace period
+    markitdown = isolated(conversion_timeout=1)
+    try:
+        deadline = time.monotonic() + 0.8
+        assert convert_text(markitdown, "until", deadline=deadline) == (
+            "Partial" + TRUNCATION_MARKER
+        )
+        start = time.monotonic()
+        with pytest.raises(ConversionTimeoutException, match="deadline"):
+            convert_text(markitdown, "sleep", deadline=start + 0.5)
+        assert time.monotonic() - start < 30
+    finally:
+        markitdown.close()
+
+
+def test_process_isolation_threads() -> None:
+    # Workers are replaced by the threads that convert, while others are converting
+    markitdown = MarkItDown(
+        isolation="process", isolation_workers=2, max_conversions_per_worker=1
+    )
+    try:
+        pool = markitdown._isolated_pool
+        assert pool._context.get_start_method() == _isolation.START_METHOD != "fork"
+
+        def convert_text(text):
+            return markitdown.convert_stream(
+                io.BytesIO(text.encode("utf-8")),
+                stream_info=StreamInfo(extension=".txt"),
+            ).markdown
+
+        texts = [f"Text {i}" for i in range(6)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            assert list(executor.map(convert_text, texts)) == texts
+    finally:
+        markitdown.close()
+
+    # The cache is shared by the workers (it is used by this process)
+    cache = MemoryCache()
+    markitdown = MarkItDown(
+        isolation="process",
+        isolation_workers=1,
+        max_conversions_per_worker=1,
+        cache=cache,
+        collect_stats=True,
+    )
+    try:
+        path = os.path.join(TEST_FILES_DIR, "test.docx")
+        first = markitdown.convert(path)
+        second = markitdown.convert(path)
+        assert second.markdown == first.markdown
+        assert second.stats is not None and second.stats.cache_hit
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.entries) == (1, 1, 1)
+    finally:
+        markitdown.close()
+
+    # The arguments are sent to the workers
+    with pytest.raises(ValueError, match="picklable"):
+        MarkItDown(isolation="process", llm_client=lambda: None)
+
+
+def test_deadline() -> None:
+    markitdown = MarkItDown()
+    marker = TRUNCATION_MARKER.strip()
+
+    # A conversion past its deadline does not start
+    with pytest.raises(ConversionTimeoutException):
+        markitdown.convert(
+            os.path.join(TEST_FILES_DIR, "test.pptx"), deadline=time.monotonic()
+        )
+
+    # Loops (over slides, and over archive members, whose conversions share the
+    # deadline) stop when it passes, and return what they converted, marked as such
+    for name in ["test.pptx", "test_files.zip"]:
+        path = os.path.join(TEST_FILES_DIR, name)
+        complete = markitdown.convert(path).markdown
+        assert marker not in complete
+
+        deadline = time.monotonic() + 2
+        fragments = markitdown.convert_iter(path, deadline=deadline)
+        first = next(fragments)
+        time.sleep(max(deadline - time.monotonic(), 0) + 0.01)
+        truncated = first + "".join(fragments)
+        assert truncated.endswith(marker), name
+        assert truncated.count(marker) == 1, name
+        assert len(truncated) < len(complete), name
+
+    # A client that times out at the deadline does not fail the conversion
+    class _Completions:
+        def create(self, model, messages, timeout=None):
+            if model != "gpt-4o":
+                raise ValueError(f"Unknown model: {model}")
+            time.sleep(timeout + 0.01)
+            raise TimeoutError("Request timed out.")
+
+    class _Client:
+        chat = type("Chat", (), {"completions": _Completions()})()
+
+    path = os.path.join(TEST_FILES_DIR, "test_llm.jpg")
+    markitdown = MarkItDown(llm_client=_Client(), llm_model="gpt-4o")
+    result = markitdown.convert(path, deadline=time.monotonic() + 0.5)
+    assert result.markdown.endswith(marker)
+    # (Before the deadline, the error is the conversion's)
+    with pytest.raises(FileConversionException):
+        markitdown.convert(path, deadline=time.monotonic() + 60, llm_model="x")
+
+    # Results cut short by the deadline are not cached
+    class _SlowConverter(DocumentConverter):
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return stream_info.extension == ".slow"
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            time.sleep(max(remaining_time(kwargs) or 0, 0) + 0.01)
+            return DocumentConverterResult(markdown="Partial" + TRUNCATION_MARKER)
+
+    cache = MemoryCache()
+    markitdown = MarkItDown(enable_builtins=False, cache=cache)
+    markitdown.register_converter(_SlowConverter())
+    result = markitdown.convert_stream(
+        io.BytesIO(b"slow"),
+        stream_info=StreamInfo(extension=".slow"),
+        deadline=time.monotonic() + 0.5,
+    )
+    assert result.markdown == "Partial" + TRUNCATION_MARKER
+    assert cache.stats.entries == 0
+
+
+def test_output_budget() -> None:
+    markitdown = MarkItDown()
+
+    def convert(name, **kwargs):
+        path = os.path.join(TEST_FILES_DIR, name)
+        result = markitdown.convert(path, **kwargs)
+        assert "".join(markitdown.convert_iter(path, **kwargs)) == result.markdown
+        return result
+
+    result = convert("test.pptx", max_slides=2)
+    assert "<!-- Slide number: 2 -->" in result.markdown
+    assert "<!-- Slide number: 3 -->" not in result.markdown
+    assert result.skipped == {"slides": 4}
+
+    result = convert("test.xlsx", max_sheets=1, max_rows_per_table=3)
+    assert "## Sheet1" in result.markdown and "## 09060124" not in result.markdown
+    assert len(result.markdown.splitlines()) == 1 + 2 + 3  # Title, header, rows
+    assert result.skipped == {"sheets": 1, "rows": 20}
+
+    result = convert("test_mskanji.csv", max_rows_per_table=1)
+    assert len(result.markdown.splitlines()) == 3
+    assert result.skipped == {"rows": 2}
+
+    result = convert("test.pdf", max_pages=0)
+    assert result.markdown == "" and result.skipped == {"pages": 1}
+
+    # Archive members share the budget
+    complete = convert("test_files.zip").markdown
+    result = convert("test_files.zip", max_output_chars=2000)
+    assert len(result.markdown) <= 2000
+    assert complete.startswith(result.markdown.rstrip())
+    assert result.skipped["members"] > 0
+
+    # Without any limits, nothing is skipped
+    assert convert("test.pptx").skipped == {}
+
+    # Converters stop converting once max_output_chars is reached
+    produced = []
+
+    class _PagedConverter(DocumentConverter):
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return stream_info.extension == ".paged"
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            return DocumentConverterResult.from_fragments(
+                self.convert_iter(file_stream, stream_info, **kwargs)
+            )
+
+        def convert_iter(self, file_stream, stream_info, **kwargs):
+            budget = budget_of(kwargs)
+            for i in range(100):
+                if not budget.allows("pages", i):
+                    budget.skip("pages", 100 - i)
+                    break
+                produced.append(i)
+                yield "x" * 100
+            return "Title"
+
+    paged = MarkItDown(enable_builtins=False)
+    paged.register_converter(_PagedConverter())
+    result = paged.convert_stream(
+        io.BytesIO(b"pages"),
+        stream_info=StreamInfo(extension=".paged"),
+        max_output_chars=250,
+    )
+    assert result.markdown == "x" * 250
+    assert result.title == "Title"
+    assert produced == [0, 1, 2]
+    assert result.skipped == {"characters": 50, "pages": 97}
+
+    with pytest.raises(ValueError):
+        markitdown.convert(os.path.join(TEST_FILES_DIR, "test.pdf"), max_pages=-1)
+
+    # Cached results report what was skipped, as the conversions did
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for cache in [MemoryCache(), DiskCache(tmpdir)]:
+            cached = MarkItDown(cache=cache)
+            path = os.path.join(TEST_FILES_DIR, "test.pptx")
+            first = cached.convert(path, max_slides=2)
+            second = cached.convert(path, max_slides=2)
+            assert cache.stats.hits == 1
+            assert second.markdown == first.markdown
+            assert second.skipped == first.skipped == {"slides": 4}
+
+        # Conversions that share a limited budget (e.g., of the members of an
+        # archive) neither use nor fill the cache
+        cache = MemoryCache()
+        cached = MarkItDown(cache=cache)
+        cached.convert(os.path.join(TEST_FILES_DIR, "test_files.zip"), max_slides=1)
+        assert cache.stats.entries == 1
+
+
+def test_probe() -> None:
+    markitdown = MarkItDown()
+
+    def probe(name):
+        return markitdown.probe(os.path.join(TEST_FILES_DIR, name))
+
+    result = probe("test.pdf")
+    assert result.converter == "PdfConverter"
+    assert result.stream_info is not None and result.stream_info.extension == ".pdf"
+    assert result.stream_info_guesses[0].mimetype == "application/pdf"
+    assert result.structure == {"pages": 1}
+    assert result.cost == "low"
+
+    assert probe("test.pptx").structure == {"slides": 6}
+    assert probe("test.epub").structure == {"spine": 3}
+    assert probe("test_files.zip").structure == {
+        "members": 7,
+        "uncompressed_size": 1481847,
+    }
+    structure = probe("test.xlsx").structure
+    assert structure["sheets"] == 2
+    assert structure["dimensions"]["Sheet1"] == {"rows": 24, "columns": 4}
+    assert structure["cells"] == 116
+
+    # Converters without a probe report no structure; nothing accepts random bytes
+    assert probe("test.docx").structure == {}
+    result = probe("random.bin")
+    assert result.converter is None and result.stream_info is None
+    assert result.size == os.path.getsize(os.path.join(TEST_FILES_DIR, "random.bin"))
+
+    # Streams are left where they were, and nothing is converted
+    class _Unconvertible(DocumentConverter):
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return stream_info.extension == ".xyz"
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            raise AssertionError("probe() must not convert")
+
+        def probe(self, file_stream, stream_info, **kwargs):
+            file_stream.read()
+            return {"remote": True}
+
+    markitdown.register_converter(_Unconvertible())
+    stream = io.BytesIO(b"prefix: data")
+    stream.seek(8)
+    result = markitdown.probe(stream, stream_info=StreamInfo(extension=".xyz"))
+    assert stream.tell() == 8
+    assert result.converter == "_Unconvertible"
+    assert result.size == 4
+    assert result.cost == "high"
+
+    # The cost class is the highest reached by any count, or else by the size
+    assert estimate_cost(100, {}) == "low"
+    assert estimate_cost(100 * 2**20, {}) == "high"
+    assert estimate_cost(100 * 2**20, {"pages": 2}) == "low"
+    assert estimate_cost(0, {"pages": 2, "members": 60}) == "medium"
+    assert estimate_cost(0, {"slides": 1000}) == "high"
+
+
+def _multi_page_pdf(pages: int) -> bytes:
+    """A PDF of the given number of pages, each with a line of text naming it."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(pages)), pages),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i in range(pages):
+        content = b"BT /F1 12 Tf 72 720 Td (This is page %d) Tj ET" % (i + 1)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content)
+        )
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return pdf
+
+
+def test_pdf_page_parallel() -> None:
+    markitdown = MarkItDown()
+    pdf = _multi_page_pdf(25)
+    stream_info = StreamInfo(extension=".pdf")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pages.pdf")
+        with open(path, "wb") as fh:
+            fh.write(pdf)
+
+        serial = markitdown.convert(path).markdown
+        assert serial.count("This is page") == 25
+        assert serial.index("This is page 9\n") < serial.index("This is page 10\n")
+
+        # Local files are read by the workers, other streams are sent to them
+        parallel = markitdown.convert(path, pdf_workers=3, pdf_pages_per_chunk=4)
+        assert parallel.markdown == serial
+        fragments = list(
+            markitdown.convert_iter(
+                io.BytesIO(pdf),
+                stream_info=stream_info,
+                pdf_workers=2,
+                pdf_pages_per_chunk=7,
+            )
+        )
+        assert "".join(fragments) == serial
+        # Page boundaries are preserved (as form feeds)
+        assert serial.count("\f") == 24
+
+        # The options can be set on the instance
+        result = MarkItDown(pdf_workers=2, pdf_pages_per_chunk=5).convert(path)
+        assert result.markdown == serial
+
+        # Only the pages within max_pages are extracted
+        result = markitdown.convert(
+            path, pdf_workers=2, pdf_pages_per_chunk=4, max_pages=10
+        )
+        assert result.markdown == markitdown.convert(path, max_pages=10).markdown
+        assert "This is page 10" in result.markdown
+        assert "This is page 11" not in result.markdown
+        assert result.skipped == {"pages": 15}
+
+        # The deadline and cancellation are checked while waiting for the workers
+        result = markitdown.convert_stream(
+            io.BytesIO(_multi_page_pdf(500)),
+            stream_info=stream_info,
+            pdf_workers=2,
+            pdf_pages_per_chunk=4,
+            deadline=time.monotonic() + 0.2,
+        )
+        assert result.markdown.endswith(TRUNCATION_MARKER)
+        assert "This is page 500" not in result.markdown
+        cancel_event = threading.Event()
+        cancel_event.set()
+        with pytest.raises(ConversionCancelledException):
+            markitdown.convert(
+                path, pdf_workers=2, pdf_pages_per_chunk=4, cancel_event=cancel_event
+            )
+
+        with pytest.raises(FileConversionException, match="pdf_workers"):
+            markitdown.convert(path, pdf_workers=0)
+
+    # A catalog that claims another number of pages than the page tree has is not
+    # trusted: the pages are extracted serially
+    serial = markitdown.convert_stream(
+        io.BytesIO(_multi_page_pdf(30)), stream_info=stream_info
+    ).markdown
+    for claimed in (b"20", b"50"):
+        pdf = _multi_page_pdf(30).replace(b"/Count 30", b"/Count " + claimed)
+        result = markitdown.convert_stream(
+            io.BytesIO(pdf),
+            stream_info=stream_info,
+            pdf_workers=2,
+            pdf_pages_per_chunk=4,
+        )
+        assert result.markdown == serial
+        assert TRUNCATION_MARKER not in result.markdown
+
+
 def test_docx_comments() -> None:
     # Test DOCX processing, with comments and setting style_map on init
     markitdown_with_style_map = MarkItDown(style_map="comment-reference => ")
@@ -340,6 +1762,92 @@ def test_exceptions() -> None:
     assert type(exc_info.value.attempts[0].converter).__name__ == "PptxConverter"
 
 
+def test_failed_attempts_not_retried() -> None:
+    class _Payload:
+        pass
+
+    class _FailingConverter(DocumentConverter):
+        def __init__(self, content_failure_types=(), error=ValueError):
+            self.content_failure_types = content_failure_types
+            self.error = error
+            self.guesses = []
+
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return True
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            self.guesses.append(stream_info)
+            payload = _Payload()  # Stands in for a large buffer
+            payloads.append(weakref.ref(payload))
+            raise self.error("Corrupt")
+
+    with open(os.path.join(TEST_FILES_DIR, "test.json"), "rb") as fh:
+        data = fh.read()
+    payloads: list = []
+
+    # The guesses (from the hint, and from Magika) disagree, so there are three of
+    # them, counting the final StreamInfo()
+    markitdown = MarkItDown(enable_builtins=False)
+    converter = _FailingConverter()
+    markitdown.register_converter(converter)
+    with pytest.raises(FileConversionException) as exc_info:
+        markitdown.convert_stream(
+            io.BytesIO(data), stream_info=StreamInfo(extension=".foo")
+        )
+    assert len(converter.guesses) == len(set(converter.guesses)) == 3
+    assert len(exc_info.value.attempts) == 3
+
+    # Content failures are not retried under another guess, and the other
+    # converters still get their turn
+    markitdown = MarkItDown()
+    converter = _FailingConverter(content_failure_types=(ValueError,))
+    markitdown.register_converter(converter, priority=-1.0)
+    result = markitdown.convert_stream(
+        io.BytesIO(data), stream_info=StreamInfo(extension=".foo")
+    )
+    assert "5b64c88c-b3c3-4510-bcb8-da0b200602d8" in result.markdown
+    assert len(converter.guesses) == 1
+    fragments = markitdown.convert_iter(
+        io.BytesIO(data), stream_info=StreamInfo(extension=".foo")
+    )
+    assert "".join(fragments) == result.markdown
+    assert len(converter.guesses) == 2
+
+    # I/O errors (like missing dependencies, cancellation and timeouts) are never
+    # the content's
+    markitdown = MarkItDown(enable_builtins=False)
+    converter = _FailingConverter(
+        content_failure_types=GUESS_INDEPENDENT_FAILURE_TYPES, error=OSError
+    )
+    markitdown.register_converter(converter)
+    with pytest.raises(FileConversionException):
+        markitdown.convert_stream(
+            io.BytesIO(data), stream_info=StreamInfo(extension=".foo")
+        )
+    assert len(converter.guesses) == 3
+
+    # Failed attempts keep their tracebacks, but not the locals of their frames
+    markitdown = MarkItDown(enable_builtins=False)
+    markitdown.register_converter(_FailingConverter())
+    with pytest.raises(FileConversionException) as exc_info:
+        markitdown.convert_stream(io.BytesIO(data))
+    assert exc_info.value.attempts[0].exc_info[2] is not None
+    assert all(payload() is None for payload in payloads)
+
+    # Built-in converters that fail on corrupt content are tried once
+    markitdown = MarkItDown()
+    with pytest.raises(FileConversionException) as exc_info:
+        markitdown._convert(
+            file_stream=io.BytesIO(b"%PDF-1.7\n" + bytes(range(256)) * 64),
+            stream_info_guesses=[
+                StreamInfo(extension=".pdf"),
+                StreamInfo(mimetype="application/pdf"),
+            ],
+        )
+    converters = [type(a.converter).__name__ for a in exc_info.value.attempts]
+    assert converters.count("PdfConverter") == 1
+
+
 @pytest.mark.skipif(
     skip_exiftool,
     reason="do not run if exiftool is not installed",
@@ -402,11 +1910,33 @@ if __name__ == "__main__":
         test_stream_info_operations,
         test_data_uris,
         test_file_uris,
+        test_converter_index,
+        test_magika_lazy_loading,
+        test_convert_many,
+        test_convert_directory,
+        test_convert_async,
+        test_convert_async_cancellation,
+        test_conversion_cache,
+        test_convert_iter,
+        test_markdown_normalizer,
+        test_input_buffering,
+        test_local_files_memory_mapped,
+        test_accepts_prefix_budget,
+        test_conversion_stats,
+        test_tracing,
+        test_thread_safety,
+        test_process_isolation,
+        test_process_isolation_threads,
+        test_deadline,
+        test_output_budget,
+        test_probe,
+        test_pdf_page_parallel,
         test_docx_comments,
         test_input_as_strings,
         test_markitdown_remote,
         test_speech_transcription,
         test_exceptions,
+        test_failed_attempts_not_retried,
         test_markitdown_exiftool,
         test_markitdown_llm,
     ]: